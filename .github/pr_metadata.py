@@ -4,111 +4,256 @@ Auto-generate GitHub PR metadata for RagaliQ project.
 Infers labels, milestone, and other fields from branch name and commits.
 """
 
+import contextlib
+import functools
+import itertools
+import json
 import re
 import subprocess
 import sys
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
 from typing import Any
 
+# Branch, log and diff are fetched in one shell round-trip instead of three
+# separate git spawns. Log and diff entries are NUL-terminated (-z) so commit
+# subjects and file paths are taken verbatim (no quoting, no newline
+# heuristics); an ASCII record separator (0x1e) delimits the three sections.
+GIT_SNAPSHOT_SECTION = "\x1e"
+GIT_SNAPSHOT_SCRIPT = (
+    "git branch --show-current; printf '\\036'; "
+    "git --no-pager log -z --format=%s main..HEAD; printf '\\036'; "
+    "git --no-pager -c core.quotepath=false diff -z --name-only main...HEAD"
+)
+
+# Everything the snapshot depends on: git dir, HEAD sha, branch and main sha.
+# One cheap rev-parse round-trip decides whether the cached metadata is stale.
+CACHE_KEY_SCRIPT = "git rev-parse --git-dir HEAD --abbrev-ref HEAD; git rev-parse -q --verify main"
+CACHE_FILENAME = "pr_metadata_cache.json"
+
+
+@functools.cache
+def run_git_command(cmd: tuple[str, ...]) -> str:
+    """Run a git command and return output.
+
+    Results are memoized per argument tuple: git state does not change while
+    the script runs, so repeated queries never spawn a second process. Output
+    is read as bytes and decoded once, and stderr is discarded rather than
+    piped, since only stdout is ever used.
+    """
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    return result.stdout.decode("utf-8", "replace").strip()
+
 
-def run_git_command(cmd: list[str]) -> str:
-    """Run a git command and return output."""
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.stdout.strip()
+@functools.lru_cache(maxsize=1)
+def get_git_snapshot() -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+    """Get branch, commit subjects and changed files from a single git invocation."""
+    output = run_git_command(("sh", "-c", GIT_SNAPSHOT_SCRIPT))
+    branch, commits, files = (output.split(GIT_SNAPSHOT_SECTION) + ["", "", ""])[:3]
+    return (
+        branch.strip(),
+        tuple(entry for entry in commits.split("\0") if entry),
+        tuple(entry for entry in files.split("\0") if entry),
+    )
 
 
 def get_current_branch() -> str:
     """Get the current git branch name."""
-    return run_git_command(["git", "branch", "--show-current"])
+    return get_git_snapshot()[0]
 
 
 def get_commits_since_main() -> list[str]:
-    """Get commit messages since branching from main."""
-    commits = run_git_command(["git", "log", "main..HEAD", "--oneline"])
-    return commits.split("\n") if commits else []
+    """Get commit subjects since branching from main."""
+    return list(get_git_snapshot()[1])
 
 
 def get_changed_files() -> list[str]:
     """Get list of changed files since main."""
-    files = run_git_command(["git", "diff", "main...HEAD", "--name-only"])
-    return files.split("\n") if files else []
-
-
-def infer_labels(branch: str, commits: list[str], files: list[str]) -> list[str]:
+    return list(get_git_snapshot()[2])
+
+
+# Label inference rules. Keyword tuples are immutable, so the scanners and
+# keyword -> labels indexes built from them at import can never go stale.
+TYPE_RULES = {
+    "feat": ("feat", "feature", "add", "new", "implement"),
+    "bug": ("bug", "fix", "error", "issue", "broken"),
+    "refactor": ("refactor", "restructure", "reorganize", "streamline", "improve"),
+    "chore": ("chore", "tooling", "upgrade", "dependencies", "setup", "config"),
+    "docs": ("docs", "readme", "documentation", "comment", "docstring"),
+    "research": ("research", "explore", "experiment", "investigate", "study"),
+}
+
+SCOPE_RULES = {
+    "judge": ("judge", "llm", "claude", "openai", "gpt", "anthropic"),
+    "evaluator": ("evaluator", "metric", "faithfulness", "relevance", "hallucination"),
+    "core": ("core", "base", "runner", "testcase", "pipeline", "abstract"),
+    "cli": ("cli", "command", "typer", "click", "argparse"),
+    "dataset": ("dataset", "data", "synthetic", "generation", "test-set"),
+    "report": ("report", "output", "format", "html", "json", "terminal"),
+    "pytest": ("pytest", "plugin", "fixture", "conftest"),
+    "async": ("async", "await", "asyncio", "concurrent"),
+    "infra": ("infra", "ci", "cd", "docker", "pypi", "github-actions"),
+    "testing": ("testing", "test", "unittest", "coverage"),
+}
+
+
+def build_keyword_scanner(
+    rules: Mapping[str, Mapping[str, Sequence[str]]],
+) -> tuple[re.Pattern[str], dict[str, tuple[tuple[str, str], ...]]]:
     """
-    Infer 2-3 labels from branch name, commits, and changed files.
-
-    Type labels (pick 1): feat, bug, refactor, chore, docs, research
-    Scope labels (pick 0-2): judge, evaluator, core, cli, dataset, report, pytest, async, infra, testing
+    Compile category -> label -> keywords rules into a single-pass scanner.
+
+    The pattern is a zero-width lookahead over every keyword (longest first),
+    so the regex engine visits each text position once in C instead of one
+    Python-level substring search per keyword. Only one alternative can match
+    at a given position, so each keyword also maps to the labels of every
+    shorter keyword it contains -- this keeps plain ``keyword in text``
+    semantics (e.g. "pytest" still implies "test"). Labels are listed in rule
+    order so results are deterministic.
     """
-    # Combine all text for analysis
-    text = f"{branch} {' '.join(commits)} {' '.join(files)}".lower()
-
-    # Label inference rules
-    type_rules = {
-        "feat": ["feat", "feature", "add", "new", "implement"],
-        "bug": ["bug", "fix", "error", "issue", "broken"],
-        "refactor": ["refactor", "restructure", "reorganize", "streamline", "improve"],
-        "chore": ["chore", "tooling", "upgrade", "dependencies", "setup", "config"],
-        "docs": ["docs", "readme", "documentation", "comment", "docstring"],
-        "research": ["research", "explore", "experiment", "investigate", "study"],
+    labels_by_keyword: dict[str, list[tuple[str, str]]] = {}
+    for category, category_rules in rules.items():
+        for label, keywords in category_rules.items():
+            for keyword in keywords:
+                labels_by_keyword.setdefault(keyword, []).append((category, label))
+
+    index = {
+        keyword: tuple(
+            dict.fromkeys(
+                hit for other, hits in labels_by_keyword.items() if other in keyword for hit in hits
+            )
+        )
+        for keyword in labels_by_keyword
     }
+    alternation = "|".join(re.escape(k) for k in sorted(index, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), index
 
-    scope_rules = {
-        "judge": ["judge", "llm", "claude", "openai", "gpt", "anthropic"],
-        "evaluator": ["evaluator", "metric", "faithfulness", "relevance", "hallucination"],
-        "core": ["core", "base", "runner", "testcase", "pipeline", "abstract"],
-        "cli": ["cli", "command", "typer", "click", "argparse"],
-        "dataset": ["dataset", "data", "synthetic", "generation", "test-set"],
-        "report": ["report", "output", "format", "html", "json", "terminal"],
-        "pytest": ["pytest", "plugin", "fixture", "conftest"],
-        "async": ["async", "await", "asyncio", "concurrent"],
-        "infra": ["infra", "ci", "cd", "docker", "pypi", "github-actions"],
-        "testing": ["testing", "test", "unittest", "coverage"],
-    }
 
-    # Check type labels
-    type_labels = set()
-    for label, keywords in type_rules.items():
-        if any(keyword in text for keyword in keywords):
-            type_labels.add(label)
+KEYWORD_SCANNER, KEYWORD_INDEX = build_keyword_scanner({"type": TYPE_RULES, "scope": SCOPE_RULES})
+
+# Milestone rules, in priority order
+MILESTONE_RULES = {
+    # Phase 1: Core features (judge, evaluator, runner)
+    "phase-1-foundation": ("judge", "evaluator", "core", "runner", "base"),
+    # Phase 2: Advanced features (async, plugins, integrations)
+    "phase-2-advanced": ("async", "plugin", "integration", "pytest"),
+    # Phase 3: Production features (cli, reports, deployment)
+    "phase-3-production": ("cli", "deploy", "report", "production"),
+}
+
+MILESTONE_SCANNER, MILESTONE_INDEX = build_keyword_scanner({"milestone": MILESTONE_RULES})
+
+# Branch prefix -> type label
+BRANCH_TYPE_PREFIXES = {
+    "feat": "feat",
+    "fix": "bug",
+    "bug": "bug",
+    "refactor": "refactor",
+    "chore": "chore",
+    "docs": "docs",
+    "research": "research",
+}
 
-    # Check scope labels
-    scope_labels = set()
-    for label, keywords in scope_rules.items():
-        if any(keyword in text for keyword in keywords):
-            scope_labels.add(label)
 
-    # Combine: 1 type + up to 2 scope labels
-    result = list(type_labels)[:1] + list(scope_labels)[:2]
+def infer_labels(chunks: Iterable[str], branch: str = "") -> list[str]:
+    """
+    Infer 2-3 labels from lowercased branch, commit, and changed-file text.
+
+    ``chunks`` is consumed lazily, one piece of text at a time (not a single
+    ``str``, which would be scanned per character). No keyword spans
+    whitespace, so scanning the pieces separately matches scanning their
+    joined text, without building that joined copy of a large file list.
+
+    Type labels (pick 1): feat, bug, refactor, chore, docs, research
+    Scope labels (pick 0-2): judge, evaluator, core, cli, dataset, report, pytest, async, infra, testing
+
+    Branches following the ``<prefix>/<issue>-<description>`` convention
+    (see .claude/CONSTANTS.md) name the type directly, e.g. ``fix/15-...`` is
+    ``bug``; keyword matching then only has to find scope labels.
+    """
+    prefix, separator, _ = branch.partition("/")
+    type_label = BRANCH_TYPE_PREFIXES.get(prefix.lower()) if separator else None
+
+    # Labels are taken in order of first appearance, so the branch name outranks
+    # commits and files; the scan stops once 1 type + 2 scope labels are found.
+    scope_labels: list[str] = []
+    matches = itertools.chain.from_iterable(map(KEYWORD_SCANNER.finditer, chunks))
+    for match in matches:
+        for category, label in KEYWORD_INDEX[match.group(1)]:
+            if category == "type":
+                type_label = type_label or label
+            elif label not in scope_labels and len(scope_labels) < 2:
+                scope_labels.append(label)
+        if type_label and len(scope_labels) == 2:
+            break
+
+    result = ([type_label] if type_label else []) + scope_labels
 
     return result or ["feat"]  # Default to feat if nothing matches
 
 
-def infer_milestone(branch: str, commits: list[str]) -> str:
+def infer_milestone(text: str) -> str:
     """
-    Infer milestone from task scope.
+    Infer milestone from the lowercased branch and commits.
 
     Milestones: phase-1-foundation, phase-2-advanced, phase-3-production
     """
-    text = f"{branch} {' '.join(commits)}".lower()
+    matched = {
+        milestone
+        for keyword in set(MILESTONE_SCANNER.findall(text))
+        for _, milestone in MILESTONE_INDEX[keyword]
+    }
 
-    # Phase 1: Core features (judge, evaluator, runner)
-    if any(keyword in text for keyword in ["judge", "evaluator", "core", "runner", "base"]):
-        return "phase-1-foundation"
+    # Earlier phases win when keywords from several phases appear
+    for milestone in MILESTONE_RULES:
+        if milestone in matched:
+            return milestone
 
-    # Phase 2: Advanced features (async, plugins, integrations)
-    if any(keyword in text for keyword in ["async", "plugin", "integration", "pytest"]):
-        return "phase-2-advanced"
+    return "phase-1-foundation"  # Default to phase 1
 
-    # Phase 3: Production features (cli, reports, deployment)
-    if any(keyword in text for keyword in ["cli", "deploy", "report", "production"]):
-        return "phase-3-production"
 
-    return "phase-1-foundation"  # Default to phase 1
+def get_cache_location() -> tuple[Path, str] | None:
+    """Get the cache file path and the key for the current HEAD/branch/main state."""
+    lines = run_git_command(("sh", "-c", CACHE_KEY_SCRIPT)).splitlines()
+    if len(lines) != 4:
+        # Not a repo, detached/unborn HEAD or no main branch: don't cache
+        return None
+    git_dir, *state = lines
+    return Path(git_dir) / CACHE_FILENAME, ":".join(state)
+
+
+def load_cached_metadata(path: Path, key: str) -> dict[str, Any] | None:
+    """Return cached metadata if it was stored under the same key."""
+    try:
+        cached = json.loads(path.read_text())
+    except OSError, ValueError:
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("metadata")
+
+
+def store_cached_metadata(path: Path, key: str, metadata: dict[str, Any]) -> None:
+    """Persist metadata for later invocations; failures are non-fatal."""
+    with contextlib.suppress(OSError):
+        path.write_text(json.dumps({"key": key, "metadata": metadata}))
 
 
 def generate_pr_metadata() -> dict[str, Any]:
-    """Generate complete PR metadata."""
+    """
+    Generate complete PR metadata.
+
+    The result is cached in the git directory, keyed on HEAD, branch and main,
+    so repeated runs (e.g. a preview followed by ``--gh-flags``) skip the
+    log/diff queries and keyword matching. A new commit, checkout or update of
+    main changes the key and invalidates the cache.
+    """
+    cache = get_cache_location()
+    if cache is not None:
+        cached = load_cached_metadata(*cache)
+        if cached is not None:
+            return cached
+
     branch = get_current_branch()
     commits = get_commits_since_main()
     files = get_changed_files()
@@ -117,15 +262,23 @@ def generate_pr_metadata() -> dict[str, Any]:
     issue_match = re.search(r"\d+", branch)
     issue_number = int(issue_match.group()) if issue_match else None
 
+    # Lowercase branch and commits once; milestones deliberately ignore file
+    # paths, and paths are lowered lazily as the label scan reaches them
+    scope_text = f"{branch} {' '.join(commits)}".lower()
+    label_chunks = itertools.chain([scope_text], (path.lower() for path in files))
+
     metadata = {
         "assignees": ["dariero"],
-        "labels": infer_labels(branch, commits, files),
+        "labels": infer_labels(label_chunks, branch),
         "project": "RagaliQ",
-        "milestone": infer_milestone(branch, commits),
+        "milestone": infer_milestone(scope_text),
         "issue_number": issue_number,
         "branch": branch,
     }
 
+    if cache is not None:
+        store_cached_metadata(*cache, metadata)
+
     return metadata
 
 
@@ -152,8 +305,6 @@ def main():
     """Main entry point."""
     if len(sys.argv) > 1 and sys.argv[1] == "--json":
         # Output JSON for programmatic use
-        import json
-
         metadata = generate_pr_metadata()
         print(json.dumps(metadata, indent=2))
     elif len(sys.argv) > 1 and sys.argv[1] == "--gh-flags":
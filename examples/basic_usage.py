@@ -6,7 +6,7 @@ Demonstrates the core RagaliQ API patterns:
   1. Single evaluation (Python API)
   2. Batch evaluation
   3. Custom evaluators and thresholds
-  4. Dataset loading from JSON
+  4. Dataset construction (in memory, or loaded from JSON)
   5. All three report formats (console, JSON, HTML)
   6. TraceCollector for observability
   7. TestCaseGenerator
@@ -15,7 +15,7 @@ Prerequisites:
     pip install ragaliq
     export ANTHROPIC_API_KEY=sk-ant-...
 
-Run the full script:
+Run the full script (sections run concurrently):
     python examples/basic_usage.py
 
 Run a specific section:
@@ -23,70 +23,108 @@ Run a specific section:
     python examples/basic_usage.py --section batch
     python examples/basic_usage.py --section reports
     python examples/basic_usage.py --section generate
+
+Also exercise the JSON file round-trip in the dataset section:
+    python examples/basic_usage.py --section dataset --include-io
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+import os
 import sys
 import tempfile
+from collections import Counter
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from ragaliq import RagaliQ, RAGTestCase
 
+# Read once at import; main() checks it before any section runs
+ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
+
+if TYPE_CHECKING:
+    from ragaliq.core.test_case import RAGTestResult
+    from ragaliq.judges.trace import TraceCollector
+
 # ---------------------------------------------------------------------------
 # Sample test cases reused across sections
+#
+# Built on first use (and only once), so --help and a missing API key exit
+# before any test case is constructed.
 # ---------------------------------------------------------------------------
 
-FAITHFUL_CASE = RAGTestCase(
-    id="ex-faithful-1",
-    name="Capital of France",
-    query="What is the capital of France?",
-    context=[
-        "France is a country in Western Europe.",
-        "The capital city of France is Paris, home to the Eiffel Tower.",
-    ],
-    response="The capital of France is Paris.",
-)
-
-RELEVANT_CASE = RAGTestCase(
-    id="ex-relevant-1",
-    name="Machine learning definition",
-    query="What is machine learning?",
-    context=["Machine learning is a subset of AI that enables systems to learn from data."],
-    response="Machine learning is an AI technique where systems improve through data exposure.",
-)
-
-HALLUCINATION_CASE = RAGTestCase(
-    id="ex-hallucination-1",
-    name="Python version (with added detail)",
-    query="When was Python released?",
-    context=["Python was first released in 1991 by Guido van Rossum."],
-    # Response adds 'version 3' — not in context → potential hallucination
-    response="Python version 3 was released in 1991 by Guido van Rossum.",
-)
-
-MULTI_DOC_CASE = RAGTestCase(
-    id="ex-multi-1",
-    name="Async programming benefits",
-    query="What are the benefits of async programming?",
-    context=[
-        "Async programming allows handling many tasks concurrently without blocking.",
-        "In Python, asyncio enables writing non-blocking I/O-bound code.",
-        "Async code improves throughput for network-bound applications.",
-    ],
-    response="Async programming improves concurrency and throughput for I/O-bound tasks.",
-)
-
-RECALL_CASE = RAGTestCase(
-    id="ex-recall-1",
-    name="Python facts",
-    query="Tell me about Python's origins.",
-    context=["Python was created by Guido van Rossum and released in 1991."],
-    response="Python was created by Guido van Rossum in 1991.",
-    expected_facts=["created by Guido van Rossum", "released in 1991"],
-)
+
+@functools.cache
+def faithful_case() -> RAGTestCase:
+    """Response fully supported by its context."""
+    return RAGTestCase(
+        id="ex-faithful-1",
+        name="Capital of France",
+        query="What is the capital of France?",
+        context=[
+            "France is a country in Western Europe.",
+            "The capital city of France is Paris, home to the Eiffel Tower.",
+        ],
+        response="The capital of France is Paris.",
+    )
+
+
+@functools.cache
+def relevant_case() -> RAGTestCase:
+    """Response that directly answers the query."""
+    return RAGTestCase(
+        id="ex-relevant-1",
+        name="Machine learning definition",
+        query="What is machine learning?",
+        context=["Machine learning is a subset of AI that enables systems to learn from data."],
+        response="Machine learning is an AI technique where systems improve through data exposure.",
+    )
+
+
+@functools.cache
+def hallucination_case() -> RAGTestCase:
+    """Response that adds a detail absent from the context."""
+    return RAGTestCase(
+        id="ex-hallucination-1",
+        name="Python version (with added detail)",
+        query="When was Python released?",
+        context=["Python was first released in 1991 by Guido van Rossum."],
+        # Response adds 'version 3' — not in context → potential hallucination
+        response="Python version 3 was released in 1991 by Guido van Rossum.",
+    )
+
+
+@functools.cache
+def multi_doc_case() -> RAGTestCase:
+    """Query answered from several context documents."""
+    return RAGTestCase(
+        id="ex-multi-1",
+        name="Async programming benefits",
+        query="What are the benefits of async programming?",
+        context=[
+            "Async programming allows handling many tasks concurrently without blocking.",
+            "In Python, asyncio enables writing non-blocking I/O-bound code.",
+            "Async code improves throughput for network-bound applications.",
+        ],
+        response="Async programming improves concurrency and throughput for I/O-bound tasks.",
+    )
+
+
+@functools.cache
+def recall_case() -> RAGTestCase:
+    """Case with expected_facts for context recall."""
+    return RAGTestCase(
+        id="ex-recall-1",
+        name="Python facts",
+        query="Tell me about Python's origins.",
+        context=["Python was created by Guido van Rossum and released in 1991."],
+        response="Python was created by Guido van Rossum in 1991.",
+        expected_facts=["created by Guido van Rossum", "released in 1991"],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -94,20 +132,19 @@ RECALL_CASE = RAGTestCase(
 # ---------------------------------------------------------------------------
 
 
-def section_single() -> None:
+async def section_single() -> None:
     """Single evaluation — the simplest usage pattern."""
+    # RagaliQ defaults: judge=claude, evaluators=[faithfulness, relevance], threshold=0.7
+    tester = RagaliQ(judge="claude")
+    test_case = faithful_case()
+    result = await tester.evaluate_async(test_case)
+
     print("\n" + "=" * 60)
     print("SECTION 1: Single Evaluation")
     print("=" * 60)
 
-    # RagaliQ defaults: judge=claude, evaluators=[faithfulness, relevance], threshold=0.7
-    tester = RagaliQ(judge="claude")
-
     print(f"\nRunner: {tester!r}")
-    print(f"Evaluating: {FAITHFUL_CASE.name!r}...")
-
-    result = tester.evaluate(FAITHFUL_CASE)
-
+    print(f"Evaluated: {test_case.name!r}")
     print(f"\nStatus:          {result.status}")
     print(f"Passed:          {result.passed}")
     print(f"Execution time:  {result.execution_time_ms}ms")
@@ -126,12 +163,8 @@ def section_single() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_batch() -> None:
+async def section_batch() -> None:
     """Batch evaluation — efficient parallel processing."""
-    print("\n" + "=" * 60)
-    print("SECTION 2: Batch Evaluation")
-    print("=" * 60)
-
     tester = RagaliQ(
         judge="claude",
         evaluators=["faithfulness", "relevance", "hallucination"],
@@ -139,10 +172,13 @@ def section_batch() -> None:
         max_concurrency=3,
     )
 
-    test_cases = [FAITHFUL_CASE, RELEVANT_CASE, HALLUCINATION_CASE, MULTI_DOC_CASE]
-    print(f"\nEvaluating {len(test_cases)} test cases (concurrency=3)...")
+    test_cases = [faithful_case(), relevant_case(), hallucination_case(), multi_doc_case()]
+    results = await tester.evaluate_batch_async(test_cases)
 
-    results = tester.evaluate_batch(test_cases)
+    print("\n" + "=" * 60)
+    print("SECTION 2: Batch Evaluation")
+    print("=" * 60)
+    print(f"\nEvaluated {len(test_cases)} test cases (concurrency=3)")
 
     passed = sum(1 for r in results if r.passed)
     total_tokens = sum(r.judge_tokens_used for r in results)
@@ -171,12 +207,8 @@ def section_batch() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_custom_evaluator() -> None:
+async def section_custom_evaluator() -> None:
     """Custom evaluators — extending the built-in set."""
-    print("\n" + "=" * 60)
-    print("SECTION 3: Custom Evaluator")
-    print("=" * 60)
-
     from ragaliq.core.evaluator import EvaluationResult, Evaluator
     from ragaliq.evaluators import register_evaluator
     from ragaliq.judges.base import LLMJudge
@@ -212,9 +244,12 @@ def section_custom_evaluator() -> None:
         default_threshold=0.65,
     )
 
-    print("\nEvaluating with custom 'conciseness' evaluator...")
-    result = tester.evaluate(FAITHFUL_CASE)
+    result = await tester.evaluate_async(faithful_case())
 
+    print("\n" + "=" * 60)
+    print("SECTION 3: Custom Evaluator")
+    print("=" * 60)
+    print("\nEvaluated with custom 'conciseness' evaluator")
     print(f"\nStatus: {result.status}")
     for metric, score in result.scores.items():
         mark = "✓" if score >= 0.65 else "✗"
@@ -226,21 +261,21 @@ def section_custom_evaluator() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_context_recall() -> None:
+async def section_context_recall() -> None:
     """Context recall — evaluates retrieval completeness."""
-    print("\n" + "=" * 60)
-    print("SECTION 4: Context Recall")
-    print("=" * 60)
-
     tester = RagaliQ(
         judge="claude",
         evaluators=["context_recall"],
     )
+    test_case = recall_case()
+    result = await tester.evaluate_async(test_case)
 
-    print(f"\nEvaluating: {RECALL_CASE.name!r}")
-    print(f"Expected facts: {RECALL_CASE.expected_facts}")
+    print("\n" + "=" * 60)
+    print("SECTION 4: Context Recall")
+    print("=" * 60)
 
-    result = tester.evaluate(RECALL_CASE)
+    print(f"\nEvaluated: {test_case.name!r}")
+    print(f"Expected facts: {test_case.expected_facts}")
 
     print(f"\nContext recall score: {result.scores['context_recall']:.2f}")
     print(f"Passed: {result.passed}")
@@ -260,15 +295,10 @@ def section_context_recall() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_dataset() -> None:
-    """Dataset loading from JSON file."""
-    print("\n" + "=" * 60)
-    print("SECTION 5: Dataset Loading")
-    print("=" * 60)
-
-    from ragaliq.datasets import DatasetLoader
+async def section_dataset(include_io: bool = False) -> None:
+    """Dataset construction in memory, optionally round-tripped through a JSON file."""
+    from ragaliq.datasets import DatasetLoader, DatasetSchema
 
-    # Create a temporary dataset file
     dataset_data = {
         "version": "1.0",
         "metadata": {"source": "basic_usage_example"},
@@ -292,30 +322,74 @@ def section_dataset() -> None:
         ],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False, encoding="utf-8") as f:
-        json.dump(dataset_data, f, indent=2)
-        dataset_path = Path(f.name)
+    # Data already in memory validates against the same schema the file loader uses
+    dataset = DatasetSchema.model_validate(dataset_data)
+    dataset_path: Path | None = None
 
-    try:
-        print(f"\nLoading dataset from: {dataset_path}")
-        dataset = DatasetLoader.load(dataset_path)
-        print(f"Loaded {len(dataset.test_cases)} test cases")
-        print(f"Version: {dataset.version}")
-        print(f"Metadata: {dataset.metadata}")
+    if include_io:
+        # The same data loaded from disk, as you would with your own dataset files
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(dataset_data, f, indent=2)
+            dataset_path = Path(f.name)
 
-        for tc in dataset.test_cases:
-            print(f"  - [{tc.id}] {tc.name} (tags: {tc.tags})")
+        try:
+            dataset = DatasetLoader.load(dataset_path)
+        finally:
+            dataset_path.unlink(missing_ok=True)
 
-        # Evaluate the loaded dataset
-        tester = RagaliQ(judge="claude")
-        print("\nEvaluating dataset...")
-        results = tester.evaluate_batch(dataset.test_cases)
+    # Evaluate the dataset
+    tester = RagaliQ(judge="claude")
+    results = await tester.evaluate_batch_async(dataset.test_cases)
 
-        passed = sum(1 for r in results if r.passed)
-        print(f"Results: {passed}/{len(results)} passed")
+    print("\n" + "=" * 60)
+    print("SECTION 5: Dataset Loading")
+    print("=" * 60)
 
-    finally:
-        dataset_path.unlink(missing_ok=True)
+    if dataset_path is None:
+        print(f"\nBuilt dataset in memory: {len(dataset.test_cases)} test cases")
+    else:
+        print(f"\nLoaded {len(dataset.test_cases)} test cases from: {dataset_path}")
+    print(f"Version: {dataset.version}")
+    print(f"Metadata: {dataset.metadata}")
+
+    for tc in dataset.test_cases:
+        print(f"  - [{tc.id}] {tc.name} (tags: {tc.tags})")
+
+    passed = sum(1 for r in results if r.passed)
+    print(f"\nResults: {passed}/{len(results)} passed")
+
+
+# ---------------------------------------------------------------------------
+# Shared batch for Sections 6 and 7
+#
+# Reports and observability look at the same evaluation from two angles, so
+# the batch runs once through a traced judge and both sections await the
+# same task instead of re-judging the overlapping test cases.
+# ---------------------------------------------------------------------------
+
+
+async def _run_traced_batch() -> tuple[list[RAGTestResult], TraceCollector]:
+    """Evaluate the report test cases once, recording every judge call."""
+    from ragaliq.judges import ClaudeJudge
+    from ragaliq.judges.trace import TraceCollector
+
+    collector = TraceCollector()
+    tester = RagaliQ(
+        judge=ClaudeJudge(trace_collector=collector),
+        evaluators=["faithfulness", "relevance"],
+    )
+    results = await tester.evaluate_batch_async(
+        [faithful_case(), relevant_case(), hallucination_case()]
+    )
+    return results, collector
+
+
+@functools.cache
+def traced_batch() -> asyncio.Task[tuple[list[RAGTestResult], TraceCollector]]:
+    """Start the shared batch on first use; later callers await the same task."""
+    return asyncio.ensure_future(_run_traced_batch())
 
 
 # ---------------------------------------------------------------------------
@@ -323,18 +397,16 @@ def section_dataset() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_reports() -> None:
+async def section_reports() -> None:
     """All three report formats — console, JSON, HTML."""
+    from ragaliq.reports import ConsoleReporter, HTMLReporter, JSONReporter
+
+    results, _ = await traced_batch()
+
     print("\n" + "=" * 60)
     print("SECTION 6: Reports")
     print("=" * 60)
 
-    from ragaliq.reports import ConsoleReporter, HTMLReporter, JSONReporter
-
-    tester = RagaliQ(judge="claude", evaluators=["faithfulness", "relevance"])
-    test_cases = [FAITHFUL_CASE, RELEVANT_CASE, HALLUCINATION_CASE]
-    results = tester.evaluate_batch(test_cases)
-
     # --- Console Report ---
     print("\n--- Console Report ---")
     ConsoleReporter(threshold=0.7).report(results)
@@ -375,44 +447,34 @@ def section_reports() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_observability() -> None:
+async def section_observability() -> None:
     """TraceCollector — per-call timing and token tracking."""
-    print("\n" + "=" * 60)
-    print("SECTION 7: Observability (TraceCollector)")
-    print("=" * 60)
-
-    from ragaliq.judges import ClaudeJudge
-    from ragaliq.judges.trace import TraceCollector
-
-    collector = TraceCollector()
-    judge = ClaudeJudge(trace_collector=collector)
-
-    tester = RagaliQ(
-        judge=judge,
-        evaluators=["faithfulness", "relevance"],
-    )
-
-    print("\nEvaluating two test cases...")
-    tester.evaluate_batch([FAITHFUL_CASE, RELEVANT_CASE])
-
-    print("\nTrace summary:")
-    print(f"  Total API calls:    {len(collector.traces)}")
-    print(f"  Total tokens:       {collector.total_tokens}")
-    print(f"  Input tokens:       {collector.total_input_tokens}")
-    print(f"  Output tokens:      {collector.total_output_tokens}")
-    print(f"  Total latency:      {collector.total_latency_ms}ms")
-    print(f"  Estimated cost:     ${collector.total_cost_estimate:.4f}")
-    print(f"  Successes:          {collector.success_count}")
-    print(f"  Failures:           {collector.failure_count}")
+    # The judge behind the shared batch was built with a TraceCollector:
+    #   collector = TraceCollector()
+    #   tester = RagaliQ(judge=ClaudeJudge(trace_collector=collector), ...)
+    results, collector = await traced_batch()
 
     # Per-operation breakdown
-    ops: dict[str, int] = {}
-    for trace in collector.traces:
-        ops[trace.operation] = ops.get(trace.operation, 0) + 1
-
-    print("\nCalls by operation:")
-    for op, count in sorted(ops.items()):
-        print(f"  {op}: {count}")
+    ops = Counter(trace.operation for trace in collector.traces)
+
+    # Build the whole block and write it in one call
+    lines = [
+        "\n" + "=" * 60,
+        "SECTION 7: Observability (TraceCollector)",
+        "=" * 60,
+        f"\nTrace summary for {len(results)} test cases:",
+        f"  Total API calls:    {len(collector.traces)}",
+        f"  Total tokens:       {collector.total_tokens}",
+        f"  Input tokens:       {collector.total_input_tokens}",
+        f"  Output tokens:      {collector.total_output_tokens}",
+        f"  Total latency:      {collector.total_latency_ms}ms",
+        f"  Estimated cost:     ${collector.total_cost_estimate:.4f}",
+        f"  Successes:          {collector.success_count}",
+        f"  Failures:           {collector.failure_count}",
+        "\nCalls by operation:",
+        *(f"  {op}: {count}" for op, count in sorted(ops.items())),
+    ]
+    print("\n".join(lines))
 
 
 # ---------------------------------------------------------------------------
@@ -420,12 +482,8 @@ def section_observability() -> None:
 # ---------------------------------------------------------------------------
 
 
-def section_generate() -> None:
+async def section_generate() -> None:
     """TestCaseGenerator — generate test cases from documents."""
-    print("\n" + "=" * 60)
-    print("SECTION 8: Test Case Generation")
-    print("=" * 60)
-
     from ragaliq import TestCaseGenerator
     from ragaliq.judges import ClaudeJudge
 
@@ -438,15 +496,14 @@ def section_generate() -> None:
         "Python's functionality. Notable packages include NumPy, Pandas, Flask, and Django.",
     ]
 
-    print(f"\nGenerating 3 test cases from {len(documents)} documents...")
-
     judge = ClaudeJudge()
     generator = TestCaseGenerator()
-    test_cases = asyncio.run(
-        generator.generate_from_documents(documents=documents, n=3, judge=judge)
-    )
+    test_cases = await generator.generate_from_documents(documents=documents, n=3, judge=judge)
 
-    print(f"\nGenerated {len(test_cases)} test cases:")
+    print("\n" + "=" * 60)
+    print("SECTION 8: Test Case Generation")
+    print("=" * 60)
+    print(f"\nGenerated {len(test_cases)} test cases from {len(documents)} documents:")
     for tc in test_cases:
         print(f"  [{tc.id[:8]}...] {tc.name}")
         print(f"    Q: {tc.query}")
@@ -456,6 +513,10 @@ def section_generate() -> None:
 
 # ---------------------------------------------------------------------------
 # Entry point
+#
+# Every section is a coroutine that awaits all of its judge calls before
+# printing anything, so when the full script runs the sections concurrently
+# each section's output still appears as one uninterrupted block.
 # ---------------------------------------------------------------------------
 
 SECTIONS = {
@@ -470,6 +531,19 @@ SECTIONS = {
 }
 
 
+async def run_all(sections: dict[str, Callable[[], Awaitable[None]]]) -> None:
+    """Run all sections concurrently; total time is the slowest section, not the sum."""
+
+    async def run(name: str, fn: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await fn()
+        except Exception as exc:
+            print(f"\n[{name}] ERROR: {exc}")
+            raise
+
+    await asyncio.gather(*(run(name, fn) for name, fn in sections.items()))
+
+
 def main() -> None:
     """Run one or all example sections."""
     import argparse
@@ -481,24 +555,26 @@ def main() -> None:
         default=None,
         help="Run a specific section (default: run all)",
     )
+    parser.add_argument(
+        "--include-io",
+        action="store_true",
+        help="Also round-trip the dataset section through a JSON file on disk",
+    )
     args = parser.parse_args()
 
-    import os
-
-    if not os.environ.get("ANTHROPIC_API_KEY"):
+    if not ANTHROPIC_API_KEY:
         print("ERROR: ANTHROPIC_API_KEY environment variable is not set.")
         print("Set it with: export ANTHROPIC_API_KEY=sk-ant-...")
         sys.exit(1)
 
+    sections: dict[str, Callable[[], Awaitable[None]]] = dict(SECTIONS)
+    if args.include_io:
+        sections["dataset"] = functools.partial(section_dataset, include_io=True)
+
     if args.section:
-        SECTIONS[args.section]()
+        asyncio.run(sections[args.section]())
     else:
-        for name, fn in SECTIONS.items():
-            try:
-                fn()
-            except Exception as exc:
-                print(f"\n[{name}] ERROR: {exc}")
-                raise
+        asyncio.run(run_all(sections))
 
     print("\nDone.")
 
@@ -13,6 +13,9 @@ Checks all acceptance criteria before publishing a release:
   9. twine check passes on built artifacts
  10. Top-level imports work
 
+Independent checks run concurrently (build then twine stays sequential) and
+their output is replayed in the order above.
+
 Usage:
     python scripts/verify_release.py                     # all 10, before a release
     python scripts/verify_release.py --consistency-only  # checks 1-5, in CI
@@ -24,16 +27,27 @@ running on every PR.
 """
 
 import importlib
+import io
+import itertools
+import logging
 import re
 import subprocess
 import sys
+import threading
 import tomllib
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src" / "ragaliq"
 
+_PYPROJECT_VERSION_RE = re.compile(rb'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+_INIT_VERSION_RE = re.compile(rb'^__version__\s*=\s*"([^"]+)"', re.MULTILINE)
+_TODO_RE = re.compile(b"TODO|FIXME|HACK|XXX")
+_TODO_HITS_SHOWN = 10
+
 
 def header(msg: str) -> None:
     print(f"\n{'=' * 60}")
@@ -53,23 +67,11 @@ def check_version_consistency() -> bool:
     """Verify version is the same in pyproject.toml and __init__.py."""
     header("Version Consistency")
 
-    # Read pyproject.toml version
-    pyproject = ROOT / "pyproject.toml"
-    pyproject_version = None
-    for line in pyproject.read_text().splitlines():
-        m = re.match(r'^version\s*=\s*"([^"]+)"', line)
-        if m:
-            pyproject_version = m.group(1)
-            break
-
-    # Read __init__.py version
-    init_file = SRC / "__init__.py"
-    init_version = None
-    for line in init_file.read_text().splitlines():
-        m = re.match(r'^__version__\s*=\s*"([^"]+)"', line)
-        if m:
-            init_version = m.group(1)
-            break
+    m = _PYPROJECT_VERSION_RE.search((ROOT / "pyproject.toml").read_bytes())
+    pyproject_version = m.group(1).decode() if m else None
+
+    m = _INIT_VERSION_RE.search((SRC / "__init__.py").read_bytes())
+    init_version = m.group(1).decode() if m else None
 
     ok = True
     ok &= check(
@@ -96,22 +98,36 @@ def check_required_files() -> bool:
     return ok
 
 
+def _iter_todo_hits() -> Iterator[str]:
+    """Yield `path:line: text` for each source line with a marker, lazily, file by file."""
+    for py_file in SRC.rglob("*.py"):
+        # Scan the raw bytes in one pass; only the lines around a hit are sliced out.
+        data = py_file.read_bytes()
+        last_line_start = -1
+        for m in _TODO_RE.finditer(data):
+            line_start = data.rfind(b"\n", 0, m.start()) + 1
+            if line_start == last_line_start:
+                continue
+            last_line_start = line_start
+            line_end = data.find(b"\n", m.end())
+            line = data[line_start : line_end if line_end != -1 else len(data)]
+            if b"noqa" in line:
+                continue
+            lineno = data.count(b"\n", 0, line_start) + 1
+            text = line.decode("utf-8", "replace").strip()
+            yield f"  {py_file.relative_to(ROOT)}:{lineno}: {text}"
+
+
 def check_no_todos() -> bool:
     """Verify no TODO/FIXME/HACK/XXX markers in source code."""
     header("No TODOs in Source")
 
-    patterns = ["TODO", "FIXME", "HACK", "XXX"]
-    found: list[str] = []
+    # Stop scanning once there is one more hit than we would print.
+    found = list(itertools.islice(_iter_todo_hits(), _TODO_HITS_SHOWN + 1))
+    count = f"{_TODO_HITS_SHOWN}+" if len(found) > _TODO_HITS_SHOWN else str(len(found))
 
-    for py_file in SRC.rglob("*.py"):
-        rel = py_file.relative_to(ROOT)
-        for i, line in enumerate(py_file.read_text().splitlines(), 1):
-            for pattern in patterns:
-                if pattern in line and "noqa" not in line:
-                    found.append(f"  {rel}:{i}: {line.strip()}")
-
-    ok = check("No TODO/FIXME/HACK/XXX in src/", len(found) == 0, f"{len(found)} found")
-    for hit in found[:10]:
+    ok = check("No TODO/FIXME/HACK/XXX in src/", len(found) == 0, f"{count} found")
+    for hit in found[:_TODO_HITS_SHOWN]:
         print(f"    {hit}")
     return ok
 
@@ -159,22 +175,31 @@ def check_twine() -> bool | None:
         check("twine check", False, "no dist/ artifacts found")
         return False
 
-    result = subprocess.run(
-        ["python", "-m", "twine", "check", *[str(a) for a in artifacts]],
-        cwd=ROOT,
-        capture_output=True,
-        text=True,
-    )
-
-    if result.returncode != 0:
+    # In-process rather than `python -m twine`: saves an interpreter start-up and
+    # re-import of twine's dependency tree. twine prints its own per-file status.
+    try:
+        twine_check = importlib.import_module("twine.commands.check").check
+    except ImportError:
         # twine may not be installed — that's acceptable in dev
-        if "No module named" in result.stderr:
-            print("  [~] twine not installed — skipping (install with: pip install twine)")
-            return None
-        check("twine check", False, result.stdout.strip())
-        return False
-
-    return check("twine check", True)
+        print("  [~] twine not installed — skipping (install with: pip install twine)")
+        return None
+
+    # Outside its CLI twine configures no logging, so its failure details would go
+    # to stderr via logging's last-resort handler, out of order with this stage's
+    # buffered output. Route them to this thread's stdout for the call instead.
+    twine_logger = logging.getLogger("twine")
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(levelname)-8s %(message)s"))
+    twine_logger.addHandler(handler)
+    try:
+        failed = bool(twine_check([str(a) for a in artifacts]))
+    except Exception as e:
+        # `python -m twine` would exit non-zero on an unreadable artifact; do the same.
+        print()  # end twine's unfinished "Checking <file>: " line
+        return check("twine check", False, f"{type(e).__name__}: {e}")
+    finally:
+        twine_logger.removeHandler(handler)
+    return check("twine check", not failed)
 
 
 def check_imports() -> bool:
@@ -367,6 +392,55 @@ def check_floors_against_lock() -> bool:
     )
 
 
+class _PerThreadStdout(io.TextIOBase):
+    """stdout stand-in that routes each worker thread's prints to its own buffer.
+
+    Lets checks run concurrently while their output is replayed in a fixed order.
+    """
+
+    def __init__(self, target: TextIO) -> None:
+        self._target = target
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        buffer: io.StringIO | None = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._target).write(text)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def capture(self, stage: Sequence[Callable[[], bool | None]]) -> tuple[list[bool | None], str]:
+        """Run a stage's checks in order on this thread, returning results and output."""
+        self._local.buffer = io.StringIO()
+        try:
+            return [check_fn() for check_fn in stage], self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def run_stages(stages: Sequence[Sequence[Callable[[], bool | None]]]) -> list[bool | None]:
+    """Run independent stages concurrently; checks within a stage run in order.
+
+    Output is printed stage by stage in the given order once everything finishes,
+    so it reads the same as a sequential run.
+    """
+    real_stdout = sys.stdout
+    proxy = _PerThreadStdout(real_stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(proxy.capture, stage) for stage in stages]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = real_stdout
+
+    results: list[bool | None] = []
+    for stage_results, output in outcomes:
+        print(output, end="")
+        results.extend(stage_results)
+    return results
+
+
 def main() -> None:
     # --consistency-only runs the atom checks and nothing else, so CI can gate
     # every PR on them without paying for `python -m build` on each push and
@@ -377,25 +451,24 @@ def main() -> None:
     print(f"RagaliQ {mode}")
     print(f"Root: {ROOT}")
 
-    consistency: list[bool | None] = [
-        check_version_consistency(),
-        check_python_atom(),
-        check_ruff_atom(),
-        check_dev_lists(),
-        check_floors_against_lock(),
+    stages: list[list[Callable[[], bool | None]]] = [
+        [check_version_consistency],
+        [check_python_atom],
+        [check_ruff_atom],
+        [check_dev_lists],
+        [check_floors_against_lock],
     ]
-
-    results: list[bool | None] = consistency
     if not consistency_only:
-        results = [
-            *consistency,
-            check_required_files(),
-            check_no_todos(),
-            check_imports(),
-            check_build(),
-            check_twine(),
+        # Build and import dominate wall time; twine needs the build's artifacts.
+        stages += [
+            [check_required_files],
+            [check_no_todos],
+            [check_imports],
+            [check_build, check_twine],
         ]
 
+    results = run_stages(stages)
+
     header("RESULT")
     total = len(results)
     passed = sum(1 for r in results if r is True)
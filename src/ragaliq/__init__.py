@@ -1,18 +1,41 @@
 """RagaliQ — LLM & RAG Evaluation Testing Framework."""
 
-from ragaliq.core.evaluator import EvaluationResult, Evaluator
-from ragaliq.core.runner import RagaliQ
-from ragaliq.core.test_case import EvalStatus, RAGTestCase, RAGTestResult
-from ragaliq.datasets.generator import TestCaseGenerator
-from ragaliq.datasets.loader import DatasetLoader
-from ragaliq.judges.base import JudgeConfig, LLMJudge
-from ragaliq.judges.claude import ClaudeJudge
-from ragaliq.reports.console import ConsoleReporter
-from ragaliq.reports.html import HTMLReporter
-from ragaliq.reports.json_export import JSONReporter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ragaliq.core.evaluator import EvaluationResult, Evaluator
+    from ragaliq.core.runner import RagaliQ
+    from ragaliq.core.test_case import EvalStatus, RAGTestCase, RAGTestResult
+    from ragaliq.datasets.generator import TestCaseGenerator
+    from ragaliq.datasets.loader import DatasetLoader
+    from ragaliq.judges.base import JudgeConfig, LLMJudge
+    from ragaliq.judges.claude import ClaudeJudge
+    from ragaliq.reports.console import ConsoleReporter
+    from ragaliq.reports.html import HTMLReporter
+    from ragaliq.reports.json_export import JSONReporter
 
 __version__ = "0.2.0"
 
+# Public name -> defining module. Resolved on first attribute access (PEP 562) so
+# `import ragaliq` (e.g. `ragaliq --version`) doesn't pull in anthropic, pydantic, etc.
+_LAZY_IMPORTS: dict[str, str] = {
+    "RagaliQ": "ragaliq.core.runner",
+    "RAGTestCase": "ragaliq.core.test_case",
+    "RAGTestResult": "ragaliq.core.test_case",
+    "EvalStatus": "ragaliq.core.test_case",
+    "Evaluator": "ragaliq.core.evaluator",
+    "EvaluationResult": "ragaliq.core.evaluator",
+    "ClaudeJudge": "ragaliq.judges.claude",
+    "LLMJudge": "ragaliq.judges.base",
+    "JudgeConfig": "ragaliq.judges.base",
+    "DatasetLoader": "ragaliq.datasets.loader",
+    "TestCaseGenerator": "ragaliq.datasets.generator",
+    "ConsoleReporter": "ragaliq.reports.console",
+    "HTMLReporter": "ragaliq.reports.html",
+    "JSONReporter": "ragaliq.reports.json_export",
+}
+
 __all__ = [
     "RagaliQ",
     "RAGTestCase",
@@ -29,3 +52,17 @@ __all__ = [
     "HTMLReporter",
     "JSONReporter",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names from their submodule on first access and cache them."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,15 +1,17 @@
 """CLI entry point for RagaliQ."""
 
 from pathlib import Path
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Literal, cast
 
 import typer
-from rich.console import Console
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
-from rich.table import Table
 
 import ragaliq
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ragaliq.core.test_case import RAGTestResult
+
 app = typer.Typer(no_args_is_help=True)
 
 
@@ -48,6 +50,61 @@ def run(
     ),
     judge: str = typer.Option("claude", "--judge", "-j", help="LLM judge to use."),
     fail_fast: bool = typer.Option(False, "--fail-fast", help="Stop on first evaluator error."),
+    max_concurrency: int = typer.Option(
+        5,
+        "--max-concurrency",
+        "-c",
+        min=1,
+        help="Test cases evaluated concurrently. Judge calls are latency-bound, so raise this "
+        "for large datasets (subject to API rate limits).",
+    ),
+    max_judge_concurrency: int = typer.Option(
+        20,
+        "--max-judge-concurrency",
+        min=1,
+        help="Cap on in-flight judge API calls across all test cases. Lower it to stay "
+        "under your API rate limit.",
+    ),
+    adaptive_concurrency: bool = typer.Option(
+        False,
+        "--adaptive-concurrency",
+        help="Start judge calls at low concurrency, ramp up to --max-judge-concurrency while "
+        "they succeed, and back off and retry on 429/529 overload errors.",
+    ),
+    requests_per_minute: float | None = typer.Option(
+        None,
+        "--requests-per-minute",
+        min=1,
+        help="Pace judge API requests to stay under this per-minute quota.",
+    ),
+    input_tokens_per_minute: float | None = typer.Option(
+        None,
+        "--input-tokens-per-minute",
+        min=1,
+        help="Pace judge API calls to stay under this input-tokens-per-minute quota.",
+    ),
+    batch_api: bool = typer.Option(
+        False,
+        "--batch-api",
+        help="Submit judge calls through Anthropic's Message Batches API: discounted, but "
+        "results can take minutes to hours. --max-judge-concurrency does not apply; "
+        "raise --max-concurrency so more test cases share each batch.",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the judge; skip the persistent response cache."
+    ),
+    cache_path: Path | None = typer.Option(
+        None,
+        "--cache-path",
+        help="SQLite file for cached judge responses. Defaults to ~/.cache/ragaliq/judge.db.",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Show reasoning for every test case, not just failures, and keep raw judge "
+        "responses in results.",
+    ),
     output: str = typer.Option(
         "console",
         "--output",
@@ -60,13 +117,29 @@ def run(
         "-f",
         help="File path for json/html output. Defaults to report.json or report.html.",
     ),
+    full_precision: bool = typer.Option(
+        False,
+        "--full-precision",
+        help="Write unrounded scores to the JSON report (default: 4 decimal places).",
+    ),
 ) -> None:
     """Run evaluations against a dataset."""
     import asyncio
+    from operator import attrgetter
+
+    from rich.console import Console
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
 
     from ragaliq import RagaliQ
     from ragaliq.datasets import DatasetLoader, DatasetLoadError
     from ragaliq.integrations.github_actions import is_ci, is_github_actions
+    from ragaliq.judges.cache import DEFAULT_CACHE_PATH
 
     in_ci = is_ci()
     console = Console(no_color=in_ci, force_terminal=False) if in_ci else Console()
@@ -100,12 +173,30 @@ def run(
         judge=cast(Literal["claude", "openai"], judge),
         evaluators=evaluator if evaluator else None,
         default_threshold=threshold,
+        max_concurrency=max_concurrency,
+        max_judge_concurrency=max_judge_concurrency,
         fail_fast=fail_fast,
+        cache_path=None if no_cache else cache_path or DEFAULT_CACHE_PATH,
+        adaptive_concurrency=adaptive_concurrency,
+        batch_api=batch_api,
+        requests_per_minute=requests_per_minute,
+        input_tokens_per_minute=input_tokens_per_minute,
+        # Raw judge payloads are only surfaced by the JSON report (inside `details`).
+        keep_raw_responses=verbose or output == "json",
     )
 
+    async def evaluate_and_close(
+        on_result: Callable[[RAGTestResult], None] | None = None,
+    ) -> list[RAGTestResult]:
+        # Close the judge's HTTP client on the loop that opened its connections.
+        try:
+            return await runner_obj.evaluate_batch_async(test_cases, on_result=on_result)
+        finally:
+            await runner_obj.aclose()
+
     if in_ci:
         typer.echo("Evaluating...")
-        results = asyncio.run(runner_obj.evaluate_batch_async(test_cases))
+        results = asyncio.run(evaluate_and_close())
     else:
         with Progress(
             SpinnerColumn(),
@@ -115,19 +206,21 @@ def run(
             console=console,
             transient=True,
         ) as progress:
-            progress.add_task("Evaluating...", total=None)
-            results = asyncio.run(runner_obj.evaluate_batch_async(test_cases))
+            task_id = progress.add_task("Evaluating...", total=total)
+            results = asyncio.run(evaluate_and_close(lambda _: progress.advance(task_id)))
 
     match output:
         case "console":
             from ragaliq.reports.console import ConsoleReporter
 
-            ConsoleReporter(console=console, threshold=threshold).report(results)
+            ConsoleReporter(console=console, threshold=threshold, verbose=verbose).report(results)
         case "json":
             from ragaliq.reports.json_export import JSONReporter
 
             path = output_file or Path("report.json")
-            path.write_text(JSONReporter(threshold=threshold).export(results), encoding="utf-8")
+            JSONReporter(threshold=threshold, score_precision=None if full_precision else 4).write(
+                results, path
+            )
             typer.echo(f"JSON report written to {path}")
         case "html":
             from ragaliq.reports.html import HTMLReporter
@@ -141,7 +234,7 @@ def run(
 
         emit_ci_summary(results, threshold=threshold)
 
-    passed = sum(1 for r in results if r.passed)
+    passed = sum(map(attrgetter("passed"), results))
     if passed < total:
         raise typer.Exit(code=1)
 
@@ -157,11 +250,22 @@ def generate(
         Path("output.json"), "--output", "-o", help="Output JSON file path."
     ),
     judge: str = typer.Option("claude", "--judge", "-j", help="LLM judge to use."),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Always call the judge; skip the persistent response cache."
+    ),
+    cache_path: Path | None = typer.Option(
+        None,
+        "--cache-path",
+        help="SQLite file for cached judge responses. Defaults to ~/.cache/ragaliq/judge.db.",
+    ),
 ) -> None:
     """Generate test cases from documents using an LLM."""
     import asyncio
     import json
 
+    from rich.console import Console
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from ragaliq.datasets.generator import TestCaseGenerator
     from ragaliq.datasets.schemas import DatasetSchema
 
@@ -189,6 +293,13 @@ def generate(
         typer.echo(f"Error: {exc}", err=True)
         raise typer.Exit(code=1) from None
 
+    cache = None
+    if not no_cache:
+        from ragaliq.judges.cache import DEFAULT_CACHE_PATH, CachingTransport, JudgeCache
+
+        cache = JudgeCache(cache_path or DEFAULT_CACHE_PATH)
+        judge_instance.wrap_transport(CachingTransport(judge_instance.transport, cache))
+
     generator = TestCaseGenerator()
 
     try:
@@ -205,20 +316,27 @@ def generate(
     except Exception as exc:
         typer.echo(f"Error during generation: {exc}", err=True)
         raise typer.Exit(code=1) from None
+    finally:
+        if cache is not None:
+            cache.close()
 
     dataset = DatasetSchema(
         test_cases=test_cases,
         metadata={"generator": "ragaliq", "source": str(docs_path)},
     )
-    output.write_text(
-        json.dumps(dataset.model_dump(mode="json"), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    # Stream to the file instead of building the whole JSON document as one string.
+    with output.open("w", encoding="utf-8") as f:
+        json.dump(dataset.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
 
     case_word = "test case" if len(test_cases) == 1 else "test cases"
     typer.echo(f"Generated {len(test_cases)} {case_word} → {output}")
 
 
+def _read_document(path: Path) -> str:
+    """Read one UTF-8 text document, stripped of surrounding whitespace."""
+    return path.read_text(encoding="utf-8").strip()
+
+
 def _load_documents(docs_path: Path) -> list[str]:
     """
     Load documents from a file or directory.
@@ -239,22 +357,26 @@ def _load_documents(docs_path: Path) -> list[str]:
         return []
 
     if docs_path.is_dir():
-        docs = [
-            txt_file.read_text(encoding="utf-8").strip()
-            for txt_file in sorted(docs_path.glob("*.txt"))
-        ]
+        from concurrent.futures import ThreadPoolExecutor
+
+        txt_files = sorted(docs_path.glob("*.txt"))
+        if not txt_files:
+            return []
+        # File reads are I/O-bound; overlap them. map() keeps the sorted order.
+        with ThreadPoolExecutor(max_workers=min(32, len(txt_files))) as pool:
+            docs = list(pool.map(_read_document, txt_files))
         return [d for d in docs if d]
 
     suffix = docs_path.suffix.lower()
 
     if suffix == ".txt":
-        content = docs_path.read_text(encoding="utf-8").strip()
+        content = _read_document(docs_path)
         return [content] if content else []
 
     if suffix == ".json":
         import json
 
-        data = json.loads(docs_path.read_text(encoding="utf-8"))
+        data = json.loads(docs_path.read_bytes())
         if isinstance(data, list):
             return [str(d).strip() for d in data if d]
         typer.echo(
@@ -266,7 +388,9 @@ def _load_documents(docs_path: Path) -> list[str]:
     if suffix in {".yaml", ".yml"}:
         import yaml
 
-        data = yaml.safe_load(docs_path.read_text(encoding="utf-8"))
+        # libyaml's C loader when PyYAML was built with it; same safe semantics.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(docs_path.read_bytes(), Loader=loader)
         if isinstance(data, list):
             return [str(d).strip() for d in data if d]
         typer.echo(
@@ -285,6 +409,9 @@ def _load_documents(docs_path: Path) -> list[str]:
 @app.command("list-evaluators")
 def list_evaluators_cmd() -> None:
     """List all available evaluators."""
+    from rich.console import Console
+    from rich.table import Table
+
     import ragaliq.evaluators  # noqa: F401 — triggers registration of built-ins
     from ragaliq.evaluators import get_evaluator, list_evaluators
 
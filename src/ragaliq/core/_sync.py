@@ -0,0 +1,52 @@
+"""Cached event loop behind the synchronous wrappers of async APIs.
+
+Shared by `RagaliQ` and `TestCaseGenerator`, whose sync methods run their async
+counterparts to completion.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+
+class CachedLoopRunner:
+    """Runs coroutines to completion on one event loop reused across sync calls.
+
+    Reusing one loop keeps loop-bound state alive between calls (a judge's HTTP
+    connection pool, asyncio primitives) instead of tearing it down with a fresh
+    asyncio.run() each time. A call made while another thread is using the cached
+    loop falls back to a one-off loop. The loop is closed by `close()` or when the
+    runner is garbage-collected.
+    """
+
+    def __init__(self) -> None:
+        self._runner: asyncio.Runner | None = None
+        self._lock = threading.Lock()
+
+    def run[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run `coro` on the cached loop (created on first use) and return its result."""
+        if not self._lock.acquire(blocking=False):
+            return asyncio.run(coro)
+        try:
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+                weakref.finalize(self, self._runner.close)
+            return self._runner.run(coro)
+        finally:
+            self._lock.release()
+
+    def close(self, teardown: Callable[[], Coroutine[Any, Any, Any]] | None = None) -> None:
+        """Close the cached loop. Safe to call more than once.
+
+        Args:
+            teardown: Optional coroutine function run on the loop before it closes,
+                e.g. to close clients bound to it. Skipped if no loop was created.
+        """
+        with self._lock:
+            if self._runner is not None:
+                if teardown is not None:
+                    self._runner.run(teardown())
+                self._runner.close()
+                self._runner = None
@@ -2,16 +2,33 @@
 
 import asyncio
 import logging
+import math
 import threading
 import time
-from typing import Any, Literal
-
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from ragaliq.core._sync import CachedLoopRunner
 from ragaliq.core.evaluator import EvaluationResult, Evaluator
 from ragaliq.core.test_case import EvalStatus, RAGTestCase, RAGTestResult
 from ragaliq.judges.base import JudgeConfig, LLMJudge
 
+if TYPE_CHECKING:
+    from ragaliq.judges.cache import JudgeCache
+
 logger = logging.getLogger(__name__)
 
+# Test case fields evaluators score; batch deduplication keys on these only.
+_CONTENT_FIELDS = {"query", "context", "response", "expected_answer", "expected_facts"}
+
 
 class RagaliQ:
     """
@@ -45,6 +62,14 @@ class RagaliQ:
         max_concurrency: int = 5,
         max_judge_concurrency: int = 20,
         fail_fast: bool = False,
+        cache_path: Path | str | None = None,
+        adaptive_concurrency: bool = False,
+        keep_raw_responses: bool = True,
+        batch_api: bool = False,
+        requests_per_minute: float | None = None,
+        input_tokens_per_minute: float | None = None,
+        num_loops: int = 1,
+        deduplicate: bool = False,
     ) -> None:
         """
         Initialize RagaliQ.
@@ -61,6 +86,44 @@ class RagaliQ:
                 bursts when evaluators process many claims/docs in parallel. Default: 20.
             fail_fast: If True, propagate evaluator exceptions immediately for debugging.
                 If False (default), convert errors to error-envelope results (robust batch mode).
+            cache_path: Optional SQLite file for a persistent judge response cache.
+                Identical judge requests are then served from disk across runs.
+                Only applies to transport-based judges (BaseJudge subclasses).
+            adaptive_concurrency: If True, judge API calls go through an AIMD limiter
+                that starts low, ramps up to max_judge_concurrency while calls succeed,
+                halves on 429/529 overload errors and retries them (in place of the
+                Claude transport's own 429/529 retries). Only applies to
+                transport-based judges.
+            keep_raw_responses: If False, drop each evaluator's raw judge payload
+                (claim verdicts, per-doc scores) from `details[...]["raw"]`, keeping
+                only score, reasoning, and pass/fail. Cuts result memory on large batches.
+            batch_api: If True, judge calls in flight together are submitted as one
+                provider batch (Anthropic Message Batches): discounted, but each batch
+                can take minutes to hours. max_judge_concurrency is lifted so every
+                call in flight joins the batch; raise max_concurrency so more test
+                cases share one. Only applies to judges whose transport supports
+                `send_batch()`.
+            requests_per_minute: Optional client-side cap on judge requests per minute,
+                paced with a token bucket so calls stay under the provider quota
+                instead of hitting 429s. Only applies to transport-based judges.
+            input_tokens_per_minute: Optional client-side cap on judge input tokens per
+                minute (estimated from prompt length). Only applies to transport-based
+                judges.
+            num_loops: Number of threads, each running its own event loop and judge
+                client, that `evaluate_batch()` shards test cases across. Only speeds
+                up CPU-bound per-case work (JSON parsing, validation) on a
+                free-threaded build (python3.14t with PYTHON_GIL=0). Concurrency caps
+                and rate limits are split between loops so they still sum to the
+                configured values, so no more loops run than `max_concurrency` or
+                `max_judge_concurrency` allow. Loops share one judge cache. Requires a judge the
+                runner creates itself (judge="claude"), since a judge instance cannot
+                be shared between event loops.
+            deduplicate: If True, `evaluate_batch_async()` judges test cases with
+                the same content (query, context, response, expected fields) once,
+                even when their ids differ, and copies the result to each repeat
+                with `judge_tokens_used=0`. Off by default because it assumes
+                evaluators read only those fields. Ignored when the judge samples
+                (temperature > 0).
         """
         self.evaluator_names = evaluators or ["faithfulness", "relevance"]
         self.default_threshold = default_threshold
@@ -69,16 +132,28 @@ class RagaliQ:
         self.fail_fast = fail_fast
         self._judge_config = judge_config
         self._api_key = api_key
+        self.cache_path = cache_path
+        self.adaptive_concurrency = adaptive_concurrency
+        self.keep_raw_responses = keep_raw_responses
+        self.batch_api = batch_api
+        self.requests_per_minute = requests_per_minute
+        self.input_tokens_per_minute = input_tokens_per_minute
+        self.num_loops = num_loops
+        self.deduplicate = deduplicate
+        self._judge_cache: JudgeCache | None = None
+        self._owns_judge_cache = False
 
         if isinstance(judge, LLMJudge):
             self._judge: LLMJudge | None = judge
             self.judge_type: Literal["claude", "openai"] | None = None
+            self._attach_middleware(judge)
         else:
             self._judge = None
             self.judge_type = judge
 
         self._evaluators: list[Evaluator] = []
         self._init_lock = threading.Lock()
+        self._loop = CachedLoopRunner()
 
     def __repr__(self) -> str:
         return f"RagaliQ(judge_type={self.judge_type!r}, evaluators={self.evaluator_names!r})"
@@ -92,11 +167,15 @@ class RagaliQ:
 
         match self.judge_type:
             case "claude":
-                self._judge = ClaudeJudge(
+                judge = ClaudeJudge(
                     config=self._judge_config,
                     api_key=self._api_key,
                     max_concurrency=self.max_judge_concurrency,
                 )
+                self._attach_middleware(judge)
+                # Assign last: _ensure_initialized() reads _judge without the lock, and
+                # after aclose() the evaluators are already set, so this opens the fast path.
+                self._judge = judge
             case "openai":
                 raise NotImplementedError(
                     "The OpenAI judge is not implemented. "
@@ -106,6 +185,80 @@ class RagaliQ:
             case _:
                 raise ValueError(f"Unknown judge type: {self.judge_type}")
 
+    def _attach_middleware(self, judge: LLMJudge) -> None:
+        """Wrap the judge's transport with the configured batching, limiters, and cache.
+
+        The cache goes outermost so cache hits never take a limiter slot, rate
+        budget, or batch entry.
+        """
+        rate_limited = (
+            self.requests_per_minute is not None or self.input_tokens_per_minute is not None
+        )
+        if (
+            self.cache_path is None
+            and not self.adaptive_concurrency
+            and not self.batch_api
+            and not rate_limited
+        ):
+            return
+
+        from ragaliq.judges.base_judge import BaseJudge
+
+        if not isinstance(judge, BaseJudge):
+            logger.warning(
+                "cache_path/adaptive_concurrency/batch_api/rate limits ignored: "
+                "%s does not use a pluggable transport",
+                type(judge).__name__,
+            )
+            return
+
+        provider = judge.transport
+        if self.batch_api:
+            from ragaliq.judges.batch import BatchCapableTransport, BatchingTransport
+
+            if isinstance(judge.transport, BatchCapableTransport):
+                judge.wrap_transport(BatchingTransport(judge.transport))
+                # A cap on in-flight calls would cap the batch size too.
+                judge.set_max_concurrency(None)
+            else:
+                logger.warning(
+                    "batch_api ignored: %s does not support send_batch()",
+                    type(judge.transport).__name__,
+                )
+
+        if rate_limited:
+            from ragaliq.judges.rate_limit import RateLimitedTransport
+
+            judge.wrap_transport(
+                RateLimitedTransport(
+                    judge.transport,
+                    requests_per_minute=self.requests_per_minute,
+                    input_tokens_per_minute=self.input_tokens_per_minute,
+                )
+            )
+
+        if self.adaptive_concurrency:
+            from ragaliq.judges.adaptive import AdaptiveConcurrencyLimiter, AdaptiveTransport
+            from ragaliq.judges.transport import ClaudeTransport
+
+            if isinstance(provider, ClaudeTransport):
+                # The limiter retries overloads itself; tenacity retrying them too
+                # would multiply the attempts per overloaded call.
+                provider.retry_overloaded = False
+
+            limiter = AdaptiveConcurrencyLimiter(
+                initial=min(4, self.max_judge_concurrency), maximum=self.max_judge_concurrency
+            )
+            judge.wrap_transport(AdaptiveTransport(judge.transport, limiter))
+
+        if self.cache_path is not None:
+            from ragaliq.judges.cache import CachingTransport, JudgeCache
+
+            if self._judge_cache is None:
+                self._judge_cache = JudgeCache(self.cache_path)
+                self._owns_judge_cache = True
+            judge.wrap_transport(CachingTransport(judge.transport, self._judge_cache))
+
     def _init_evaluators(self) -> None:
         """Initialize evaluators based on configuration."""
         if self._evaluators:
@@ -113,9 +266,11 @@ class RagaliQ:
 
         from ragaliq.evaluators import get_evaluator
 
-        for name in self.evaluator_names:
-            evaluator_class = get_evaluator(name)
-            self._evaluators.append(evaluator_class(threshold=self.default_threshold))
+        # Publish the complete list in one assignment: _ensure_initialized() reads
+        # it without the lock.
+        self._evaluators = [
+            get_evaluator(name)(threshold=self.default_threshold) for name in self.evaluator_names
+        ]
 
     async def _ensure_initialized(self) -> None:
         """
@@ -125,8 +280,13 @@ class RagaliQ:
         concurrent calls (or repeated sync calls across different event loops)
         attempt initialization. Threading lock is used instead of asyncio.Lock
         to avoid loop-binding issues when the same runner is used across
-        multiple asyncio.run() calls.
+        multiple asyncio.run() calls. Once initialized, calls return without
+        taking the lock. That is safe because the judge is assigned only after
+        its middleware is attached (also when it is re-created after `aclose()`),
+        and the evaluator list is published in one assignment.
         """
+        if self._judge is not None and self._evaluators:
+            return
         with self._init_lock:
             self._init_judge()
             self._init_evaluators()
@@ -141,9 +301,12 @@ class RagaliQ:
         Returns:
             RAGTestResult with all metric scores.
         """
-        start_time = time.perf_counter()
-
         await self._ensure_initialized()
+        return await self._evaluate_case(test_case)
+
+    async def _evaluate_case(self, test_case: RAGTestCase) -> RAGTestResult:
+        """Run every evaluator on one test case; requires `_ensure_initialized()` first."""
+        start_time = time.perf_counter()
 
         if self._judge is None:
             raise RuntimeError("Judge must be initialized before evaluation")
@@ -179,15 +342,18 @@ class RagaliQ:
                 )
                 return evaluator.name, error_result
 
-        eval_tasks = [_run_evaluator(ev) for ev in self._evaluators]
-        results = await asyncio.gather(*eval_tasks)
+        if len(self._evaluators) == 1:
+            # Nothing to overlap: run inline rather than wrapping it in a gather() task.
+            results = [await _run_evaluator(self._evaluators[0])]
+        else:
+            results = await asyncio.gather(*(_run_evaluator(ev) for ev in self._evaluators))
 
         for evaluator_name, result in results:
             scores[evaluator_name] = result.score
             details[evaluator_name] = {
                 "reasoning": result.reasoning,
                 "passed": result.passed,
-                "raw": result.raw_response,
+                "raw": result.raw_response if self.keep_raw_responses else {},
             }
             if result.error:
                 details[evaluator_name]["error"] = result.error
@@ -227,52 +393,180 @@ class RagaliQ:
             RAGTestResult with all metric scores.
 
         Note:
-            This method calls asyncio.run() internally and cannot be used from
+            This method runs its own event loop and cannot be used from
             within a running event loop (e.g. FastAPI route handlers, Jupyter
             notebooks, or async test functions). Use evaluate_async() instead
             in those contexts.
         """
-        return asyncio.run(self.evaluate_async(test_case))
+        return self._loop.run(self.evaluate_async(test_case))
 
     async def evaluate_batch_async(
-        self, test_cases: list[RAGTestCase], max_concurrency: int | None = None
+        self,
+        test_cases: list[RAGTestCase],
+        max_concurrency: int | None = None,
+        on_result: Callable[[RAGTestResult], None] | None = None,
     ) -> list[RAGTestResult]:
         """
         Evaluate multiple test cases asynchronously.
 
+        With `deduplicate=True`, test cases with the same content (query, context,
+        response, expected answer and facts) are judged once, whatever their id,
+        name or tags. Each repeat gets a copy of the result bound to its own test
+        case, with `judge_tokens_used=0`. Repeats of a case that ended in ERROR
+        are evaluated on their own. Not applied when the judge
+        samples (temperature > 0), where repeats are independent draws.
+
         Args:
             test_cases: List of test cases to evaluate.
             max_concurrency: Optional override for maximum concurrent evaluations.
+            on_result: Optional callback invoked with each result as soon as it is
+                ready (completion order), e.g. to advance a progress bar or write
+                results incrementally. To consume a lazy source in completion
+                order instead, use `evaluate_stream_async()`.
 
         Returns:
             List of RAGTestResults in the same order.
         """
         concurrency = max_concurrency if max_concurrency is not None else self.max_concurrency
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def bounded_evaluate(tc: RAGTestCase) -> RAGTestResult:
-            async with semaphore:
-                try:
-                    return await self.evaluate_async(tc)
-                except Exception as exc:
-                    if self.fail_fast:
-                        logger.error(
-                            "Batch evaluation failed for test case '%s' (fail_fast=True)", tc.id
-                        )
-                        raise
-
-                    logger.exception("Batch evaluation failed for test case '%s'", tc.id)
-                    return RAGTestResult(
-                        test_case=tc,
-                        status=EvalStatus.ERROR,
-                        scores={},
-                        details={"error": f"{type(exc).__name__}: {exc}"},
-                        execution_time_ms=0,
-                        judge_tokens_used=0,
-                    )
-
-        tasks = [bounded_evaluate(tc) for tc in test_cases]
-        return await asyncio.gather(*tasks)
+        evaluate = await self._prepare_batch()
+        results: list[RAGTestResult | None] = [None] * len(test_cases)
+
+        config = getattr(self._judge, "config", None)
+        sampled = isinstance(config, JudgeConfig) and config.temperature > 0
+        if self.deduplicate and not sampled:
+            first_seen: dict[str, int] = {}
+            first_index = [
+                first_seen.setdefault(tc.model_dump_json(include=_CONTENT_FIELDS), i)
+                for i, tc in enumerate(test_cases)
+            ]
+        else:
+            first_index = list(range(len(test_cases)))
+
+        async def run(indices: list[int]) -> None:
+            # Workers pull from one shared iterator, so a batch holds `concurrency`
+            # tasks however many cases it has, rather than one parked task per case.
+            queue = iter(indices)
+
+            async def worker() -> None:
+                for i in queue:
+                    results[i] = result = await self._evaluate_enveloped(test_cases[i], evaluate)
+                    if on_result is not None:
+                        on_result(result)
+
+            workers = [
+                asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(indices)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                # fail_fast raised in one worker: stop the others picking up more cases.
+                for task in workers:
+                    task.cancel()
+
+        await run([i for i, first in enumerate(first_index) if first == i])
+
+        errored: list[int] = []
+        for i, first in enumerate(first_index):
+            if first == i:
+                continue
+            original = cast(RAGTestResult, results[first])
+            if original.status == EvalStatus.ERROR:
+                # Errors are often transient (timeouts, overload): give each repeat its own try.
+                errored.append(i)
+                continue
+            results[i] = duplicate = original.model_copy(
+                update={"test_case": test_cases[i], "judge_tokens_used": 0}, deep=True
+            )
+            if on_result is not None:
+                on_result(duplicate)
+        if errored:
+            await run(errored)
+        return cast(list[RAGTestResult], results)
+
+    async def evaluate_stream_async(
+        self,
+        test_cases: Iterable[RAGTestCase] | AsyncIterable[RAGTestCase],
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[RAGTestResult]:
+        """
+        Evaluate test cases as they are produced, yielding each result when it completes.
+
+        At most `max_concurrency` cases are pulled from `test_cases` and in flight at
+        once, so memory is bounded by the concurrency rather than the dataset size
+        when the source is lazy (e.g. `DatasetLoader.iter_load`) and the caller
+        handles results as they arrive. Errors follow the same fail_fast/error-envelope
+        rules as `evaluate_batch_async`.
+
+        Args:
+            test_cases: Sync or async iterable of test cases; consumed lazily.
+            max_concurrency: Optional override for maximum concurrent evaluations.
+
+        Yields:
+            RAGTestResults in completion order (not input order).
+
+        Example:
+            >>> async for result in tester.evaluate_stream_async(DatasetLoader.iter_load(path)):
+            ...     print(result.test_case.id, result.status)
+        """
+        concurrency = max_concurrency if max_concurrency is not None else self.max_concurrency
+        evaluate = await self._prepare_batch()
+        source = aiter(_as_async_iterable(test_cases))
+        pending: set[asyncio.Task[RAGTestResult]] = set()
+        exhausted = False
+
+        try:
+            while True:
+                while not exhausted and len(pending) < concurrency:
+                    try:
+                        tc = await anext(source)
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(asyncio.ensure_future(self._evaluate_enveloped(tc, evaluate)))
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # Consumer stopped early or fail_fast raised: don't leave cases running.
+            for task in pending:
+                task.cancel()
+
+    async def _prepare_batch(self) -> Callable[[RAGTestCase], Awaitable[RAGTestResult]]:
+        """Initialize once for a multi-case run and return the per-case coroutine function."""
+        # Initialize up front instead of re-entering the init lock per test case.
+        try:
+            await self._ensure_initialized()
+        except Exception:
+            if self.fail_fast:
+                raise
+            # Let each test case report the init failure in its own error envelope.
+            return self.evaluate_async
+        return self._evaluate_case
+
+    async def _evaluate_enveloped(
+        self,
+        tc: RAGTestCase,
+        evaluate: Callable[[RAGTestCase], Awaitable[RAGTestResult]],
+    ) -> RAGTestResult:
+        """Run `evaluate(tc)`, converting failures to an ERROR result unless fail_fast."""
+        try:
+            return await evaluate(tc)
+        except Exception as exc:
+            if self.fail_fast:
+                logger.error("Batch evaluation failed for test case '%s' (fail_fast=True)", tc.id)
+                raise
+
+            logger.exception("Batch evaluation failed for test case '%s'", tc.id)
+            return RAGTestResult(
+                test_case=tc,
+                status=EvalStatus.ERROR,
+                scores={},
+                details={"error": f"{type(exc).__name__}: {exc}"},
+                execution_time_ms=0,
+                judge_tokens_used=0,
+            )
 
     def evaluate_batch(self, test_cases: list[RAGTestCase]) -> list[RAGTestResult]:
         """
@@ -285,8 +579,123 @@ class RagaliQ:
             List of RAGTestResults in the same order.
 
         Note:
-            This method calls asyncio.run() internally and cannot be used from
+            This method runs its own event loop and cannot be used from
             within a running event loop. Use evaluate_batch_async() instead
             in async contexts (FastAPI, Jupyter, async test functions).
         """
-        return asyncio.run(self.evaluate_batch_async(test_cases))
+        if self.num_loops > 1 and len(test_cases) > 1:
+            if self.judge_type is not None:
+                return self._evaluate_sharded(test_cases)
+            logger.warning(
+                "num_loops ignored: an injected judge cannot be shared between event loops"
+            )
+        return self._loop.run(self.evaluate_batch_async(test_cases))
+
+    def _evaluate_sharded(self, test_cases: list[RAGTestCase]) -> list[RAGTestResult]:
+        """Split `test_cases` into contiguous shards, each evaluated on its own thread and loop."""
+        num_shards = min(
+            self.num_loops, len(test_cases), self.max_concurrency, self.max_judge_concurrency
+        )
+        shard_size = math.ceil(len(test_cases) / num_shards)
+        shards = [test_cases[i : i + shard_size] for i in range(0, len(test_cases), shard_size)]
+
+        cache = None
+        if self.cache_path is not None:
+            from ragaliq.judges.cache import JudgeCache
+
+            # One connection for every shard: JudgeCache is safe to share across threads.
+            cache = JudgeCache(self.cache_path)
+
+        def run_shard(index: int) -> list[RAGTestResult]:
+            runner = self._shard_runner(len(shards), index, cache)
+            return asyncio.run(runner._evaluate_and_close(shards[index]))
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="ragaliq") as pool:
+                return [
+                    result for shard in pool.map(run_shard, range(len(shards))) for result in shard
+                ]
+        finally:
+            if cache is not None:
+                cache.close()
+
+    def _shard_runner(
+        self, num_shards: int, index: int = 0, cache: JudgeCache | None = None
+    ) -> RagaliQ:
+        """Build a runner with this configuration and shard `index`'s share of its limits.
+
+        Integer caps are split so the shares sum to the cap (the first `cap % num_shards`
+        shards get one extra), with a floor of 1. Per-minute quotas split evenly.
+        """
+
+        def share(limit: float | None) -> float | None:
+            return None if limit is None else limit / num_shards
+
+        def split(cap: int) -> int:
+            base, extra = divmod(cap, num_shards)
+            return max(1, base + (index < extra))
+
+        runner = RagaliQ(
+            judge=self.judge_type or "claude",
+            evaluators=self.evaluator_names,
+            default_threshold=self.default_threshold,
+            judge_config=self._judge_config,
+            api_key=self._api_key,
+            max_concurrency=split(self.max_concurrency),
+            max_judge_concurrency=split(self.max_judge_concurrency),
+            fail_fast=self.fail_fast,
+            cache_path=self.cache_path,
+            adaptive_concurrency=self.adaptive_concurrency,
+            keep_raw_responses=self.keep_raw_responses,
+            batch_api=self.batch_api,
+            requests_per_minute=share(self.requests_per_minute),
+            input_tokens_per_minute=share(self.input_tokens_per_minute),
+            deduplicate=self.deduplicate,
+        )
+        runner._judge_cache = cache
+        return runner
+
+    async def _evaluate_and_close(self, test_cases: list[RAGTestCase]) -> list[RAGTestResult]:
+        """Evaluate a batch, then close the judge client on the same loop."""
+        try:
+            return await self.evaluate_batch_async(test_cases)
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and judge cache of a judge this runner created.
+
+        Safe to call more than once. A judge passed in by the caller is left open
+        (the caller owns it), along with the cache wrapped around it, which that
+        judge keeps using. The next evaluation after aclose() lazily creates a
+        fresh judge and cache.
+        """
+        if self.judge_type is None or self._judge is None:
+            return
+        judge, self._judge = self._judge, None
+        aclose = getattr(judge, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        if self._owns_judge_cache and self._judge_cache is not None:
+            cache, self._judge_cache = self._judge_cache, None
+            self._owns_judge_cache = False
+            await asyncio.to_thread(cache.close)
+
+    def close(self) -> None:
+        """Close the judge client and cache, and the event loop cached for sync calls.
+
+        Safe to call more than once. Async callers should use `aclose()` instead.
+        """
+        self._loop.close(teardown=self.aclose)
+
+
+async def _as_async_iterable(
+    items: Iterable[RAGTestCase] | AsyncIterable[RAGTestCase],
+) -> AsyncIterator[RAGTestCase]:
+    """Adapt a sync or async iterable of test cases to an async iterator."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
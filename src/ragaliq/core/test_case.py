@@ -90,4 +90,6 @@ class RAGTestResult(BaseModel):
         """Get score for a specific metric."""
         return self.scores.get(metric)
 
-    model_config = {"frozen": False, "extra": "forbid"}
+    # The runner builds one result per case around an already-validated test case;
+    # keep it by reference rather than re-validating (and copying) it.
+    model_config = {"frozen": False, "extra": "forbid", "revalidate_instances": "never"}
@@ -4,10 +4,11 @@ This module provides TestCaseGenerator, which synthesizes RAGTestCase objects
 from raw documents by using an LLM judge to generate questions and answers.
 """
 
-import asyncio
+import os
 import uuid
 from typing import TYPE_CHECKING
 
+from ragaliq.core._sync import CachedLoopRunner
 from ragaliq.core.test_case import RAGTestCase
 
 if TYPE_CHECKING:
@@ -19,7 +20,7 @@ class TestCaseGenerator:
     Generates RAGTestCase objects from documents using an LLM judge.
 
     The generator uses the judge to produce questions grounded in the provided
-    documents, then generates reference answers for those questions. This
+    documents together with reference answers for those questions. This
     creates a synthetic test dataset without requiring manual annotation.
 
     The judge is injected via method parameter (consistent with the Evaluator
@@ -35,6 +36,11 @@ class TestCaseGenerator:
         )
     """
 
+    __test__ = False  # "Test" prefix, but not a pytest test class
+
+    def __init__(self) -> None:
+        self._loop = CachedLoopRunner()
+
     async def generate_from_documents(
         self,
         documents: list[str],
@@ -44,9 +50,10 @@ class TestCaseGenerator:
         """
         Generate n test cases from the provided documents.
 
-        Generates questions grounded in the documents, then produces
-        corresponding answers using only the document content. Answer
-        generation runs in parallel for all questions.
+        Asks the judge for question/answer pairs via `generate_qa_pairs`, with
+        answers using only the document content. `BaseJudge` judges produce all
+        pairs in one call, or in successive calls when n exceeds one call's
+        output budget.
 
         Args:
             documents: Source documents to generate test cases from.
@@ -65,24 +72,21 @@ class TestCaseGenerator:
         if n < 1:
             raise ValueError("n must be at least 1")
 
-        questions_result = await judge.generate_questions(documents, n)
-        questions = questions_result.questions[:n]  # trim if the judge over-generated
-
-        answer_tasks = [judge.generate_answer(question=q, context=documents) for q in questions]
-        answer_results = await asyncio.gather(*answer_tasks)
+        qa_result = await judge.generate_qa_pairs(documents, n)
+        pairs = qa_result.pairs[:n]  # trim if the judge over-generated
+        # One urandom read for every ID instead of one per uuid4() call.
+        entropy = os.urandom(16 * len(pairs))
 
         return [
             RAGTestCase(
-                id=str(uuid.uuid4()),
-                name=_derive_name(question, i),
-                query=question,
+                id=str(uuid.UUID(bytes=entropy[16 * (i - 1) : 16 * i], version=4)),
+                name=_derive_name(pair.question, i),
+                query=pair.question,
                 context=documents,
-                response=answer_result.answer,
+                response=pair.answer,
                 tags=["generated"],
             )
-            for i, (question, answer_result) in enumerate(
-                zip(questions, answer_results, strict=True), start=1
-            )
+            for i, pair in enumerate(pairs, start=1)
         ]
 
     def generate_from_documents_sync(
@@ -94,6 +98,10 @@ class TestCaseGenerator:
         """
         Synchronous wrapper for generate_from_documents.
 
+        Calls on the same generator share one cached event loop, so a judge
+        reused across calls keeps its HTTP connection pool instead of having it
+        bound to a loop that asyncio.run() already closed.
+
         Args:
             documents: Source documents to generate test cases from.
             n: Number of test cases to generate.
@@ -102,7 +110,11 @@ class TestCaseGenerator:
         Returns:
             List of RAGTestCase objects.
         """
-        return asyncio.run(self.generate_from_documents(documents=documents, n=n, judge=judge))
+        return self._loop.run(self.generate_from_documents(documents=documents, n=n, judge=judge))
+
+    def close(self) -> None:
+        """Close the event loop cached for sync calls. Safe to call more than once."""
+        self._loop.close()
 
 
 def _derive_name(question: str, index: int) -> str:
@@ -1,5 +1,6 @@
 """Dataset schemas for RagaliQ."""
 
+from collections import Counter
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -25,9 +26,9 @@ class DatasetSchema(BaseModel):
     @classmethod
     def validate_unique_ids(cls, v: list[RAGTestCase]) -> list[RAGTestCase]:
         """Ensure all test case IDs are unique."""
-        ids = [tc.id for tc in v]
-        if len(ids) != len(set(ids)):
-            duplicates = {tc_id for tc_id in ids if ids.count(tc_id) > 1}
+        counts = Counter(tc.id for tc in v)
+        duplicates = [tc_id for tc_id, count in counts.items() if count > 1]
+        if duplicates:
             raise ValueError(f"Duplicate test case IDs found: {duplicates}")
         return v
 
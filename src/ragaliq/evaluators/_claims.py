@@ -1,15 +1,18 @@
 """Shared claim verification pipeline (extract → verify → aggregate).
 
 Factored out of FaithfulnessEvaluator and HallucinationEvaluator so the
-claim-based flow lives in one place.
+claim-based flow lives in one place. When both metrics run on the same test
+case they start the identical pipeline concurrently; the second caller joins
+the first one's in-flight run instead of extracting and verifying again.
 """
 
 import asyncio
+import weakref
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
-from ragaliq.judges.base import ClaimVerdict
+from ragaliq.judges.base import ClaimVerdict, JudgeResponseError
 
 if TYPE_CHECKING:
     from ragaliq.judges.base import LLMJudge
@@ -37,6 +40,12 @@ class ClaimVerificationResult(BaseModel):
     model_config = {"frozen": True, "extra": "forbid"}
 
 
+# Per judge: (response, context) -> the run currently extracting/verifying it.
+_in_flight: weakref.WeakKeyDictionary[
+    LLMJudge, dict[tuple[str, tuple[str, ...]], asyncio.Task[ClaimVerificationResult]]
+] = weakref.WeakKeyDictionary()
+
+
 async def verify_all_claims(
     response: str,
     context: list[str],
@@ -45,11 +54,33 @@ async def verify_all_claims(
     """Extract atomic claims from `response` and verify each against `context`.
 
     Returns early (without an LLM call) when context is empty, and after
-    extraction when no claims are found.
+    extraction when no claims are found. Concurrent calls with the same judge,
+    response, and context share one run; joiners report zero tokens, since the
+    first caller already accounts for them.
 
     Returns:
         ClaimVerificationResult with per-claim details, verdicts, and token total.
     """
+    pending = _in_flight.setdefault(judge, {})
+    key = (response, tuple(context))
+    # Shielded so one caller's cancellation doesn't cancel the run others await.
+    task = pending.get(key)
+    if task is not None:
+        result = await asyncio.shield(task)
+        return result.model_copy(update={"total_tokens": 0})
+
+    task = asyncio.ensure_future(_verify_all_claims(response, context, judge))
+    pending[key] = task
+    task.add_done_callback(lambda _: pending.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _verify_all_claims(
+    response: str,
+    context: list[str],
+    judge: LLMJudge,
+) -> ClaimVerificationResult:
+    """Run extract → verify → aggregate once (see `verify_all_claims`)."""
     # No context ⇒ every claim is NOT_ENOUGH_INFO; skip the extract call to save tokens.
     if not context:
         return ClaimVerificationResult(context_empty=True)
@@ -61,17 +92,18 @@ async def verify_all_claims(
     if not claims:
         return ClaimVerificationResult(claims_empty=True, total_tokens=total_tokens)
 
-    verification_tasks = [judge.verify_claim(claim, context) for claim in claims]
-    verdicts = await asyncio.gather(*verification_tasks)
+    verified = await judge.verify_claims(claims, context)
+    verdicts = verified.verdicts
+    if len(verdicts) != len(claims):
+        raise JudgeResponseError(f"Expected {len(claims)} claim verdicts, got {len(verdicts)}")
 
     claim_details = [
-        ClaimDetail(claim=claims[i], verdict=verdict.verdict, evidence=verdict.evidence)
-        for i, verdict in enumerate(verdicts)
+        ClaimDetail(claim=claim, verdict=verdict.verdict, evidence=verdict.evidence)
+        for claim, verdict in zip(claims, verdicts, strict=True)
     ]
-    total_tokens += sum(verdict.tokens_used for verdict in verdicts)
 
     return ClaimVerificationResult(
         claim_details=claim_details,
-        verdicts=list(verdicts),
-        total_tokens=total_tokens,
+        verdicts=verdicts,
+        total_tokens=total_tokens + verified.tokens_used,
     )
@@ -23,8 +23,8 @@ _DOC_PREVIEW_LENGTH = 200
 class ContextPrecisionEvaluator(Evaluator):
     """Measures whether retrieved documents are relevant to the query.
 
-    Scores each document with the judge's `evaluate_relevance()` (treating the
-    document as the "response") and combines the scores with rank-based
+    Scores each distinct document with the judge's `evaluate_relevance()`
+    (treating the document as the "response") and combines the scores with rank-based
     weighting, so irrelevant high-ranked documents are penalized more.
     """
 
@@ -51,28 +51,33 @@ class ContextPrecisionEvaluator(Evaluator):
                 tokens_used=0,
             )
 
+        # Retrievers often return the same chunk more than once; judge each
+        # distinct document once and reuse its score at every rank it holds.
+        unique_docs = list(dict.fromkeys(test_case.context))
         scoring_tasks = [
-            judge.evaluate_relevance(query=test_case.query, response=doc)
-            for doc in test_case.context
+            judge.evaluate_relevance(query=test_case.query, response=doc) for doc in unique_docs
         ]
         results = await asyncio.gather(*scoring_tasks)
+        result_by_doc = dict(zip(unique_docs, results, strict=True))
+        total_tokens = sum(result.tokens_used for result in results)
 
+        # Rank-weighted precision: sum(score / rank) / sum(1 / rank), in one pass.
         doc_scores: list[dict[str, Any]] = []
-        total_tokens = 0
-        for i, result in enumerate(results):
-            total_tokens += result.tokens_used
+        weighted_sum = 0.0
+        weight_total = 0.0
+        for rank, doc in enumerate(test_case.context, start=1):
+            result = result_by_doc[doc]
+            weight = 1.0 / rank
+            weighted_sum += result.score * weight
+            weight_total += weight
             doc_scores.append(
                 {
-                    "rank": i + 1,
-                    "document": test_case.context[i][:_DOC_PREVIEW_LENGTH],
+                    "rank": rank,
+                    "document": doc[:_DOC_PREVIEW_LENGTH],
                     "score": result.score,
                     "reasoning": result.reasoning,
                 }
             )
-
-        # Rank-weighted precision: sum(score / rank) / sum(1 / rank).
-        weighted_sum = sum(d["score"] / d["rank"] for d in doc_scores)
-        weight_total = sum(1.0 / d["rank"] for d in doc_scores)
         score = weighted_sum / weight_total
 
         return EvaluationResult(
@@ -1,9 +1,12 @@
 """LLM Judges package for RagaliQ."""
 
+from ragaliq.judges.adaptive import AdaptiveConcurrencyLimiter, AdaptiveTransport
 from ragaliq.judges.base import (
     ClaimsResult,
     ClaimVerdict,
+    ClaimVerdictsResult,
     GeneratedAnswerResult,
+    GeneratedQAPairsResult,
     GeneratedQuestionsResult,
     JudgeAPIError,
     JudgeConfig,
@@ -11,24 +14,41 @@ from ragaliq.judges.base import (
     JudgeResponseError,
     JudgeResult,
     LLMJudge,
+    QAPair,
 )
 from ragaliq.judges.base_judge import BaseJudge
+from ragaliq.judges.batch import BatchCapableTransport, BatchingTransport
+from ragaliq.judges.cache import CachingTransport, JudgeCache
 from ragaliq.judges.claude import ClaudeJudge
 from ragaliq.judges.models import DEFAULT_JUDGE_MODEL, GOLD_STANDARD_JUDGE_MODEL
+from ragaliq.judges.rate_limit import RateLimitedTransport, TokenBucket
 from ragaliq.judges.trace import JudgeTrace, TraceCollector
-from ragaliq.judges.transport import ClaudeTransport, JudgeTransport, TransportResponse
+from ragaliq.judges.transport import (
+    ClaudeTransport,
+    JudgeTransport,
+    TransportRequest,
+    TransportResponse,
+)
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AdaptiveTransport",
     "BaseJudge",
+    "BatchCapableTransport",
+    "BatchingTransport",
+    "CachingTransport",
     "ClaimsResult",
     "ClaimVerdict",
+    "ClaimVerdictsResult",
     "ClaudeJudge",
     "ClaudeTransport",
     "DEFAULT_JUDGE_MODEL",
     "GeneratedAnswerResult",
+    "GeneratedQAPairsResult",
     "GeneratedQuestionsResult",
     "GOLD_STANDARD_JUDGE_MODEL",
     "JudgeAPIError",
+    "JudgeCache",
     "JudgeConfig",
     "JudgeError",
     "JudgeResponseError",
@@ -36,6 +56,10 @@ __all__ = [
     "JudgeTrace",
     "JudgeTransport",
     "LLMJudge",
+    "QAPair",
+    "RateLimitedTransport",
+    "TokenBucket",
     "TraceCollector",
+    "TransportRequest",
     "TransportResponse",
 ]
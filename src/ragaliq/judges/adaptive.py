@@ -0,0 +1,172 @@
+"""Adaptive (AIMD) concurrency for judge API calls.
+
+`AdaptiveTransport` wraps any `JudgeTransport` and gates calls through an
+`AdaptiveConcurrencyLimiter`, which works like TCP congestion control: each
+success raises the limit additively (about +1 per limit's worth of calls), and
+each overload response (HTTP 429/529 surfaced as `JudgeAPIError`) halves it.
+The overloaded call is then retried after a pause. Healthy APIs ramp up to the
+ceiling, and saturated ones are backed off instead of hammered.
+"""
+
+import asyncio
+from collections import deque
+from types import TracebackType
+
+from ragaliq.judges.base import JudgeAPIError
+from ragaliq.judges.models import DEFAULT_JUDGE_MODEL
+from ragaliq.judges.transport import OVERLOAD_STATUS_CODES, JudgeTransport, TransportResponse
+
+
+class AdaptiveConcurrencyLimiter:
+    """Async limiter whose capacity follows additive-increase/multiplicative-decrease.
+
+    Waiters are plain futures created on the running loop, so one limiter can be
+    reused across the fresh event loops of repeated sync `evaluate()` calls.
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 64,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        """Configure the limiter bounds.
+
+        Args:
+            initial: Starting concurrency limit.
+            minimum: Floor the limit never drops below.
+            maximum: Ceiling the limit never grows past.
+            backoff_factor: Multiplier applied to the limit on overload (0 < f < 1).
+
+        Raises:
+            ValueError: If the bounds are inconsistent.
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError(
+                f"Expected 1 <= minimum <= initial <= maximum, got {minimum}, {initial}, {maximum}"
+            )
+        if not 0.0 < backoff_factor < 1.0:
+            raise ValueError(f"backoff_factor must be in (0, 1), got {backoff_factor}")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff_factor = backoff_factor
+        self._limit = float(initial)
+        self._in_use = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_use(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_use
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        while self._in_use >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done():
+                    # Woken but cancelled before taking the slot: pass the wake-up on.
+                    self._wake()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        self._in_use += 1
+
+    def release(self) -> None:
+        """Return a slot and wake a waiter if the limit allows."""
+        self._in_use -= 1
+        self._wake()
+
+    def on_success(self) -> None:
+        """Additively grow the limit after a successful call."""
+        self._limit = min(float(self.maximum), self._limit + 1.0 / self._limit)
+        self._wake()
+
+    def on_overload(self) -> None:
+        """Multiplicatively shrink the limit after an overload response."""
+        self._limit = max(float(self.minimum), self._limit * self.backoff_factor)
+
+    def _wake(self) -> None:
+        free = self.limit - self._in_use
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self.limit}, in_use={self._in_use}, "
+            f"minimum={self.minimum}, maximum={self.maximum})"
+        )
+
+
+class AdaptiveTransport:
+    """Transport wrapper that adapts concurrency to judge overload and retries.
+
+    Example:
+        judge.wrap_transport(AdaptiveTransport(judge.transport, AdaptiveConcurrencyLimiter()))
+    """
+
+    def __init__(
+        self,
+        inner: JudgeTransport,
+        limiter: AdaptiveConcurrencyLimiter,
+        max_retries: int = 8,
+        retry_interval: float = 1.0,
+    ) -> None:
+        self._inner = inner
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+
+    async def send(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = DEFAULT_JUDGE_MODEL,
+        temperature: float = 0.0,
+        max_tokens: int = 1024,
+    ) -> TransportResponse:
+        """Send through the limiter, backing off and retrying on overload responses.
+
+        Raises:
+            JudgeAPIError: Non-overload API errors immediately, or the last overload
+                error once `max_retries` is exhausted.
+        """
+        attempt = 0
+        while True:
+            async with self.limiter:
+                try:
+                    response = await self._inner.send(
+                        system_prompt, user_prompt, model, temperature, max_tokens
+                    )
+                except JudgeAPIError as e:
+                    if e.status_code not in OVERLOAD_STATUS_CODES or attempt >= self.max_retries:
+                        raise
+                    self.limiter.on_overload()
+                else:
+                    self.limiter.on_success()
+                    return response
+            attempt += 1
+            await asyncio.sleep(self.retry_interval)
@@ -4,6 +4,7 @@ Defines the `LLMJudge` ABC that every provider (Claude, OpenAI, ...) implements,
 plus the frozen Pydantic result models and the judge exception hierarchy.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Literal
 
@@ -56,6 +57,15 @@ class ClaimsResult(BaseModel):
     model_config = {"frozen": True, "extra": "forbid"}
 
 
+class ClaimVerdictsResult(BaseModel):
+    """Verdicts for a list of claims, in claim order, with total token usage."""
+
+    verdicts: list[ClaimVerdict] = Field(default_factory=list, description="One per claim")
+    tokens_used: int = Field(default=0, ge=0, description="Tokens used")
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
+
 class GeneratedQuestionsResult(BaseModel):
     """Questions generated from documents, with token usage."""
 
@@ -74,6 +84,24 @@ class GeneratedAnswerResult(BaseModel):
     model_config = {"frozen": True, "extra": "forbid"}
 
 
+class QAPair(BaseModel):
+    """A generated question and its context-grounded answer."""
+
+    question: str = Field(..., description="Generated question")
+    answer: str = Field(default="", description="Answer grounded in the documents")
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
+
+class GeneratedQAPairsResult(BaseModel):
+    """Question/answer pairs generated from documents, with token usage."""
+
+    pairs: list[QAPair] = Field(default_factory=list, description="Generated pairs")
+    tokens_used: int = Field(default=0, ge=0, description="Tokens used")
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
+
 class JudgeError(Exception):
     """Base exception for judge operations."""
 
@@ -245,3 +273,65 @@ class LLMJudge(ABC):
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.config.model!r})"
+
+    async def generate_qa_pairs(
+        self,
+        documents: list[str],
+        n: int,
+    ) -> GeneratedQAPairsResult:
+        """Generate `n` questions grounded in the documents, each with an answer.
+
+        The default implementation calls `generate_questions` once, then
+        `generate_answer` once per question. Judges that can produce both in a
+        single call (such as `BaseJudge`) override this.
+
+        Args:
+            documents: Source documents to generate pairs from.
+            n: Number of pairs to generate.
+
+        Returns:
+            GeneratedQAPairsResult containing the pairs.
+
+        Raises:
+            JudgeAPIError: If the LLM API call fails.
+            JudgeResponseError: If the response cannot be parsed.
+        """
+        questions_result = await self.generate_questions(documents, n)
+        questions = questions_result.questions[:n]
+        answers = await asyncio.gather(
+            *(self.generate_answer(question=q, context=documents) for q in questions)
+        )
+        return GeneratedQAPairsResult(
+            pairs=[
+                QAPair(question=q, answer=a.answer) for q, a in zip(questions, answers, strict=True)
+            ],
+            tokens_used=questions_result.tokens_used + sum(a.tokens_used for a in answers),
+        )
+
+    async def verify_claims(
+        self,
+        claims: list[str],
+        context: list[str],
+    ) -> ClaimVerdictsResult:
+        """Verify several claims against the same context.
+
+        The default implementation calls `verify_claim` once per claim,
+        concurrently. Judges that can verify many claims in a single call
+        override this to send the context once.
+
+        Args:
+            claims: The atomic claims to verify.
+            context: List of context documents to check against.
+
+        Returns:
+            ClaimVerdictsResult with one verdict per claim, in claim order.
+
+        Raises:
+            JudgeAPIError: If the LLM API call fails.
+            JudgeResponseError: If the response cannot be parsed.
+        """
+        verdicts = await asyncio.gather(*(self.verify_claim(claim, context) for claim in claims))
+        return ClaimVerdictsResult(
+            verdicts=list(verdicts),
+            tokens_used=sum(verdict.tokens_used for verdict in verdicts),
+        )
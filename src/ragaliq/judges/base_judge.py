@@ -6,34 +6,44 @@ pluggable transport. Concrete classes (ClaudeJudge, OpenAIJudge) supply transpor
 """
 
 import asyncio
-import json
 import logging
 import time
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from pydantic_core import from_json
+
 from ragaliq.judges.base import (
     ClaimsResult,
     ClaimVerdict,
     GeneratedAnswerResult,
+    GeneratedQAPairsResult,
     GeneratedQuestionsResult,
     JudgeConfig,
     JudgeResponseError,
     JudgeResult,
     LLMJudge,
+    QAPair,
 )
-from ragaliq.judges.prompts.loader import get_prompt
+from ragaliq.judges.prompts.loader import get_prompt, get_system_prompt
+from ragaliq.judges.trace import JudgeTrace
+from ragaliq.judges.transport import CHARS_PER_TOKEN_ESTIMATE, JudgeTransport
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from ragaliq.judges.trace import TraceCollector
-    from ragaliq.judges.transport import JudgeTransport
 
 
-_CHARS_PER_TOKEN_ESTIMATE = 4
 _DEFAULT_INPUT_TOKEN_WARN_THRESHOLD = 100_000
 _ERROR_PREVIEW_LENGTH = 200
+# Output budget per generated question/answer pair, so a large `n` isn't cut off
+# at the configured max_tokens mid-JSON.
+_QA_PAIR_OUTPUT_TOKENS = 200
+# Largest output budget one generation call asks for: every Claude judge model
+# accepts 8192. A larger `n` is split across calls of at most 40 pairs each.
+_QA_MAX_OUTPUT_TOKENS = 8192
 
 
 class BaseJudge(LLMJudge):
@@ -67,7 +77,9 @@ class BaseJudge(LLMJudge):
         super().__init__(config)
         self._transport = transport
         self._trace_collector = trace_collector
-        self._concurrency_limit = asyncio.Semaphore(max_concurrency)
+        self._concurrency_limit: AbstractAsyncContextManager[Any] = asyncio.Semaphore(
+            max_concurrency
+        )
 
     @property
     def transport(self) -> JudgeTransport:
@@ -82,11 +94,28 @@ class BaseJudge(LLMJudge):
         """
         self._transport = wrapper
 
+    def set_max_concurrency(self, max_concurrency: int | None) -> None:
+        """Replace the cap on concurrent API calls.
+
+        Args:
+            max_concurrency: New cap, or None to remove it, e.g. when the transport
+                queues calls into provider batches and every call should join one.
+        """
+        self._concurrency_limit = (
+            nullcontext() if max_concurrency is None else asyncio.Semaphore(max_concurrency)
+        )
+
     async def _call_llm(
-        self, system_prompt: str, user_prompt: str, operation: str = "llm_call"
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        operation: str = "llm_call",
+        max_tokens: int | None = None,
     ) -> tuple[str, int]:
         """Call the transport once, emitting a trace (on success or failure) if configured.
 
+        `max_tokens` overrides the configured response cap for this call.
+
         Returns:
             Tuple of (response_text, tokens_used).
         """
@@ -94,7 +123,7 @@ class BaseJudge(LLMJudge):
         success = False
         error_msg = None
 
-        estimated_tokens = (len(system_prompt) + len(user_prompt)) // _CHARS_PER_TOKEN_ESTIMATE
+        estimated_tokens = (len(system_prompt) + len(user_prompt)) // CHARS_PER_TOKEN_ESTIMATE
         if estimated_tokens > _DEFAULT_INPUT_TOKEN_WARN_THRESHOLD:
             logger.warning(
                 "Large input detected for '%s': ~%d estimated tokens "
@@ -113,7 +142,7 @@ class BaseJudge(LLMJudge):
                     user_prompt=user_prompt,
                     model=self.config.model,
                     temperature=self.config.temperature,
-                    max_tokens=self.config.max_tokens,
+                    max_tokens=max_tokens or self.config.max_tokens,
                 )
             tokens_used = response.input_tokens + response.output_tokens
             success = True
@@ -125,8 +154,6 @@ class BaseJudge(LLMJudge):
 
         finally:
             if self._trace_collector is not None:
-                from ragaliq.judges.trace import JudgeTrace
-
                 latency_ms = int((time.perf_counter() - start_time) * 1000)
                 # The response's model may differ from the configured one.
                 if success:
@@ -166,9 +193,10 @@ class BaseJudge(LLMJudge):
             cleaned = "\n".join(lines)
 
         try:
-            result: dict[str, Any] = json.loads(cleaned)
+            # pydantic-core's Rust parser: same results as json.loads, less CPU per call.
+            result: dict[str, Any] = from_json(cleaned)
             return result
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise JudgeResponseError(
                 f"Failed to parse JSON response: {e}. Raw text: {text[:_ERROR_PREVIEW_LENGTH]}"
             ) from e
@@ -205,27 +233,46 @@ class BaseJudge(LLMJudge):
         template = get_prompt("faithfulness")
         formatted_context = template.format_context(context)
         user_prompt = template.format_user_prompt(context=formatted_context, response=response)
-        return template.build_system_prompt(), user_prompt
+        return get_system_prompt("faithfulness"), user_prompt
 
     def _build_relevance_prompt(self, query: str, response: str) -> tuple[str, str]:
         """Build (system, user) prompts for relevance evaluation."""
         template = get_prompt("relevance")
         user_prompt = template.format_user_prompt(query=query, response=response)
-        return template.build_system_prompt(), user_prompt
+        return get_system_prompt("relevance"), user_prompt
 
     def _build_generate_questions_prompt(self, documents: list[str], n: int) -> tuple[str, str]:
         """Build (system, user) prompts for question generation."""
         template = get_prompt("generate_questions")
         formatted_docs = template.format_context(documents)
         user_prompt = template.format_user_prompt(n=n, documents=formatted_docs)
-        return template.build_system_prompt(), user_prompt
+        return get_system_prompt("generate_questions"), user_prompt
+
+    def _build_generate_qa_pairs_prompt(
+        self, documents: list[str], n: int, exclude: list[str] | None = None
+    ) -> tuple[str, str]:
+        """Build (system, user) prompts for fused question and answer generation.
+
+        Questions in `exclude` (already generated by earlier calls) are listed
+        so the model asks new ones instead of repeating them.
+        """
+        template = get_prompt("generate_qa_pairs")
+        formatted_docs = template.format_context(documents)
+        user_prompt = template.format_user_prompt(n=n, documents=formatted_docs)
+        if exclude:
+            listed = "\n".join(f"- {question}" for question in exclude)
+            user_prompt += (
+                "\nDo not repeat or rephrase any of these already generated questions:\n\n"
+                f"<existing_questions>\n{listed}\n</existing_questions>\n"
+            )
+        return get_system_prompt("generate_qa_pairs"), user_prompt
 
     def _build_generate_answer_prompt(self, question: str, context: list[str]) -> tuple[str, str]:
         """Build (system, user) prompts for answer generation."""
         template = get_prompt("generate_answer")
         formatted_context = template.format_context(context)
         user_prompt = template.format_user_prompt(context=formatted_context, question=question)
-        return template.build_system_prompt(), user_prompt
+        return get_system_prompt("generate_answer"), user_prompt
 
     async def evaluate_faithfulness(self, response: str, context: list[str]) -> JudgeResult:
         """Score how faithful the response is to the context (0.0 if no context)."""
@@ -275,7 +322,7 @@ class BaseJudge(LLMJudge):
         template = get_prompt("extract_claims")
         user_prompt = template.format_user_prompt(response=response)
         raw_response, tokens_used = await self._call_llm(
-            template.build_system_prompt(), user_prompt, operation="extract_claims"
+            get_system_prompt("extract_claims"), user_prompt, operation="extract_claims"
         )
         parsed = self._parse_json_response(raw_response)
         claims = self._parse_string_list(parsed, "claims")
@@ -309,6 +356,76 @@ class BaseJudge(LLMJudge):
             answer = str(answer)
         return GeneratedAnswerResult(answer=answer, tokens_used=tokens_used)
 
+    async def generate_qa_pairs(self, documents: list[str], n: int) -> GeneratedQAPairsResult:
+        """Generate questions and their answers in one call (empty if no documents).
+
+        The documents are sent once instead of once per question plus once for
+        the question list. When `n` needs more output than one call can return,
+        calls are made one after another, each told which questions already
+        exist, until `n` distinct questions are collected or a call adds none.
+        A warning is logged when fewer than `n` pairs are returned.
+
+        Raises:
+            JudgeResponseError: If 'pairs' is not a list of question/answer objects.
+        """
+        if not documents or n <= 0:
+            return GeneratedQAPairsResult(pairs=[], tokens_used=0)
+
+        per_call = _QA_MAX_OUTPUT_TOKENS // _QA_PAIR_OUTPUT_TOKENS
+        seen: set[str] = set()
+        pairs: list[QAPair] = []
+        tokens_used = 0
+        while len(pairs) < n:
+            chunk = await self._generate_qa_pairs_once(
+                documents, min(per_call, n - len(pairs)), exclude=list(seen)
+            )
+            tokens_used += chunk.tokens_used
+            collected = len(pairs)
+            for pair in chunk.pairs:
+                if pair.question not in seen:
+                    seen.add(pair.question)
+                    pairs.append(pair)
+            # A short single call is final; a later call that adds nothing won't improve.
+            if n <= per_call or len(pairs) == collected:
+                break
+
+        if len(pairs) < n:
+            logger.warning(
+                "generate_qa_pairs: requested %d pairs but only %d distinct questions "
+                "were generated; the documents may not support more.",
+                n,
+                len(pairs),
+            )
+        return GeneratedQAPairsResult(pairs=pairs[:n], tokens_used=tokens_used)
+
+    async def _generate_qa_pairs_once(
+        self, documents: list[str], n: int, exclude: list[str] | None = None
+    ) -> GeneratedQAPairsResult:
+        """Generate up to `n` question/answer pairs with one call, avoiding `exclude`."""
+        system_prompt, user_prompt = self._build_generate_qa_pairs_prompt(documents, n, exclude)
+        raw_response, tokens_used = await self._call_llm(
+            system_prompt,
+            user_prompt,
+            operation="generate_qa_pairs",
+            max_tokens=max(self.config.max_tokens, n * _QA_PAIR_OUTPUT_TOKENS),
+        )
+        parsed = self._parse_json_response(raw_response)
+        pairs = parsed.get("pairs", [])
+        if not isinstance(pairs, list) or not all(
+            isinstance(pair, dict) and "question" in pair for pair in pairs
+        ):
+            raise JudgeResponseError(
+                f"Expected 'pairs' to be a list of question/answer objects: {parsed}"
+            )
+        return GeneratedQAPairsResult(
+            pairs=[
+                QAPair(question=str(pair["question"]), answer=str(pair.get("answer", "")))
+                for pair in pairs
+                if pair["question"]
+            ],
+            tokens_used=tokens_used,
+        )
+
     async def verify_claim(self, claim: str, context: list[str]) -> ClaimVerdict:
         """Verify a single claim against context (NOT_ENOUGH_INFO if no context)."""
         if not context:
@@ -321,7 +438,7 @@ class BaseJudge(LLMJudge):
         formatted_context = template.format_context(context)
         user_prompt = template.format_user_prompt(claim=claim, context=formatted_context)
         raw_response, tokens_used = await self._call_llm(
-            template.build_system_prompt(), user_prompt, operation="verify_claim"
+            get_system_prompt("verify_claim"), user_prompt, operation="verify_claim"
         )
         parsed = self._parse_json_response(raw_response)
 
@@ -0,0 +1,122 @@
+"""Provider batch execution for judge calls.
+
+`BatchingTransport` wraps a transport that supports `send_batch()` (such as
+`ClaudeTransport`, via Anthropic's Message Batches API) and turns concurrent
+`send()` calls into batch submissions: calls arriving within `collect_window`
+seconds of each other are queued, submitted together, and each caller resumes
+once the batch ends. Batched requests are billed at a discount but complete
+asynchronously (minutes, up to a day), so this suits large offline runs rather
+than interactive use. Multi-step metrics take one batch per step (e.g. claim
+extraction, then claim verification).
+"""
+
+import asyncio
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from ragaliq.judges.models import DEFAULT_JUDGE_MODEL
+from ragaliq.judges.transport import JudgeTransport, TransportRequest, TransportResponse
+
+if TYPE_CHECKING:
+    from ragaliq.judges.base import JudgeError
+
+
+@runtime_checkable
+class BatchCapableTransport(JudgeTransport, Protocol):
+    """A transport that can also submit many requests as one provider batch."""
+
+    async def send_batch(
+        self, requests: Sequence[TransportRequest]
+    ) -> list[TransportResponse | JudgeError]:
+        """Return one response or error per request, in request order."""
+        ...
+
+
+class BatchingTransport:
+    """Transport wrapper that routes every call through provider batches.
+
+    Example:
+        judge.wrap_transport(BatchingTransport(judge.transport))
+    """
+
+    def __init__(
+        self,
+        inner: BatchCapableTransport,
+        collect_window: float = 1.0,
+        max_batch_size: int = 10_000,
+    ) -> None:
+        """Configure how calls are grouped into batches.
+
+        Args:
+            inner: Transport that executes the batches.
+            collect_window: Seconds to wait after the first queued call for
+                more calls to join its batch.
+            max_batch_size: Queue length that triggers an immediate submission.
+        """
+        self._inner = inner
+        self.collect_window = collect_window
+        self.max_batch_size = max_batch_size
+        self._queue: list[tuple[TransportRequest, asyncio.Future[TransportResponse]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def send(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = DEFAULT_JUDGE_MODEL,
+        temperature: float = 0.0,
+        max_tokens: int = 1024,
+    ) -> TransportResponse:
+        """Queue the request for the next batch and wait for its result.
+
+        Raises:
+            JudgeError: If this request (or the whole batch) failed.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[TransportResponse] = loop.create_future()
+        request = TransportRequest(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        self._queue.append((request, future))
+        if len(self._queue) >= self.max_batch_size:
+            self._submit()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.collect_window, self._submit)
+        return await future
+
+    def _submit(self) -> None:
+        """Hand the queued calls to a background batch task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queued, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._run(queued))
+        # Keep a reference so the task isn't garbage-collected mid-batch.
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run(
+        self, queued: list[tuple[TransportRequest, asyncio.Future[TransportResponse]]]
+    ) -> None:
+        """Execute one batch and resolve each caller's future with its outcome."""
+        try:
+            outcomes = await self._inner.send_batch([request for request, _ in queued])
+        except Exception as exc:
+            for _, future in queued:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), outcome in zip(queued, outcomes, strict=True):
+            # A caller cancelled while waiting has nothing left to receive.
+            if future.done():
+                continue
+            if isinstance(outcome, TransportResponse):
+                future.set_result(outcome)
+            else:
+                future.set_exception(outcome)
@@ -0,0 +1,177 @@
+"""Persistent judge response cache.
+
+`CachingTransport` wraps any `JudgeTransport` and memoizes responses in a
+SQLite-backed `JudgeCache`, keyed by a SHA-256 of the full request (prompts,
+model, temperature, max_tokens). Reruns of an unchanged dataset (CI retries,
+threshold sweeps) then skip the API entirely. Identical requests issued
+concurrently within a run (test cases sharing a query or context) are coalesced
+onto a single API call. Hits report zero tokens, since none were spent. Cache
+reads and writes run in a worker thread so SQLite I/O never blocks the event loop.
+
+Only deterministic (temperature 0) requests are cached; sampled requests are
+meant to vary between calls and always reach the API.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import from_json
+
+from ragaliq.judges.models import DEFAULT_JUDGE_MODEL
+from ragaliq.judges.transport import TransportResponse
+
+if TYPE_CHECKING:
+    from ragaliq.judges.transport import JudgeTransport
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "ragaliq" / "judge.db"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS judge_cache ("
+    "key TEXT PRIMARY KEY, verdict_json TEXT NOT NULL, created_at INTEGER NOT NULL)"
+)
+
+
+class JudgeCache:
+    """Key/value store of judge responses in a single SQLite table.
+
+    The connection is shared across threads behind a lock, so one cache can
+    back a session-scoped judge (e.g. under pytest-xdist).
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH, ttl: float | None = None) -> None:
+        """Open (creating if needed) the cache database at `path`.
+
+        Args:
+            path: SQLite file location; parent directories are created.
+                Use ":memory:" for a process-local cache.
+            ttl: Optional maximum entry age in seconds. Older entries are treated
+                as misses (and overwritten on the next put). None keeps entries forever.
+        """
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    @staticmethod
+    def make_key(payload: dict[str, Any]) -> str:
+        """Return the SHA-256 hex digest of `payload` serialized with sorted keys."""
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored verdict for `key`, or None on a miss or expired entry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT verdict_json, created_at FROM judge_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+            return None
+        verdict: dict[str, Any] = from_json(row[0])
+        return verdict
+
+    def put(self, key: str, verdict: dict[str, Any]) -> None:
+        """Store `verdict` under `key`, replacing any existing entry."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO judge_cache (key, verdict_json, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(verdict), int(time.time())),
+            )
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM judge_cache")
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM judge_cache").fetchone()
+        return int(count)
+
+    def __repr__(self) -> str:
+        return f"JudgeCache(path={str(self.path)!r}, ttl={self.ttl!r})"
+
+
+class CachingTransport:
+    """Transport wrapper that serves repeated requests from a `JudgeCache`.
+
+    Example:
+        judge.wrap_transport(CachingTransport(judge.transport, JudgeCache()))
+    """
+
+    def __init__(self, inner: JudgeTransport, cache: JudgeCache) -> None:
+        self._inner = inner
+        self.cache = cache
+        self._in_flight: dict[str, asyncio.Task[TransportResponse]] = {}
+
+    async def send(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = DEFAULT_JUDGE_MODEL,
+        temperature: float = 0.0,
+        max_tokens: int = 1024,
+    ) -> TransportResponse:
+        """Return the cached response for this exact request, else delegate and store it."""
+        if temperature > 0:
+            return await self._inner.send(
+                system_prompt, user_prompt, model, temperature, max_tokens
+            )
+        key = JudgeCache.make_key(
+            {
+                "system_prompt": system_prompt,
+                "user_prompt": user_prompt,
+                "model": model,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            }
+        )
+        # Shielded so one caller's cancellation doesn't cancel the call others await.
+        task = self._in_flight.get(key)
+        if task is not None:
+            response = await asyncio.shield(task)
+            return response.model_copy(update={"input_tokens": 0, "output_tokens": 0})
+
+        task = asyncio.ensure_future(
+            self._lookup_or_fetch(key, system_prompt, user_prompt, model, temperature, max_tokens)
+        )
+        self._in_flight[key] = task
+        task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _lookup_or_fetch(
+        self,
+        key: str,
+        system_prompt: str,
+        user_prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> TransportResponse:
+        """Return the stored response for `key`, else delegate and store the response."""
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return TransportResponse(
+                text=cached["text"], input_tokens=0, output_tokens=0, model=cached["model"]
+            )
+        response = await self._inner.send(
+            system_prompt, user_prompt, model, temperature, max_tokens
+        )
+        await asyncio.to_thread(
+            self.cache.put, key, {"text": response.text, "model": response.model}
+        )
+        return response
@@ -8,6 +8,8 @@ from ragaliq.judges.base_judge import BaseJudge
 from ragaliq.judges.transport import ClaudeTransport
 
 if TYPE_CHECKING:
+    from anthropic import DefaultAsyncHttpxClient
+
     from ragaliq.judges.trace import TraceCollector
 
 
@@ -26,9 +28,14 @@ class ClaudeJudge(BaseJudge):
         api_key: str | None = None,
         trace_collector: TraceCollector | None = None,
         max_concurrency: int = 20,
+        http_client: DefaultAsyncHttpxClient | None = None,
     ) -> None:
         """Initialize with an API key (explicit, else `ANTHROPIC_API_KEY`).
 
+        A single client (and its keep-alive connection pool, sized to at least
+        `max_concurrency`) serves every call this judge makes; pass `http_client` to
+        tune its limits or enable HTTP/2.
+
         Raises:
             ValueError: If no API key is provided or found in the environment.
         """
@@ -39,9 +46,16 @@ class ClaudeJudge(BaseJudge):
                 "or set ANTHROPIC_API_KEY environment variable."
             )
 
+        self._claude_transport = ClaudeTransport(
+            api_key=resolved_key, http_client=http_client, pool_size=max_concurrency
+        )
         super().__init__(
-            transport=ClaudeTransport(api_key=resolved_key),
+            transport=self._claude_transport,
             config=config,
             trace_collector=trace_collector,
             max_concurrency=max_concurrency,
         )
+
+    async def aclose(self) -> None:
+        """Close the Claude HTTP client, even if the transport has since been wrapped."""
+        await self._claude_transport.aclose()
@@ -4,6 +4,7 @@ from ragaliq.judges.prompts.loader import (
     PromptExample,
     PromptTemplate,
     get_prompt,
+    get_system_prompt,
     list_prompts,
 )
 
@@ -11,5 +12,6 @@ __all__ = [
     "PromptExample",
     "PromptTemplate",
     "get_prompt",
+    "get_system_prompt",
     "list_prompts",
 ]
@@ -10,7 +10,6 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 
@@ -20,7 +19,7 @@ class PromptExample(BaseModel):
     input: dict[str, Any] = Field(..., description="Example input variables")
     output: dict[str, Any] = Field(..., description="Expected output")
 
-    model_config = {"extra": "forbid"}
+    model_config = {"frozen": True, "extra": "forbid"}
 
 
 class PromptTemplate(BaseModel):
@@ -34,7 +33,8 @@ class PromptTemplate(BaseModel):
     output_format: dict[str, Any] | None = Field(default=None, description="Expected output format")
     examples: list[PromptExample] = Field(default_factory=list, description="Few-shot examples")
 
-    model_config = {"extra": "forbid"}
+    # Frozen: get_prompt() hands the same cached instance to every caller.
+    model_config = {"frozen": True, "extra": "forbid"}
 
     def format_user_prompt(self, **kwargs: Any) -> str:
         """Format the user template, escaping braces in values to block format-string injection.
@@ -104,9 +104,13 @@ def _load_template_file(name: str) -> dict[str, Any]:
     if not file_path.exists():
         raise FileNotFoundError(f"Prompt template not found: {name}")
 
+    # Imported on first template load so commands that never judge (validate,
+    # list-evaluators) skip PyYAML.
+    import yaml
+
     try:
-        with file_path.open() as f:
-            content = yaml.safe_load(f)
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        content = yaml.load(file_path.read_bytes(), Loader=loader)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Failed to parse prompt template '{name}': {e}") from e
 
@@ -118,9 +122,12 @@ def _load_template_file(name: str) -> dict[str, Any]:
     return content
 
 
+@lru_cache(maxsize=32)
 def get_prompt(name: str) -> PromptTemplate:
     """Load and validate the prompt template named `name` (e.g. 'faithfulness').
 
+    Validated once per name and cached; the returned template is frozen.
+
     Raises:
         FileNotFoundError: If the template doesn't exist.
         ValidationError: If the template structure is invalid.
@@ -129,6 +136,19 @@ def get_prompt(name: str) -> PromptTemplate:
     return PromptTemplate.model_validate(data)
 
 
+@lru_cache(maxsize=32)
+def get_system_prompt(name: str) -> str:
+    """Return the rendered system prompt (with few-shot examples) for `name`, cached.
+
+    The system prompt is constant per template, so judges render it once rather
+    than on every call.
+
+    Raises:
+        FileNotFoundError: If the template doesn't exist.
+    """
+    return get_prompt(name).build_system_prompt()
+
+
 def list_prompts() -> list[str]:
     """Return the sorted names of all available prompt templates (without `.yaml`)."""
     prompts_dir = _get_prompts_dir()
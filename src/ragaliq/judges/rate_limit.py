@@ -0,0 +1,132 @@
+"""Client-side request and token rate limits for judge API calls.
+
+`RateLimitedTransport` wraps any `JudgeTransport` and spaces calls so they stay
+under a provider's requests-per-minute and/or input-tokens-per-minute quota,
+instead of discovering the limit through 429 responses. Each quota is a
+`TokenBucket` that refills continuously and holds at most one minute of budget,
+so bursts up to the quota go out at once and sustained load is paced.
+"""
+
+import asyncio
+import time
+
+from ragaliq.judges.models import DEFAULT_JUDGE_MODEL
+from ragaliq.judges.transport import CHARS_PER_TOKEN_ESTIMATE, JudgeTransport, TransportResponse
+
+
+class TokenBucket:
+    """Continuously refilling budget of `rate_per_minute` units.
+
+    Callers reserve units up front and sleep off any shortfall, so waiters are
+    served in arrival order without locks. That also keeps one bucket usable
+    across the event loops of repeated sync `evaluate()` calls.
+    """
+
+    def __init__(self, rate_per_minute: float) -> None:
+        """Start with a full bucket.
+
+        Args:
+            rate_per_minute: Sustained units per minute, also the burst capacity.
+
+        Raises:
+            ValueError: If the rate is not positive.
+        """
+        if rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {rate_per_minute}")
+        self.capacity = float(rate_per_minute)
+        self._per_second = rate_per_minute / 60.0
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    @property
+    def level(self) -> float:
+        """Units available now; negative while reservations are outstanding."""
+        self._refill()
+        return self._level
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Take `amount` units, waiting until the bucket has refilled enough.
+
+        Amounts above capacity are clamped to it, so an oversized request waits
+        for a full bucket rather than forever.
+
+        Returns:
+            The units actually charged, i.e. `amount` clamped to capacity.
+        """
+        amount = min(amount, self.capacity)
+        self._refill()
+        self._level -= amount
+        if self._level >= 0:
+            return amount
+        try:
+            await asyncio.sleep(-self._level / self._per_second)
+        except asyncio.CancelledError:
+            self._level += amount
+            raise
+        return amount
+
+    def adjust(self, amount: float) -> None:
+        """Return (positive) or charge (negative) units after the fact."""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self._per_second)
+        self._updated = now
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate_per_minute={self.capacity:g}, level={self.level:.1f})"
+
+
+class RateLimitedTransport:
+    """Transport wrapper that paces calls to requests/minute and input-tokens/minute quotas.
+
+    Input tokens are estimated from prompt length before the call and corrected
+    with the reported count afterwards.
+
+    Example:
+        judge.wrap_transport(RateLimitedTransport(judge.transport, requests_per_minute=50))
+    """
+
+    def __init__(
+        self,
+        inner: JudgeTransport,
+        requests_per_minute: float | None = None,
+        input_tokens_per_minute: float | None = None,
+    ) -> None:
+        self._inner = inner
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.input_tokens = (
+            TokenBucket(input_tokens_per_minute) if input_tokens_per_minute else None
+        )
+
+    async def send(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = DEFAULT_JUDGE_MODEL,
+        temperature: float = 0.0,
+        max_tokens: int = 1024,
+    ) -> TransportResponse:
+        """Wait for request and token budget, then delegate."""
+        estimated_tokens = (len(system_prompt) + len(user_prompt)) // CHARS_PER_TOKEN_ESTIMATE
+        if self.requests is not None:
+            await self.requests.acquire()
+        charged = 0.0
+        if self.input_tokens is not None:
+            charged = await self.input_tokens.acquire(estimated_tokens)
+
+        try:
+            response = await self._inner.send(
+                system_prompt, user_prompt, model, temperature, max_tokens
+            )
+        except BaseException:
+            # No usage was reported, so give the reservation back.
+            if self.input_tokens is not None:
+                self.input_tokens.adjust(charged)
+            raise
+        if self.input_tokens is not None:
+            # Correct against what acquire() charged, which is clamped to capacity.
+            self.input_tokens.adjust(charged - response.input_tokens)
+        return response
@@ -4,13 +4,42 @@ A transport owns only provider HTTP calls, retries, and token counting. Prompt
 building, response parsing, and score clamping all live in `BaseJudge`.
 """
 
-from typing import Protocol
+import asyncio
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Protocol
 
-from anthropic import AsyncAnthropic
 from pydantic import BaseModel, Field
 
+from ragaliq.judges.base import JudgeAPIError, JudgeError, JudgeResponseError
 from ragaliq.judges.models import DEFAULT_JUDGE_MODEL
 
+if TYPE_CHECKING:
+    from anthropic import DefaultAsyncHttpxClient
+    from anthropic.types import Message
+    from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+
+# Rough characters per token, for estimating prompt size before a call.
+CHARS_PER_TOKEN_ESTIMATE = 4
+
+# Smallest minimum cacheable prompt across Claude models is 1024 tokens. Shorter
+# system prompts go without a cache marker, which the API would ignore.
+_MIN_CACHEABLE_SYSTEM_PROMPT_CHARS = 1024 * CHARS_PER_TOKEN_ESTIMATE
+
+# Rate-limited (429) and overloaded (529): the provider wants fewer calls in flight.
+OVERLOAD_STATUS_CODES = frozenset({429, 529})
+
+
+class TransportRequest(BaseModel):
+    """One judge request: the prompts and sampling parameters `send()` takes."""
+
+    system_prompt: str = Field(..., description="Static instructions (rubric)")
+    user_prompt: str = Field(..., description="Per-call content")
+    model: str = Field(default=DEFAULT_JUDGE_MODEL, description="Model identifier")
+    temperature: float = Field(default=0.0, ge=0.0, description="Sampling temperature")
+    max_tokens: int = Field(default=1024, gt=0, description="Response token cap")
+
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class TransportResponse(BaseModel):
     """Normalized response every transport returns: text plus token/model metadata."""
@@ -48,10 +77,54 @@ class ClaudeTransport:
 
     Handles API calls with automatic retry on rate limits and server errors.
     Uses tenacity for exponential backoff (1s, 2s, 4s, max 10s).
+
+    A system prompt (the static rubric) long enough to be cached is sent with an
+    ephemeral prompt-cache marker, so repeated calls of one operation reuse its
+    prefill server-side. Reported input tokens include cache reads and writes.
     """
 
-    def __init__(self, api_key: str) -> None:
-        self._client = AsyncAnthropic(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        http_client: DefaultAsyncHttpxClient | None = None,
+        pool_size: int | None = None,
+        retry_overloaded: bool = True,
+    ) -> None:
+        """Create the Anthropic client.
+
+        Args:
+            api_key: Anthropic API key.
+            http_client: Optional HTTP client to send requests through, e.g.
+                `anthropic.DefaultAsyncHttpxClient(limits=..., http2=True)` for custom
+                pool limits or HTTP/2. Defaults to the SDK's own pooled client.
+            pool_size: Expected number of concurrent calls. When it exceeds the SDK's
+                default keep-alive pool, the default client keeps this many idle
+                connections open instead of re-handshaking the overflow. Ignored
+                when `http_client` is given.
+            retry_overloaded: Whether to retry 429/529 responses. Turn off when an
+                outer layer (e.g. `AdaptiveTransport`) already backs off and retries
+                them, so one overload isn't retried by both. Other 5xx and
+                connection errors are retried either way.
+        """
+        # Imported here so `ragaliq.judges` (and commands like `validate` that only
+        # touch models) don't pay for loading the anthropic SDK.
+        from anthropic import DEFAULT_CONNECTION_LIMITS, AsyncAnthropic, DefaultAsyncHttpxClient
+
+        default_keepalive = DEFAULT_CONNECTION_LIMITS.max_keepalive_connections or 0
+        if http_client is None and pool_size is not None and pool_size > default_keepalive:
+            limits = type(DEFAULT_CONNECTION_LIMITS)(
+                max_connections=max(DEFAULT_CONNECTION_LIMITS.max_connections or 0, pool_size),
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=DEFAULT_CONNECTION_LIMITS.keepalive_expiry,
+            )
+            http_client = DefaultAsyncHttpxClient(limits=limits)
+
+        self._client = AsyncAnthropic(api_key=api_key, http_client=http_client)
+        self.retry_overloaded = retry_overloaded
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.close()
 
     async def send(
         self,
@@ -67,7 +140,6 @@ class ClaudeTransport:
             JudgeAPIError: If the call fails after retries are exhausted.
         """
         from anthropic import APIConnectionError, APIStatusError
-        from anthropic.types import Message
         from tenacity import (
             retry,
             retry_if_exception,
@@ -77,13 +149,13 @@ class ClaudeTransport:
             wait_random,
         )
 
-        from ragaliq.judges.base import JudgeAPIError, JudgeResponseError
-
         def _is_retryable_api_error(exc: BaseException) -> bool:
             """Check if an exception is a retryable API status error (429 or 5xx)."""
-            return isinstance(exc, APIStatusError) and (
-                exc.status_code == 429 or exc.status_code >= 500
-            )
+            if not isinstance(exc, APIStatusError):
+                return False
+            if exc.status_code in OVERLOAD_STATUS_CODES:
+                return self.retry_overloaded
+            return exc.status_code >= 500
 
         @retry(
             retry=(
@@ -97,36 +169,19 @@ class ClaudeTransport:
         async def _call_with_retry() -> Message:
             """Make the API call with retry logic."""
             return await self._client.messages.create(
-                model=model,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                messages=[{"role": "user", "content": user_prompt}],
-                system=system_prompt,
+                **self._message_params(
+                    TransportRequest(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        model=model,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                )
             )
 
         try:
-            response: Message = await _call_with_retry()
-
-            # Extract text content. Claude may return non-text blocks (for example,
-            # thinking/tool blocks) before the final text answer.
-            if not response.content:
-                raise JudgeResponseError("Empty response from Claude API")
-
-            text_blocks = [block.text for block in response.content if block.type == "text"]
-            if not text_blocks:
-                block_types = ", ".join(block.type for block in response.content)
-                raise JudgeResponseError(f"Expected text response, got {block_types}")
-
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-
-            return TransportResponse(
-                text="\n".join(text_blocks),
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                model=model,
-            )
-
+            return self._to_response(await _call_with_retry(), model)
         except APIStatusError as e:
             # Map all status errors to our exception hierarchy
             # (tenacity has already retried 429/5xx if needed)
@@ -137,3 +192,116 @@ class ClaudeTransport:
         except APIConnectionError as e:
             # Exhausted retries on connection errors
             raise JudgeAPIError(f"Connection to Claude API failed: {e}") from e
+
+    async def send_batch(
+        self,
+        requests: Sequence[TransportRequest],
+        poll_interval: float = 30.0,
+    ) -> list[TransportResponse | JudgeError]:
+        """Run `requests` through the Message Batches API and wait for the batch to end.
+
+        Batched requests are billed at a discount but complete asynchronously,
+        typically within minutes and at most 24 hours.
+
+        Args:
+            requests: Requests to submit together, in caller order.
+            poll_interval: Seconds between batch status checks.
+
+        Returns:
+            One outcome per request, in the same order: a TransportResponse, or the
+            JudgeError describing why that request failed.
+
+        Raises:
+            JudgeAPIError: If the batch cannot be created or polled.
+        """
+        from anthropic import APIConnectionError, APIStatusError
+
+        batches = self._client.messages.batches
+        try:
+            batch = await batches.create(
+                requests=[
+                    {"custom_id": str(i), "params": self._message_params(request)}
+                    for i, request in enumerate(requests)
+                ]
+            )
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_interval)
+                batch = await batches.retrieve(batch.id)
+
+            outcomes: list[TransportResponse | JudgeError | None] = [None] * len(requests)
+            async for entry in await batches.results(batch.id):
+                i = int(entry.custom_id)
+                match entry.result.type:
+                    case "succeeded":
+                        try:
+                            outcomes[i] = self._to_response(entry.result.message, requests[i].model)
+                        except JudgeResponseError as e:
+                            outcomes[i] = e
+                    case "errored":
+                        error = entry.result.error.error
+                        outcomes[i] = JudgeAPIError(
+                            f"Claude batch request failed: {error.type}: {error.message}"
+                        )
+                    case status:
+                        outcomes[i] = JudgeAPIError(f"Claude batch request {status}")
+            # One exception per missing entry: callers raise these independently.
+            return [
+                JudgeAPIError(f"No result for request in batch {batch.id}")
+                if outcome is None
+                else outcome
+                for outcome in outcomes
+            ]
+        except APIStatusError as e:
+            raise JudgeAPIError(
+                f"Claude batch API error: {e.message}", status_code=e.status_code
+            ) from e
+        except APIConnectionError as e:
+            raise JudgeAPIError(f"Connection to Claude API failed: {e}") from e
+
+    @staticmethod
+    def _message_params(request: TransportRequest) -> MessageCreateParamsNonStreaming:
+        """Build Messages API parameters, marking a cacheable system prompt for prompt caching."""
+        params: MessageCreateParamsNonStreaming = {
+            "model": request.model,
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "messages": [{"role": "user", "content": request.user_prompt}],
+            "system": request.system_prompt,
+        }
+        if len(request.system_prompt) >= _MIN_CACHEABLE_SYSTEM_PROMPT_CHARS:
+            params["system"] = [
+                {
+                    "type": "text",
+                    "text": request.system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        return params
+
+    @staticmethod
+    def _to_response(message: Message, model: str) -> TransportResponse:
+        """Normalize a Claude message into a TransportResponse.
+
+        Raises:
+            JudgeResponseError: If the message carries no text content.
+        """
+        # Extract text content. Claude may return non-text blocks (for example,
+        # thinking/tool blocks) before the final text answer.
+        if not message.content:
+            raise JudgeResponseError("Empty response from Claude API")
+
+        text_blocks = [block.text for block in message.content if block.type == "text"]
+        if not text_blocks:
+            block_types = ", ".join(block.type for block in message.content)
+            raise JudgeResponseError(f"Expected text response, got {block_types}")
+
+        usage = message.usage
+        return TransportResponse(
+            text="\n".join(text_blocks),
+            # Cache writes and reads are prompt input too; usage.input_tokens excludes them.
+            input_tokens=usage.input_tokens
+            + (usage.cache_creation_input_tokens or 0)
+            + (usage.cache_read_input_tokens or 0),
+            output_tokens=usage.output_tokens,
+            model=model,
+        )
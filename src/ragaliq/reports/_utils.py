@@ -1,5 +1,6 @@
 """Shared utilities for RagaliQ reporters."""
 
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -21,22 +22,24 @@ def collect_evaluator_stats(
         sorted list of metric names and stats_rows is a list of dicts with
         keys: name, passed, failed, avg_score.
     """
-    all_keys: set[str] = set()
+    # One pass over results into a score column per metric, then aggregate each
+    # column, instead of rescanning every result once per metric.
+    columns: defaultdict[str, list[float]] = defaultdict(list)
     for r in results:
-        all_keys.update(r.scores.keys())
-    evaluator_names = sorted(all_keys)
+        for name, score in r.scores.items():
+            columns[name].append(score)
+    evaluator_names = sorted(columns)
 
     stats: list[dict[str, Any]] = []
     for name in evaluator_names:
-        scores = [r.scores[name] for r in results if name in r.scores]
-        ev_passed = sum(1 for s in scores if s >= threshold)
-        avg = sum(scores) / len(scores) if scores else 0.0
+        scores = columns[name]
+        ev_passed = sum(s >= threshold for s in scores)
         stats.append(
             {
                 "name": name,
                 "passed": ev_passed,
                 "failed": len(scores) - ev_passed,
-                "avg_score": avg,
+                "avg_score": sum(scores) / len(scores),
             }
         )
 
@@ -5,11 +5,19 @@ from typing import TYPE_CHECKING, Any
 from rich.console import Console
 from rich.table import Table
 
+from ragaliq.core.test_case import EvalStatus
 from ragaliq.reports._utils import collect_evaluator_stats
 
 if TYPE_CHECKING:
     from ragaliq.core.test_case import RAGTestResult
 
+_STATUS_MARKUP: dict[EvalStatus, str] = {
+    EvalStatus.PASSED: "[green]PASS[/green]",
+    EvalStatus.FAILED: "[red]FAIL[/red]",
+    EvalStatus.ERROR: "[yellow]ERROR[/yellow]",
+    EvalStatus.SKIPPED: "[dim]SKIP[/dim]",
+}
+
 
 class ConsoleReporter:
     """
@@ -68,8 +76,6 @@ class ConsoleReporter:
 
     def _print_results_table(self, results: list[RAGTestResult]) -> None:
         """Print results as a Rich table with per-evaluator scores."""
-        from ragaliq.core.test_case import EvalStatus
-
         table = Table(title="Evaluation Results", show_lines=True)
         table.add_column("Test Case", style="bold")
         table.add_column("Status", justify="center")
@@ -79,25 +85,14 @@ class ConsoleReporter:
         for name in evaluator_names:
             table.add_column(name.replace("_", " ").title(), justify="center")
 
-        status_map = {
-            EvalStatus.PASSED: "[green]PASS[/green]",
-            EvalStatus.FAILED: "[red]FAIL[/red]",
-            EvalStatus.ERROR: "[yellow]ERROR[/yellow]",
-            EvalStatus.SKIPPED: "[dim]SKIP[/dim]",
-        }
-
+        threshold = self._threshold
         for result in results:
-            status_str = status_map.get(result.status, str(result.status))
-            score_cells = []
-            for name in evaluator_names:
-                score = result.scores.get(name)
-                if score is None:
-                    score_cells.append("—")
-                elif score >= self._threshold:
-                    score_cells.append(f"[green]{score:.2f}[/green]")
-                else:
-                    score_cells.append(f"[red]{score:.2f}[/red]")
-            table.add_row(result.test_case.name, status_str, *score_cells)
+            get_score = result.scores.get
+            table.add_row(
+                result.test_case.name,
+                _STATUS_MARKUP.get(result.status, str(result.status)),
+                *[_format_score(get_score(name), threshold) for name in evaluator_names],
+            )
 
         self._console.print(table)
 
@@ -107,8 +102,6 @@ class ConsoleReporter:
         Uses scores vs threshold (not details["passed"]) to identify failing
         evaluators, so this works correctly even when details are sparse.
         """
-        from ragaliq.core.test_case import EvalStatus
-
         targets = [
             r for r in results if self._verbose or r.status in {EvalStatus.FAILED, EvalStatus.ERROR}
         ]
@@ -173,3 +166,12 @@ class ConsoleReporter:
                 f"\n[bold red]✗ {passed_total}/{total} passed, "
                 f"{failed_total} failed[/bold red]{tokens_str}"
             )
+
+
+def _format_score(score: float | None, threshold: float) -> str:
+    """Render one score cell: green at/above threshold, red below, a dash if missing."""
+    if score is None:
+        return "—"
+    if score >= threshold:
+        return f"[green]{score:.2f}[/green]"
+    return f"[red]{score:.2f}[/red]"
@@ -2,6 +2,7 @@
 
 import datetime
 import json
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from ragaliq.reports._utils import collect_evaluator_stats
@@ -21,7 +22,7 @@ class JSONReporter:
     Example:
         >>> reporter = JSONReporter(threshold=0.7)
         >>> json_str = reporter.export(results)
-        >>> Path("report.json").write_text(json_str)
+        >>> reporter.write(results, "report.json")  # streams straight to disk
 
     Output structure::
 
@@ -44,14 +45,17 @@ class JSONReporter:
         }
     """
 
-    def __init__(self, threshold: float = 0.7) -> None:
+    def __init__(self, threshold: float = 0.7, score_precision: int | None = 4) -> None:
         """
         Initialize JSONReporter.
 
         Args:
             threshold: Score threshold for pass/fail classification (0.0–1.0).
+            score_precision: Decimal places kept for per-result scores, matching the
+                rounded summary figures. None writes full float precision.
         """
         self._threshold = threshold
+        self._score_precision = score_precision
 
     def export(self, results: list[RAGTestResult]) -> str:
         """
@@ -63,6 +67,25 @@ class JSONReporter:
         Returns:
             Pretty-printed JSON string (indent=2, UTF-8 safe).
         """
+        return json.dumps(self._build_document(results), indent=2, ensure_ascii=False)
+
+    def write(self, results: list[RAGTestResult], path: Path | str) -> None:
+        """
+        Serialize evaluation results directly to a UTF-8 JSON file.
+
+        Produces the same document as `export()`, but encodes it into the file
+        incrementally instead of first building the whole report as one string.
+
+        Args:
+            results: List of evaluation results to export.
+            path: Destination file; overwritten if it exists.
+        """
+        doc = self._build_document(results)
+        with Path(path).open("w", encoding="utf-8") as f:
+            json.dump(doc, f, indent=2, ensure_ascii=False)
+
+    def _build_document(self, results: list[RAGTestResult]) -> dict[str, Any]:
+        """Assemble the report document (summary plus per-result data)."""
         from ragaliq.core.test_case import EvalStatus
 
         _, ev_rows = collect_evaluator_stats(results, self._threshold)
@@ -81,7 +104,7 @@ class JSONReporter:
         total_tokens = sum(r.judge_tokens_used for r in results)
         total_ms = sum(r.execution_time_ms for r in results)
 
-        doc = {
+        return {
             "generated_at": datetime.datetime.now(datetime.UTC).isoformat(),
             "threshold": self._threshold,
             "summary": {
@@ -97,17 +120,18 @@ class JSONReporter:
             "results": [self._serialize_result(r) for r in results],
         }
 
-        return json.dumps(doc, indent=2, ensure_ascii=False)
-
     def _serialize_result(self, result: RAGTestResult) -> dict[str, Any]:
         """Serialize a single RAGTestResult to a plain dict."""
         tc = result.test_case
+        scores = result.scores
+        if self._score_precision is not None:
+            scores = {name: round(score, self._score_precision) for name, score in scores.items()}
         return {
             "id": tc.id,
             "name": tc.name,
             "status": str(result.status),
             "passed": result.passed,
-            "scores": result.scores,
+            "scores": scores,
             "details": result.details,
             "execution_time_ms": result.execution_time_ms,
             "judge_tokens_used": result.judge_tokens_used,
@@ -426,6 +426,22 @@ class TestEndToEndPipeline:
         assert "evaluate_relevance" in operations
         assert all(t.success for t in collector.traces)
 
+    @pytest.mark.asyncio
+    async def test_faithfulness_and_hallucination_share_claim_pass(self, test_case):
+        """Both claim-based metrics on one case cost a single extract + verify pass."""
+        transport = FakeTransport()
+        runner = RagaliQ(
+            judge=BaseJudge(transport=transport),
+            evaluators=["faithfulness", "hallucination"],
+        )
+
+        result = await runner.evaluate_async(test_case)
+
+        # 1 extract_claims + 2 verify_claim, shared by both evaluators
+        assert transport.call_count == 3
+        assert result.judge_tokens_used == 3 * 80
+        assert result.scores == {"faithfulness": 1.0, "hallucination": 1.0}
+
     @pytest.mark.asyncio
     async def test_error_envelope_on_transport_failure(self):
         """Transport exception → error envelope, not crash."""
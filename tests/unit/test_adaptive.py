@@ -0,0 +1,161 @@
+"""Unit tests for AdaptiveConcurrencyLimiter and AdaptiveTransport."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ragaliq.core.runner import RagaliQ
+from ragaliq.judges.adaptive import AdaptiveConcurrencyLimiter, AdaptiveTransport
+from ragaliq.judges.base import JudgeAPIError
+from ragaliq.judges.base_judge import BaseJudge
+from ragaliq.judges.cache import CachingTransport
+from ragaliq.judges.transport import ClaudeTransport, TransportResponse
+
+
+def _response() -> TransportResponse:
+    return TransportResponse(text="ok", input_tokens=10, output_tokens=5, model="m")
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for the AIMD limiter."""
+
+    def test_success_grows_limit_up_to_maximum(self) -> None:
+        """Successes raise the limit additively, capped at maximum."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=3)
+        limiter.on_success()
+        assert limiter.limit == 2  # +1/limit per success: about +1 per window of calls
+        limiter.on_success()
+        limiter.on_success()
+        assert limiter.limit == 3
+
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter.limit == 3
+
+    def test_overload_halves_limit_down_to_minimum(self) -> None:
+        """Overloads halve the limit, never below minimum."""
+        limiter = AdaptiveConcurrencyLimiter(initial=8, minimum=2, maximum=8)
+        limiter.on_overload()
+        assert limiter.limit == 4
+
+        for _ in range(5):
+            limiter.on_overload()
+        assert limiter.limit == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"initial": 0},
+            {"initial": 10, "maximum": 5},
+            {"initial": 2, "minimum": 3},
+            {"backoff_factor": 1.0},
+        ],
+    )
+    def test_invalid_bounds_raise(self, kwargs) -> None:
+        """Inconsistent configuration is rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(**kwargs)
+
+    async def test_limits_in_flight_calls(self) -> None:
+        """No more than `limit` holders run at once."""
+        limiter = AdaptiveConcurrencyLimiter(initial=2, maximum=2)
+        active = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_use == 0
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        """Cancelling a queued acquire leaves the limiter consistent."""
+        limiter = AdaptiveConcurrencyLimiter(initial=1, maximum=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+        await asyncio.wait_for(limiter.acquire(), timeout=1)
+        assert limiter.in_use == 1
+
+
+class TestAdaptiveTransport:
+    """Tests for the retrying transport wrapper."""
+
+    async def test_overload_backs_off_and_retries(self) -> None:
+        """A 529 halves the limit and the call is retried until it succeeds."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(
+            side_effect=[JudgeAPIError("overloaded", status_code=529), _response()]
+        )
+        limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=8)
+        transport = AdaptiveTransport(inner, limiter, retry_interval=0)
+
+        response = await transport.send("sys", "user", "m")
+
+        assert response.text == "ok"
+        assert inner.send.await_count == 2
+        assert limiter.limit == 2
+
+    async def test_non_overload_error_is_not_retried(self) -> None:
+        """Other API errors propagate immediately."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(side_effect=JudgeAPIError("bad request", status_code=400))
+        transport = AdaptiveTransport(inner, AdaptiveConcurrencyLimiter(), retry_interval=0)
+
+        with pytest.raises(JudgeAPIError, match="bad request"):
+            await transport.send("sys", "user", "m")
+        assert inner.send.await_count == 1
+
+    async def test_gives_up_after_max_retries(self) -> None:
+        """Persistent overload re-raises after max_retries retries."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(side_effect=JudgeAPIError("rate limited", status_code=429))
+        limiter = AdaptiveConcurrencyLimiter()
+        transport = AdaptiveTransport(inner, limiter, max_retries=2, retry_interval=0)
+
+        with pytest.raises(JudgeAPIError):
+            await transport.send("sys", "user", "m")
+        assert inner.send.await_count == 3
+        assert limiter.in_use == 0
+
+
+class TestRunnerAdaptiveIntegration:
+    """Tests for RagaliQ(adaptive_concurrency=True)."""
+
+    def test_wraps_injected_judge_transport(self) -> None:
+        """The limiter's ceiling follows max_judge_concurrency."""
+        judge = BaseJudge(transport=AsyncMock())
+        RagaliQ(judge=judge, adaptive_concurrency=True, max_judge_concurrency=12)
+
+        assert isinstance(judge.transport, AdaptiveTransport)
+        assert judge.transport.limiter.maximum == 12
+
+    def test_disables_overload_retries_in_claude_transport(self) -> None:
+        """Only the limiter retries 429/529, not tenacity inside the transport as well."""
+        with patch("anthropic.AsyncAnthropic"):
+            claude = ClaudeTransport(api_key="test")
+        judge = BaseJudge(transport=claude)
+        RagaliQ(judge=judge, adaptive_concurrency=True, requests_per_minute=60)
+
+        assert claude.retry_overloaded is False
+
+    def test_cache_wraps_outside_limiter(self, tmp_path) -> None:
+        """Cache hits are served before taking a limiter slot."""
+        judge = BaseJudge(transport=AsyncMock())
+        RagaliQ(judge=judge, adaptive_concurrency=True, cache_path=tmp_path / "judge.db")
+
+        assert isinstance(judge.transport, CachingTransport)
+        assert isinstance(judge.transport._inner, AdaptiveTransport)
@@ -0,0 +1,228 @@
+"""Unit tests for BatchingTransport and ClaudeTransport.send_batch."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from anthropic.types import Usage
+
+from ragaliq.core.runner import RagaliQ
+from ragaliq.judges.base import JudgeAPIError, JudgeResponseError
+from ragaliq.judges.base_judge import BaseJudge
+from ragaliq.judges.batch import BatchingTransport
+from ragaliq.judges.transport import ClaudeTransport, TransportRequest, TransportResponse
+
+
+def _response(text: str = "ok") -> TransportResponse:
+    return TransportResponse(text=text, input_tokens=10, output_tokens=5, model="m")
+
+
+class _EchoBatchTransport:
+    """Batch transport that answers each request with its user prompt."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[TransportRequest]] = []
+
+    async def send(self, *_args) -> TransportResponse:
+        raise AssertionError("BatchingTransport must not call send()")
+
+    async def send_batch(self, requests):
+        self.batches.append(list(requests))
+        return [
+            JudgeResponseError("bad") if r.user_prompt == "fail" else _response(r.user_prompt)
+            for r in requests
+        ]
+
+
+class TestBatchingTransport:
+    """Tests for grouping concurrent sends into batches."""
+
+    async def test_concurrent_sends_share_one_batch(self) -> None:
+        """Calls within the collect window go out together and get their own results."""
+        inner = _EchoBatchTransport()
+        transport = BatchingTransport(inner, collect_window=0.01)
+
+        responses = await asyncio.gather(*(transport.send("sys", f"u{i}") for i in range(3)))
+
+        assert [r.text for r in responses] == ["u0", "u1", "u2"]
+        assert len(inner.batches) == 1
+        assert [r.user_prompt for r in inner.batches[0]] == ["u0", "u1", "u2"]
+
+    async def test_failed_request_raises_only_for_its_caller(self) -> None:
+        """A per-request error surfaces to that caller; the rest succeed."""
+        transport = BatchingTransport(_EchoBatchTransport(), collect_window=0.01)
+
+        results = await asyncio.gather(
+            transport.send("sys", "ok"), transport.send("sys", "fail"), return_exceptions=True
+        )
+
+        assert results[0].text == "ok"
+        assert isinstance(results[1], JudgeResponseError)
+
+    async def test_batch_failure_raises_for_every_caller(self) -> None:
+        """If the batch itself fails, every queued caller sees the error."""
+        inner = MagicMock()
+        inner.send_batch = AsyncMock(side_effect=JudgeAPIError("down", status_code=500))
+        transport = BatchingTransport(inner, collect_window=0.01)
+
+        results = await asyncio.gather(
+            transport.send("sys", "a"), transport.send("sys", "b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, JudgeAPIError) for r in results)
+
+    async def test_full_queue_submits_without_waiting(self) -> None:
+        """Reaching max_batch_size submits immediately instead of waiting out the window."""
+        inner = _EchoBatchTransport()
+        transport = BatchingTransport(inner, collect_window=60, max_batch_size=2)
+
+        responses = await asyncio.wait_for(
+            asyncio.gather(transport.send("sys", "a"), transport.send("sys", "b")), timeout=1
+        )
+
+        assert [r.text for r in responses] == ["a", "b"]
+
+
+def _message(text: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text=text)],
+        usage=Usage(input_tokens=7, output_tokens=3),
+    )
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class TestClaudeSendBatch:
+    """Tests for ClaudeTransport.send_batch against a mocked Message Batches API."""
+
+    async def test_polls_until_ended_and_maps_results_by_custom_id(self) -> None:
+        """Results (returned out of order) are matched back to request order."""
+        with patch("anthropic.AsyncAnthropic") as mock_cls:
+            batches = mock_cls.return_value.messages.batches
+            batches.create = AsyncMock(
+                return_value=SimpleNamespace(id="b1", processing_status="in_progress")
+            )
+            batches.retrieve = AsyncMock(
+                return_value=SimpleNamespace(id="b1", processing_status="ended")
+            )
+            batches.results = AsyncMock(
+                return_value=_aiter(
+                    [
+                        SimpleNamespace(custom_id="2", result=SimpleNamespace(type="expired")),
+                        SimpleNamespace(
+                            custom_id="0",
+                            result=SimpleNamespace(type="succeeded", message=_message("first")),
+                        ),
+                        SimpleNamespace(
+                            custom_id="1",
+                            result=SimpleNamespace(
+                                type="errored",
+                                error=SimpleNamespace(
+                                    error=SimpleNamespace(type="overloaded_error", message="busy")
+                                ),
+                            ),
+                        ),
+                    ]
+                )
+            )
+            transport = ClaudeTransport(api_key="test")
+            requests = [
+                TransportRequest(system_prompt="sys", user_prompt=f"u{i}", model="m")
+                for i in range(3)
+            ]
+
+            outcomes = await transport.send_batch(requests, poll_interval=0)
+
+        params = batches.create.call_args.kwargs["requests"]
+        assert [p["custom_id"] for p in params] == ["0", "1", "2"]
+        assert params[1]["params"]["messages"] == [{"role": "user", "content": "u1"}]
+        batches.retrieve.assert_awaited_once_with("b1")
+        assert outcomes[0] == TransportResponse(
+            text="first", input_tokens=7, output_tokens=3, model="m"
+        )
+        assert isinstance(outcomes[1], JudgeAPIError)
+        assert "busy" in str(outcomes[1])
+        assert isinstance(outcomes[2], JudgeAPIError)
+        assert "expired" in str(outcomes[2])
+
+    async def test_missing_results_get_their_own_errors(self) -> None:
+        """Requests absent from the results each get a distinct JudgeAPIError instance."""
+        with patch("anthropic.AsyncAnthropic") as mock_cls:
+            batches = mock_cls.return_value.messages.batches
+            batches.create = AsyncMock(
+                return_value=SimpleNamespace(id="b1", processing_status="ended")
+            )
+            batches.results = AsyncMock(return_value=_aiter([]))
+            transport = ClaudeTransport(api_key="test")
+            requests = [
+                TransportRequest(system_prompt="sys", user_prompt=f"u{i}", model="m")
+                for i in range(2)
+            ]
+
+            outcomes = await transport.send_batch(requests, poll_interval=0)
+
+        assert all(isinstance(o, JudgeAPIError) for o in outcomes)
+        assert outcomes[0] is not outcomes[1]
+
+
+class TestRunnerBatchIntegration:
+    """Tests for RagaliQ(batch_api=True)."""
+
+    def test_wraps_batch_capable_transport(self) -> None:
+        """A transport with send_batch() gets a BatchingTransport in front of it."""
+        judge = BaseJudge(transport=_EchoBatchTransport())
+        RagaliQ(judge=judge, batch_api=True)
+
+        assert isinstance(judge.transport, BatchingTransport)
+
+    async def test_judge_concurrency_cap_does_not_limit_batch_size(self) -> None:
+        """Every call in flight joins the batch, even past max_judge_concurrency."""
+        inner = _EchoBatchTransport()
+        judge = BaseJudge(transport=inner, max_concurrency=1)
+        RagaliQ(judge=judge, batch_api=True)
+        judge.transport.collect_window = 0.01
+
+        await asyncio.gather(*(judge._call_llm("sys", f"u{i}") for i in range(3)))
+
+        assert [len(batch) for batch in inner.batches] == [3]
+
+    def test_transport_without_send_batch_is_left_alone(self, caplog) -> None:
+        """A plain transport is not wrapped, and the skip is logged."""
+
+        class PlainTransport:
+            async def send(self, *_args) -> TransportResponse:
+                return _response()
+
+        inner = PlainTransport()
+        judge = BaseJudge(transport=inner)
+        RagaliQ(judge=judge, batch_api=True)
+
+        assert judge.transport is inner
+        assert "batch_api ignored" in caplog.text
+
+    @pytest.mark.parametrize("batch_api", [False, True])
+    async def test_runner_results_match_live_mode(self, sample_test_case, batch_api) -> None:
+        """Scores are the same whether judge calls go live or through batches."""
+
+        class ScoreTransport(_EchoBatchTransport):
+            async def send(self, **_kwargs) -> TransportResponse:
+                return _response('{"score": 0.8, "reasoning": "ok"}')
+
+            async def send_batch(self, requests):
+                return [_response('{"score": 0.8, "reasoning": "ok"}') for _ in requests]
+
+        runner = RagaliQ(
+            judge=BaseJudge(transport=ScoreTransport()),
+            evaluators=["relevance"],
+            batch_api=batch_api,
+        )
+        if batch_api:
+            runner._judge.transport.collect_window = 0.01
+
+        result = await runner.evaluate_async(sample_test_case)
+
+        assert result.scores == {"relevance": 0.8}
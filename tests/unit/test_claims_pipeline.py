@@ -5,10 +5,13 @@ Tests the verify_all_claims() function directly, covering:
 - claims_empty flag behavior
 - context_empty short-circuit (no LLM calls on empty context)
 - Error propagation from extract_claims vs verify_claim
+- Judges that override verify_claims to verify all claims at once
 """
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -17,6 +20,7 @@ from ragaliq.evaluators._claims import ClaimVerificationResult, verify_all_claim
 from ragaliq.judges.base import (
     ClaimsResult,
     ClaimVerdict,
+    ClaimVerdictsResult,
     JudgeAPIError,
     JudgeResponseError,
     LLMJudge,
@@ -33,6 +37,8 @@ def mock_judge() -> MagicMock:
     judge = MagicMock(spec=LLMJudge)
     judge.extract_claims = AsyncMock(return_value=ClaimsResult(claims=[], tokens_used=0))
     judge.verify_claim = AsyncMock()
+    # Run the default verify_claims so tests drive the per-claim verify_claim mock.
+    judge.verify_claims = partial(LLMJudge.verify_claims, judge)
     return judge
 
 
@@ -204,6 +210,95 @@ class TestErrorPropagation:
             await verify_all_claims("Response", ["context"], mock_judge)
 
 
+# =============================================================================
+# Judge-Level Multi-Claim Verification
+# =============================================================================
+
+
+class TestVerifyClaimsOverride:
+    """Tests for judges that verify every claim in one verify_claims call."""
+
+    @pytest.mark.asyncio
+    async def test_overridden_verify_claims_replaces_per_claim_calls(
+        self, mock_judge: MagicMock
+    ) -> None:
+        """The pipeline calls verify_claims once and uses its verdicts and token total."""
+        mock_judge.extract_claims.return_value = ClaimsResult(claims=["A", "B"], tokens_used=10)
+        mock_judge.verify_claims = AsyncMock(
+            return_value=ClaimVerdictsResult(
+                verdicts=[
+                    ClaimVerdict(verdict="SUPPORTED", evidence="e1"),
+                    ClaimVerdict(verdict="CONTRADICTED", evidence="e2"),
+                ],
+                tokens_used=40,
+            )
+        )
+
+        result = await verify_all_claims("Response", ["context"], mock_judge)
+
+        mock_judge.verify_claims.assert_awaited_once_with(["A", "B"], ["context"])
+        mock_judge.verify_claim.assert_not_called()
+        assert [(d.claim, d.verdict) for d in result.claim_details] == [
+            ("A", "SUPPORTED"),
+            ("B", "CONTRADICTED"),
+        ]
+        assert result.total_tokens == 50
+
+    @pytest.mark.asyncio
+    async def test_verdict_count_mismatch_raises(self, mock_judge: MagicMock) -> None:
+        """A verify_claims result that doesn't cover every claim is a response error."""
+        mock_judge.extract_claims.return_value = ClaimsResult(claims=["A", "B"], tokens_used=10)
+        mock_judge.verify_claims = AsyncMock(
+            return_value=ClaimVerdictsResult(verdicts=[ClaimVerdict(verdict="SUPPORTED")])
+        )
+
+        with pytest.raises(JudgeResponseError, match="Expected 2 claim verdicts, got 1"):
+            await verify_all_claims("Response", ["context"], mock_judge)
+
+
+# =============================================================================
+# Concurrent Run Sharing
+# =============================================================================
+
+
+class TestConcurrentSharing:
+    """Tests that concurrent identical runs (faithfulness + hallucination) share one pass."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_run(self, mock_judge: MagicMock) -> None:
+        """The joiner gets the same verdicts and zero tokens; the judge is called once."""
+        mock_judge.extract_claims.return_value = ClaimsResult(claims=["A", "B"], tokens_used=10)
+        mock_judge.verify_claim.return_value = ClaimVerdict(
+            verdict="SUPPORTED", evidence="e", tokens_used=5
+        )
+
+        first, second = await asyncio.gather(
+            verify_all_claims("Response", ["context"], mock_judge),
+            verify_all_claims("Response", ["context"], mock_judge),
+        )
+
+        mock_judge.extract_claims.assert_awaited_once()
+        assert mock_judge.verify_claim.await_count == 2
+        assert first.total_tokens == 20
+        assert second.total_tokens == 0
+        assert second.claim_details == first.claim_details
+
+    @pytest.mark.asyncio
+    async def test_sequential_and_distinct_calls_run_separately(
+        self, mock_judge: MagicMock
+    ) -> None:
+        """Only in-flight runs are shared; finished or different inputs run again."""
+        mock_judge.extract_claims.return_value = ClaimsResult(claims=[], tokens_used=10)
+
+        await verify_all_claims("Response", ["context"], mock_judge)
+        await asyncio.gather(
+            verify_all_claims("Response", ["context"], mock_judge),
+            verify_all_claims("Other response", ["context"], mock_judge),
+        )
+
+        assert mock_judge.extract_claims.await_count == 3
+
+
 # =============================================================================
 # Result Model
 # =============================================================================
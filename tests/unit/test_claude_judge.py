@@ -7,16 +7,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from anthropic import APIConnectionError, APIStatusError
+from anthropic.types import Usage
 
 from ragaliq.judges import (
     ClaimsResult,
     ClaimVerdict,
     ClaudeJudge,
+    GeneratedQAPairsResult,
     JudgeAPIError,
     JudgeConfig,
     JudgeResponseError,
     JudgeResult,
 )
+from ragaliq.judges.transport import ClaudeTransport
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -25,7 +28,7 @@ if TYPE_CHECKING:
 @pytest.fixture
 def mock_anthropic_client() -> Generator[MagicMock]:
     """Create a mock Anthropic client."""
-    with patch("ragaliq.judges.transport.AsyncAnthropic") as mock_class:
+    with patch("anthropic.AsyncAnthropic") as mock_class:
         mock_client = MagicMock()
         mock_class.return_value = mock_client
         yield mock_client
@@ -36,8 +39,7 @@ def mock_response() -> MagicMock:
     """Create a mock Claude API response."""
     response = MagicMock()
     response.content = [MagicMock(type="text", text='{"score": 0.85, "reasoning": "Test"}')]
-    response.usage.input_tokens = 100
-    response.usage.output_tokens = 50
+    response.usage = Usage(input_tokens=100, output_tokens=50)
     return response
 
 
@@ -61,7 +63,7 @@ class TestClaudeJudgeInit:
         """Test that missing API key raises ValueError."""
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("ragaliq.judges.transport.AsyncAnthropic"),
+            patch("anthropic.AsyncAnthropic"),
             pytest.raises(ValueError, match="Anthropic API key required"),
         ):
             # Ensure ANTHROPIC_API_KEY is not set
@@ -84,6 +86,47 @@ class TestClaudeJudgeInit:
         assert repr(judge) == "ClaudeJudge(model='claude-sonnet-4-6')"
 
 
+class TestClaudeJudgeHttpClient:
+    """Tests for the shared HTTP client passed to the Anthropic SDK."""
+
+    def test_http_client_is_forwarded(self) -> None:
+        """A caller-supplied http_client backs the single SDK client."""
+        http_client = MagicMock()
+        with patch("anthropic.AsyncAnthropic") as mock_class:
+            ClaudeJudge(api_key="test-key", http_client=http_client)
+
+        mock_class.assert_called_once_with(api_key="test-key", http_client=http_client)
+
+    def test_default_pool_kept_for_default_concurrency(self) -> None:
+        """Concurrency within the SDK's keep-alive pool uses the SDK's own client."""
+        with patch("anthropic.AsyncAnthropic") as mock_class:
+            ClaudeJudge(api_key="test-key")
+
+        assert mock_class.call_args.kwargs["http_client"] is None
+
+    def test_pool_grows_to_max_concurrency(self) -> None:
+        """A concurrency cap above the default pool keeps that many connections alive."""
+        with (
+            patch("anthropic.AsyncAnthropic"),
+            patch("anthropic.DefaultAsyncHttpxClient") as mock_http_client,
+        ):
+            ClaudeJudge(api_key="test-key", max_concurrency=250)
+
+        limits = mock_http_client.call_args.kwargs["limits"]
+        assert limits.max_keepalive_connections == 250
+        assert limits.max_connections >= 250
+
+    async def test_aclose_closes_client_after_wrapping(self, mock_anthropic_client) -> None:
+        """aclose() reaches the SDK client even when the transport is wrapped."""
+        mock_anthropic_client.close = AsyncMock()
+        judge = ClaudeJudge(api_key="test-key")
+        judge.wrap_transport(AsyncMock())
+
+        await judge.aclose()
+
+        mock_anthropic_client.close.assert_awaited_once()
+
+
 class TestClaudeJudgeFaithfulness:
     """Tests for evaluate_faithfulness method."""
 
@@ -131,8 +174,7 @@ class TestClaudeJudgeFaithfulness:
         mock_response.content = [
             MagicMock(type="text", text='{"score": 0.95, "reasoning": "All claims supported"}')
         ]
-        mock_response.usage.input_tokens = 200
-        mock_response.usage.output_tokens = 60
+        mock_response.usage = Usage(input_tokens=200, output_tokens=60)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -157,8 +199,7 @@ class TestClaudeJudgeFaithfulness:
         mock_response.content = [
             MagicMock(type="text", text='{"score": 1.5, "reasoning": "Too high"}')
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -179,8 +220,7 @@ class TestClaudeJudgeFaithfulness:
         mock_response.content = [
             MagicMock(type="text", text='{"score": -0.5, "reasoning": "Negative"}')
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -207,8 +247,7 @@ class TestClaudeJudgeRelevance:
                 type="text", text='{"score": 0.92, "reasoning": "Directly answers the question"}'
             )
         ]
-        mock_response.usage.input_tokens = 80
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=80, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -235,8 +274,7 @@ class TestClaudeJudgeRelevance:
                 text='{"score": 0.1, "reasoning": "Response does not address the query"}',
             )
         ]
-        mock_response.usage.input_tokens = 80
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=80, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -306,8 +344,7 @@ class TestClaudeJudgeErrorHandling:
         success_response.content = [
             MagicMock(type="text", text='{"score": 0.85, "reasoning": "Recovered"}')
         ]
-        success_response.usage.input_tokens = 100
-        success_response.usage.output_tokens = 50
+        success_response.usage = Usage(input_tokens=100, output_tokens=50)
 
         mock_anthropic_client.messages.create = AsyncMock(
             side_effect=[
@@ -391,8 +428,7 @@ class TestClaudeJudgeErrorHandling:
         success_response.content = [
             MagicMock(type="text", text='{"score": 0.9, "reasoning": "Success after retry"}')
         ]
-        success_response.usage.input_tokens = 100
-        success_response.usage.output_tokens = 50
+        success_response.usage = Usage(input_tokens=100, output_tokens=50)
 
         mock_anthropic_client.messages.create = AsyncMock(
             side_effect=[
@@ -423,8 +459,7 @@ class TestClaudeJudgeErrorHandling:
         """Test handling of invalid JSON in response."""
         mock_response = MagicMock()
         mock_response.content = [MagicMock(type="text", text="Not valid JSON")]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -442,8 +477,7 @@ class TestClaudeJudgeErrorHandling:
         """Test handling of response missing score field."""
         mock_response = MagicMock()
         mock_response.content = [MagicMock(type="text", text='{"reasoning": "No score provided"}')]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -487,8 +521,7 @@ class TestClaudeJudgeJsonParsing:
                 text='```json\n{"score": 0.75, "reasoning": "Wrapped in markdown"}\n```',
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -512,8 +545,7 @@ class TestClaudeJudgeJsonParsing:
                 type="text", text='  \n  {"score": 0.80, "reasoning": "With whitespace"}  \n  '
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -532,8 +564,7 @@ class TestClaudeJudgeJsonParsing:
         """Test that missing reasoning field defaults to empty string."""
         mock_response = MagicMock()
         mock_response.content = [MagicMock(type="text", text='{"score": 0.6}')]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
+        mock_response.usage = Usage(input_tokens=100, output_tokens=50)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -603,6 +634,164 @@ class TestClaudeJudgeApiCallParameters:
         assert call_kwargs["temperature"] == 0.5
         assert call_kwargs["max_tokens"] == 2048
 
+    @pytest.mark.asyncio
+    async def test_short_system_prompt_sent_without_cache_marker(
+        self,
+        mock_anthropic_client: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """Built-in rubrics are below the minimum cacheable length, so no marker is sent."""
+        mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
+        judge = ClaudeJudge(api_key="test-key")
+
+        await judge.evaluate_relevance(query="Q?", response="A.")
+
+        system = mock_anthropic_client.messages.create.call_args.kwargs["system"]
+        assert isinstance(system, str)
+        assert "relevance" in system.lower()
+
+    @pytest.mark.asyncio
+    async def test_long_system_prompt_marked_for_prompt_caching(
+        self,
+        mock_anthropic_client: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """A cacheable system prompt is sent as one block with an ephemeral cache marker."""
+        mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
+        transport = ClaudeTransport(api_key="test-key")
+        rubric = "Score strictly. " * 400
+
+        await transport.send(system_prompt=rubric, user_prompt="Q")
+
+        (block,) = mock_anthropic_client.messages.create.call_args.kwargs["system"]
+        assert block == {"type": "text", "text": rubric, "cache_control": {"type": "ephemeral"}}
+
+    @pytest.mark.asyncio
+    async def test_cache_reads_and_writes_count_as_input_tokens(
+        self,
+        mock_anthropic_client: MagicMock,
+        mock_response: MagicMock,
+    ) -> None:
+        """usage.input_tokens excludes cached input, so cache tokens are added back."""
+        mock_response.usage = Usage(
+            input_tokens=10,
+            output_tokens=5,
+            cache_creation_input_tokens=1200,
+            cache_read_input_tokens=300,
+        )
+        mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
+        transport = ClaudeTransport(api_key="test-key")
+
+        response = await transport.send(system_prompt="sys", user_prompt="Q")
+
+        assert response.input_tokens == 1510
+        assert response.output_tokens == 5
+
+
+class TestClaudeJudgeGenerateQAPairs:
+    """Tests for fused question and answer generation."""
+
+    @pytest.mark.asyncio
+    async def test_single_call_returns_pairs(self, mock_anthropic_client: MagicMock) -> None:
+        """All pairs come from one API call with an output budget sized to n."""
+        mock_response = MagicMock()
+        mock_response.content = [
+            MagicMock(
+                type="text",
+                text='{"pairs": [{"question": "Who made X?", "answer": "Y made X."}]}',
+            )
+        ]
+        mock_response.usage = Usage(input_tokens=60, output_tokens=20)
+        mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
+
+        judge = ClaudeJudge(api_key="test-key")
+        result = await judge.generate_qa_pairs(["Y made X."], n=10)
+
+        assert isinstance(result, GeneratedQAPairsResult)
+        assert [(p.question, p.answer) for p in result.pairs] == [("Who made X?", "Y made X.")]
+        assert result.tokens_used == 80
+        mock_anthropic_client.messages.create.assert_awaited_once()
+        assert mock_anthropic_client.messages.create.call_args.kwargs["max_tokens"] == 2000
+
+    @pytest.mark.asyncio
+    async def test_large_n_split_across_capped_calls(
+        self, mock_anthropic_client: MagicMock
+    ) -> None:
+        """Calls stay under 8192 output tokens, run in turn, and together return n pairs."""
+        counter = iter(range(1000))
+
+        def respond(*, max_tokens: int, **_kwargs: object) -> MagicMock:
+            size = max_tokens // 200
+            pairs = ",".join(
+                f'{{"question": "Q{i}?", "answer": "A{i}."}}'
+                for i in (next(counter) for _ in range(size))
+            )
+            response = MagicMock()
+            response.content = [MagicMock(type="text", text=f'{{"pairs": [{pairs}]}}')]
+            response.usage = Usage(input_tokens=60, output_tokens=20)
+            return response
+
+        mock_anthropic_client.messages.create = AsyncMock(side_effect=respond)
+
+        judge = ClaudeJudge(api_key="test-key")
+        result = await judge.generate_qa_pairs(["Y made X."], n=100)
+
+        calls = mock_anthropic_client.messages.create.call_args_list
+        assert [c.kwargs["max_tokens"] for c in calls] == [8000, 8000, 4000]
+        assert len(result.pairs) == 100
+        assert len({p.question for p in result.pairs}) == 100
+        assert result.tokens_used == 240
+        # Later calls list the questions already generated, so their requests differ.
+        first, second, third = (c.kwargs["messages"][0]["content"] for c in calls)
+        assert "<existing_questions>" not in first
+        assert "- Q39?" in second and "- Q40?" not in second
+        assert "- Q79?" in third
+
+    @pytest.mark.asyncio
+    async def test_large_n_stops_and_warns_when_no_new_questions(
+        self, mock_anthropic_client: MagicMock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A call that only repeats earlier questions ends generation with a warning."""
+        mock_response = MagicMock()
+        mock_response.content = [
+            MagicMock(
+                type="text",
+                text='{"pairs": [{"question": "Who made X?", "answer": "Y made X."}]}',
+            )
+        ]
+        mock_response.usage = Usage(input_tokens=60, output_tokens=20)
+        mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
+
+        judge = ClaudeJudge(api_key="test-key")
+        with caplog.at_level("WARNING", logger="ragaliq.judges.base_judge"):
+            result = await judge.generate_qa_pairs(["Y made X."], n=100)
+
+        assert [p.question for p in result.pairs] == ["Who made X?"]
+        assert mock_anthropic_client.messages.create.await_count == 2
+        assert result.tokens_used == 160
+        assert "requested 100 pairs but only 1" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_malformed_pairs_raise(self, mock_anthropic_client: MagicMock) -> None:
+        """A 'pairs' value that isn't a list of question objects is a response error."""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(type="text", text='{"pairs": ["Who made X?"]}')]
+        mock_response.usage = Usage(input_tokens=10, output_tokens=5)
+        mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
+
+        judge = ClaudeJudge(api_key="test-key")
+        with pytest.raises(JudgeResponseError, match="pairs"):
+            await judge.generate_qa_pairs(["doc"], n=1)
+
+    @pytest.mark.asyncio
+    async def test_no_documents_skips_api(self, mock_anthropic_client: MagicMock) -> None:
+        """Without documents there is nothing to generate from."""
+        judge = ClaudeJudge(api_key="test-key")
+        result = await judge.generate_qa_pairs([], n=3)
+
+        assert result.pairs == []
+        mock_anthropic_client.messages.create.assert_not_called()
+
 
 class TestClaudeJudgeExtractClaims:
     """Tests for extract_claims method."""
@@ -620,8 +809,7 @@ class TestClaudeJudgeExtractClaims:
                 text='{"claims": ["Paris is the capital", "France is in Europe"]}',
             )
         ]
-        mock_response.usage.input_tokens = 50
-        mock_response.usage.output_tokens = 30
+        mock_response.usage = Usage(input_tokens=50, output_tokens=30)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -665,8 +853,7 @@ class TestClaudeJudgeExtractClaims:
         """Test handling of invalid claims type in response."""
         mock_response = MagicMock()
         mock_response.content = [MagicMock(type="text", text='{"claims": "not a list"}')]
-        mock_response.usage.input_tokens = 50
-        mock_response.usage.output_tokens = 30
+        mock_response.usage = Usage(input_tokens=50, output_tokens=30)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -686,8 +873,7 @@ class TestClaudeJudgeExtractClaims:
                 text='{"claims": ["Valid claim", "", null, "Another claim"]}',
             )
         ]
-        mock_response.usage.input_tokens = 50
-        mock_response.usage.output_tokens = 30
+        mock_response.usage = Usage(input_tokens=50, output_tokens=30)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -714,8 +900,7 @@ class TestClaudeJudgeVerifyClaim:
                 text='{"verdict": "SUPPORTED", "evidence": "Context confirms this"}',
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=100, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -741,8 +926,7 @@ class TestClaudeJudgeVerifyClaim:
                 text='{"verdict": "CONTRADICTED", "evidence": "Context says otherwise"}',
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=100, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -766,8 +950,7 @@ class TestClaudeJudgeVerifyClaim:
                 text='{"verdict": "NOT_ENOUGH_INFO", "evidence": "Not mentioned in context"}',
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=100, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -804,8 +987,7 @@ class TestClaudeJudgeVerifyClaim:
                 text='{"verdict": "MAYBE", "evidence": "Not sure"}',
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=100, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -828,8 +1010,7 @@ class TestClaudeJudgeVerifyClaim:
                 text='{"verdict": "supported", "evidence": "Works with lowercase"}',
             )
         ]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 40
+        mock_response.usage = Usage(input_tokens=100, output_tokens=40)
         mock_anthropic_client.messages.create = AsyncMock(return_value=mock_response)
 
         judge = ClaudeJudge(api_key="test-key")
@@ -1,7 +1,11 @@
 """Unit tests for RagaliQ CLI entry point."""
 
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 import ragaliq
@@ -28,6 +32,77 @@ class TestCLIVersion:
         assert f"RagaliQ version {ragaliq.__version__}" in result.output
 
 
+class TestLazyImports:
+    """Test that the CLI entry point stays cheap to import."""
+
+    def test_cli_import_does_not_load_heavy_dependencies(self):
+        """Importing the CLI (as `ragaliq --version` does) skips anthropic and rich."""
+        code = (
+            "import sys, ragaliq.cli.main; "
+            "print(sorted(m for m in ('anthropic', 'rich.progress', 'ragaliq.core.runner') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.parametrize("argv", [["version"], ["--version"], ["-V"]])
+    def test_version_dispatch_does_not_load_heavy_dependencies(self, argv):
+        """Dispatching the version command or flag skips every import only `run` needs.
+
+        asyncio alone is ~50 ms of startup, so it stays local to the commands that use it.
+        """
+        code = (
+            "import atexit, sys\n"
+            "atexit.register(lambda: print(sorted({m.split('.')[0] for m in sys.modules}"
+            " & {'anthropic', 'asyncio', 'json', 'rich', 'yaml'})))\n"
+            "from ragaliq.cli.main import app\n"
+            f"sys.argv = ['ragaliq', *{argv!r}]\n"
+            "app()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["validate", str(Path(__file__).parents[1] / "fixtures" / "sample_dataset.json")],
+            ["validate", str(Path(__file__).parents[1] / "fixtures" / "sample_dataset.csv")],
+            ["list-evaluators"],
+        ],
+    )
+    def test_judge_free_commands_do_not_load_anthropic_or_yaml(self, argv):
+        """Judge-free commands skip the anthropic SDK, and PyYAML for non-YAML datasets."""
+        code = (
+            "import atexit, sys\n"
+            "atexit.register(lambda: print(sorted({'anthropic', 'yaml'} & set(sys.modules))))\n"
+            "from ragaliq.cli.main import app\n"
+            f"sys.argv = ['ragaliq', *{argv!r}]\n"
+            "app()\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_public_names_resolve_lazily(self):
+        """Every name in ragaliq.__all__ resolves to its defining object."""
+        from ragaliq.core.runner import RagaliQ
+
+        assert ragaliq.RagaliQ is RagaliQ
+        assert all(hasattr(ragaliq, name) for name in ragaliq.__all__)
+
+    def test_unknown_attribute_raises(self):
+        """Unknown attributes still raise AttributeError."""
+        assert not hasattr(ragaliq, "DoesNotExist")
+
+
 class TestCLINoArgs:
     """Test CLI with no arguments."""
 
@@ -183,6 +258,7 @@ class TestRunCommand:
             patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
             patch("ragaliq.RagaliQ") as mock_cls,
         ):
+            mock_cls.return_value.aclose = AsyncMock()
             mock_cls.return_value.evaluate_batch_async = AsyncMock(
                 return_value=[self._mock_passing_result()]
             )
@@ -199,6 +275,7 @@ class TestRunCommand:
             patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
             patch("ragaliq.RagaliQ") as mock_cls,
         ):
+            mock_cls.return_value.aclose = AsyncMock()
             mock_cls.return_value.evaluate_batch_async = AsyncMock(
                 return_value=[self._mock_failing_result()]
             )
@@ -241,6 +318,7 @@ class TestRunCommand:
             patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
             patch("ragaliq.RagaliQ") as mock_cls,
         ):
+            mock_cls.return_value.aclose = AsyncMock()
             mock_cls.return_value.evaluate_batch_async = AsyncMock(return_value=[mock_result])
             runner.invoke(app, ["run", "dataset.json", "--evaluator", "relevance"])
 
@@ -256,6 +334,7 @@ class TestRunCommand:
             patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
             patch("ragaliq.RagaliQ") as mock_cls,
         ):
+            mock_cls.return_value.aclose = AsyncMock()
             mock_cls.return_value.evaluate_batch_async = AsyncMock(
                 return_value=[self._mock_passing_result()]
             )
@@ -264,6 +343,193 @@ class TestRunCommand:
         call_kwargs = mock_cls.call_args.kwargs
         assert call_kwargs["default_threshold"] == 0.9
 
+    def test_max_concurrency_option_forwarded_to_runner(self):
+        """--max-concurrency option is forwarded to RagaliQ constructor."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(app, ["run", "dataset.json", "--max-concurrency", "20"])
+
+        call_kwargs = mock_cls.call_args.kwargs
+        assert call_kwargs["max_concurrency"] == 20
+
+    def test_max_judge_concurrency_option_forwarded_to_runner(self):
+        """--max-judge-concurrency option is forwarded to RagaliQ constructor."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(app, ["run", "dataset.json", "--max-judge-concurrency", "8"])
+
+        assert mock_cls.call_args.kwargs["max_judge_concurrency"] == 8
+
+    def test_rate_limit_options_forwarded_to_runner(self):
+        """--requests-per-minute and --input-tokens-per-minute reach the RagaliQ constructor."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(
+                app,
+                [
+                    "run",
+                    "dataset.json",
+                    "--requests-per-minute",
+                    "50",
+                    "--input-tokens-per-minute",
+                    "40000",
+                ],
+            )
+
+        assert mock_cls.call_args.kwargs["requests_per_minute"] == 50
+        assert mock_cls.call_args.kwargs["input_tokens_per_minute"] == 40000
+
+    def test_max_concurrency_rejects_zero(self):
+        """--max-concurrency must be at least 1."""
+        result = runner.invoke(app, ["run", "dataset.json", "--max-concurrency", "0"])
+
+        assert result.exit_code != 0
+
+    def test_cache_enabled_by_default(self):
+        """run caches judge responses at the default path unless told otherwise."""
+        from ragaliq.judges.cache import DEFAULT_CACHE_PATH
+
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(app, ["run", "dataset.json"])
+
+        assert mock_cls.call_args.kwargs["cache_path"] == DEFAULT_CACHE_PATH
+
+    def test_cache_path_option_forwarded_to_runner(self):
+        """--cache-path overrides the cache location."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(app, ["run", "dataset.json", "--cache-path", "custom.db"])
+
+        assert mock_cls.call_args.kwargs["cache_path"] == Path("custom.db")
+
+    def test_no_cache_disables_cache(self):
+        """--no-cache passes no cache path to the runner."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(app, ["run", "dataset.json", "--no-cache"])
+
+        assert mock_cls.call_args.kwargs["cache_path"] is None
+
+    def test_raw_responses_kept_only_when_surfaced(self, tmp_path):
+        """Raw judge payloads are kept for --verbose or JSON output, dropped otherwise."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+        cases = [
+            ([], False),
+            (["--verbose"], True),
+            (["--output", "json", "--output-file", str(tmp_path / "out.json")], True),
+        ]
+
+        for extra_args, expected in cases:
+            with (
+                patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+                patch("ragaliq.RagaliQ") as mock_cls,
+                patch("ragaliq.reports.json_export.JSONReporter"),
+            ):
+                mock_cls.return_value.aclose = AsyncMock()
+                mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                    return_value=[self._mock_passing_result()]
+                )
+                runner.invoke(app, ["run", "dataset.json", *extra_args])
+            assert mock_cls.call_args.kwargs["keep_raw_responses"] is expected, extra_args
+
+    def test_adaptive_concurrency_forwarded_to_runner(self):
+        """--adaptive-concurrency is off by default and forwarded when set."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock()]
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(
+                return_value=[self._mock_passing_result()]
+            )
+            runner.invoke(app, ["run", "dataset.json"])
+            assert mock_cls.call_args.kwargs["adaptive_concurrency"] is False
+            runner.invoke(app, ["run", "dataset.json", "--adaptive-concurrency"])
+            assert mock_cls.call_args.kwargs["adaptive_concurrency"] is True
+
+    def test_progress_bar_advances_per_result(self):
+        """Outside CI, a callback is passed so the progress bar can count results."""
+        mock_dataset = MagicMock()
+        mock_dataset.test_cases = [MagicMock(), MagicMock()]
+        results = [self._mock_passing_result("a"), self._mock_passing_result("b")]
+
+        async def evaluate(_test_cases, on_result=None):
+            for r in results:
+                on_result(r)
+            return results
+
+        with (
+            patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
+            patch("ragaliq.RagaliQ") as mock_cls,
+            patch("ragaliq.integrations.github_actions.is_ci", return_value=False),
+            patch("rich.progress.Progress.advance") as advance,
+        ):
+            mock_cls.return_value.aclose = AsyncMock()
+            mock_cls.return_value.evaluate_batch_async = AsyncMock(side_effect=evaluate)
+            result = runner.invoke(app, ["run", "dataset.json"])
+
+        assert result.exit_code == 0
+        assert advance.call_count == 2
+
     def test_summary_shows_pass_count(self):
         """run outputs a summary line with the pass/total count."""
         mock_dataset = MagicMock()
@@ -273,6 +539,7 @@ class TestRunCommand:
             patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
             patch("ragaliq.RagaliQ") as mock_cls,
         ):
+            mock_cls.return_value.aclose = AsyncMock()
             mock_cls.return_value.evaluate_batch_async = AsyncMock(
                 return_value=[self._mock_passing_result()]
             )
@@ -321,6 +588,7 @@ class TestRunCommand:
                 patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
                 patch("ragaliq.RagaliQ") as mock_cls,
             ):
+                mock_cls.return_value.aclose = AsyncMock()
                 mock_cls.return_value.evaluate_batch_async = AsyncMock(
                     return_value=[self._real_passing_result()]
                 )
@@ -349,6 +617,7 @@ class TestRunCommand:
                 patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
                 patch("ragaliq.RagaliQ") as mock_cls,
             ):
+                mock_cls.return_value.aclose = AsyncMock()
                 mock_cls.return_value.evaluate_batch_async = AsyncMock(
                     return_value=[self._real_passing_result()]
                 )
@@ -376,6 +645,7 @@ class TestRunCommand:
                 patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
                 patch("ragaliq.RagaliQ") as mock_cls,
             ):
+                mock_cls.return_value.aclose = AsyncMock()
                 mock_cls.return_value.evaluate_batch_async = AsyncMock(
                     return_value=[self._real_passing_result()]
                 )
@@ -395,6 +665,7 @@ class TestRunCommand:
             patch("ragaliq.datasets.DatasetLoader.load", return_value=mock_dataset),
             patch("ragaliq.RagaliQ") as mock_cls,
         ):
+            mock_cls.return_value.aclose = AsyncMock()
             mock_cls.return_value.evaluate_batch_async = AsyncMock(
                 return_value=[self._mock_passing_result()]
             )
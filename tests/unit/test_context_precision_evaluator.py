@@ -595,6 +595,31 @@ class TestContextPrecisionJudgeInteraction:
 
         assert mock_judge.evaluate_relevance.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_duplicate_documents_judged_once(self, mock_judge: MagicMock) -> None:
+        """Identical documents share one judge call; the score applies at every rank."""
+        mock_judge.evaluate_relevance = AsyncMock(
+            side_effect=[
+                JudgeResult(score=1.0, reasoning="", tokens_used=100),
+                JudgeResult(score=0.0, reasoning="", tokens_used=100),
+            ]
+        )
+        test_case = RAGTestCase(
+            id="dupes",
+            name="Duplicate chunks",
+            query="Query?",
+            context=["Relevant chunk", "Off-topic chunk", "Relevant chunk"],
+            response="Response",
+        )
+
+        result = await ContextPrecisionEvaluator().evaluate(test_case, mock_judge)
+
+        assert mock_judge.evaluate_relevance.call_count == 2
+        assert [d["score"] for d in result.raw_response["doc_scores"]] == [1.0, 0.0, 1.0]
+        assert result.raw_response["total_docs"] == 3
+        assert result.score == pytest.approx((1.0 + 1.0 / 3) / (1.0 + 1.0 / 2 + 1.0 / 3))
+        assert result.tokens_used == 200
+
     @pytest.mark.asyncio
     async def test_calls_judge_with_query_and_doc(
         self,
@@ -624,6 +649,44 @@ class TestContextPrecisionJudgeInteraction:
         mock_judge.extract_claims.assert_not_called()
         mock_judge.verify_claim.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_many_documents_stay_within_judge_concurrency(self) -> None:
+        """Per-document calls are capped by the judge's max_concurrency, not fired all at once."""
+        import asyncio
+
+        from ragaliq.judges.base_judge import BaseJudge
+        from ragaliq.judges.transport import TransportResponse
+
+        in_flight = 0
+        peak = 0
+
+        async def send(*_args, **_kwargs) -> TransportResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TransportResponse(
+                text='{"score": 1.0, "reasoning": "ok"}', input_tokens=1, output_tokens=1, model="m"
+            )
+
+        transport = MagicMock()
+        transport.send = send
+        test_case = RAGTestCase(
+            id="many_docs",
+            name="Many docs",
+            query="Query?",
+            context=[f"Document {i}" for i in range(20)],
+            response="Response",
+        )
+
+        result = await ContextPrecisionEvaluator().evaluate(
+            test_case, BaseJudge(transport=transport, max_concurrency=4)
+        )
+
+        assert result.raw_response["total_docs"] == 20
+        assert peak == 4
+
 
 # =============================================================================
 # Reasoning Tests
@@ -2,6 +2,7 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -71,6 +72,15 @@ class TestDatasetSchema:
         with pytest.raises(ValueError, match="Duplicate test case IDs"):
             DatasetSchema(test_cases=[test_case_1, test_case_2])
 
+    def test_duplicate_ids_reported_once_each(self):
+        """Each duplicated ID is named once, in first-seen order."""
+        test_cases = [
+            RAGTestCase(id=tc_id, name="n", query="q", context=["c"], response="r")
+            for tc_id in ["b", "a", "b", "c", "a", "b"]
+        ]
+        with pytest.raises(ValueError, match=r"\['b', 'a'\]"):
+            DatasetSchema(test_cases=test_cases)
+
     def test_empty_test_cases_rejected(self):
         """Test that empty test cases list is rejected."""
         with pytest.raises(ValueError, match="at least 1 item"):
@@ -113,6 +123,42 @@ class TestDatasetLoaderJSON:
         assert len(tc.expected_facts) == 2
         assert tc.tags == ["python", "lists", "basic"]
 
+    def test_load_json_with_utf8_bom(self, tmp_path: Path):
+        """A BOM-prefixed file (as saved by some Windows editors) loads normally."""
+        data = {
+            "test_cases": [
+                {
+                    "id": "t1",
+                    "name": "Café",
+                    "query": "Query?",
+                    "context": ["Context"],
+                    "response": "Response",
+                }
+            ]
+        }
+        bom_json = tmp_path / "bom.json"
+        bom_json.write_bytes(b"\xef\xbb\xbf" + json.dumps(data, ensure_ascii=False).encode())
+        dataset = DatasetLoader.load(bom_json)
+        assert dataset.test_cases[0].name == "Café"
+
+    def test_load_json_utf16(self, tmp_path: Path):
+        """UTF-16 files are detected and decoded, as json.loads would."""
+        data = {
+            "test_cases": [
+                {
+                    "id": "t1",
+                    "name": "Café",
+                    "query": "Query?",
+                    "context": ["Context"],
+                    "response": "Response",
+                }
+            ]
+        }
+        utf16_json = tmp_path / "utf16.json"
+        utf16_json.write_bytes(json.dumps(data, ensure_ascii=False).encode("utf-16"))
+        dataset = DatasetLoader.load(utf16_json)
+        assert dataset.test_cases[0].name == "Café"
+
     def test_load_invalid_json(self, tmp_path: Path):
         """Test loading invalid JSON file."""
         invalid_json = tmp_path / "invalid.json"
@@ -170,6 +216,35 @@ class TestDatasetLoaderYAML:
         dataset = DatasetLoader.load(yml_file)
         assert len(dataset.test_cases) == 1
 
+    def test_load_non_ascii_yaml(self, tmp_path: Path):
+        """UTF-8 content decodes correctly regardless of the platform locale."""
+        yaml_file = tmp_path / "unicode.yaml"
+        yaml_file.write_text(
+            "test_cases:\n"
+            "  - id: t1\n"
+            "    name: Café\n"
+            "    query: Où est la tour Eiffel ?\n"
+            "    context: [La tour Eiffel est à Paris.]\n"
+            "    response: À Paris.\n",
+            encoding="utf-8",
+        )
+        dataset = DatasetLoader.load(yaml_file)
+        assert dataset.test_cases[0].query == "Où est la tour Eiffel ?"
+
+    def test_yaml_rejects_python_tags(self, tmp_path: Path):
+        """The (C-accelerated) loader keeps safe_load semantics."""
+        yaml_file = tmp_path / "unsafe.yaml"
+        yaml_file.write_text("test_cases: !!python/object/apply:os.getcwd []\n")
+        with pytest.raises(DatasetLoadError, match="Failed to parse .yaml file"):
+            DatasetLoader.load(yaml_file)
+
+    def test_uses_libyaml_loader_when_available(self, valid_yaml_dataset: Path):
+        """Dataset YAML goes through CSafeLoader if PyYAML was built with libyaml."""
+        with patch("yaml.load", wraps=yaml.load) as spy:
+            DatasetLoader.load(valid_yaml_dataset)
+
+        assert spy.call_args.kwargs["Loader"] is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     def test_load_invalid_yaml(self, tmp_path: Path):
         """Test loading invalid YAML file."""
         invalid_yaml = tmp_path / "invalid.yaml"
@@ -204,6 +279,25 @@ class TestDatasetLoaderCSV:
         # expected_answer is empty in CSV row 2
         assert tc.expected_answer is None
 
+    def test_load_csv_any_column_order_blank_lines_and_short_rows(self, tmp_path: Path):
+        """Columns are found by header name; blank lines are skipped; short rows pad empty."""
+        csv_file = tmp_path / "reordered.csv"
+        csv_file.write_text(
+            "response,id,query,name,context,tags\n"
+            "Resp 1,t1,Query 1?,One,ctx a|ctx b,x|y\n"
+            "\n"
+            "Resp 2,t2,Query 2?,Two,ctx c\n"
+        )
+        dataset = DatasetLoader.load(csv_file)
+        first, second = dataset.test_cases
+        assert (first.id, first.query, first.context, first.tags) == (
+            "t1",
+            "Query 1?",
+            ["ctx a", "ctx b"],
+            ["x", "y"],
+        )
+        assert (second.id, second.response, second.tags) == ("t2", "Resp 2", [])
+
     def test_load_csv_missing_header(self, tmp_path: Path):
         """Test CSV file with no header row."""
         no_header_csv = tmp_path / "no_header.csv"
@@ -245,6 +339,95 @@ test_1,Test,Query?,"[""Context 1"", ""Context 2""]",Response,"[""tag1"", ""tag2"
         with pytest.raises(DatasetLoadError, match="CSV row 2 parse error"):
             DatasetLoader.load(invalid_csv)
 
+    def test_load_csv_rows_are_validated(self, tmp_path: Path):
+        """CSV rows go through RAGTestCase validation, so a blank query is rejected."""
+        blank_query = tmp_path / "blank_query.csv"
+        blank_query.write_text(
+            "id,name,query,context,response\n"
+            "test_1,Test,Query?,ctx,Response\n"
+            "test_2,Test,   ,ctx,Response\n"
+        )
+        with pytest.raises(DatasetLoadError, match="CSV row 3 parse error"):
+            DatasetLoader.load(blank_query)
+
+
+class TestDatasetLoaderIterLoad:
+    """Test streaming test case iteration."""
+
+    def test_csv_matches_load(self, valid_csv_dataset: Path):
+        """iter_load yields the same test cases as load for CSV."""
+        streamed = list(DatasetLoader.iter_load(valid_csv_dataset))
+        assert streamed == DatasetLoader.load(valid_csv_dataset).test_cases
+
+    def test_json_and_yaml_supported(self, valid_json_dataset: Path, valid_yaml_dataset: Path):
+        """Non-CSV formats fall back to a whole-file load."""
+        assert len(list(DatasetLoader.iter_load(valid_json_dataset))) == 2
+        assert len(list(DatasetLoader.iter_load(valid_yaml_dataset))) == 2
+
+    def test_csv_is_lazy(self, tmp_path: Path):
+        """Rows before a bad row are yielded before the error is raised."""
+        csv_file = tmp_path / "partial.csv"
+        csv_file.write_text(
+            "id,name,query,context,response\n"
+            "t1,First,Q1?,ctx,Answer one\n"
+            "t2,Second,Q2?,[not json,Answer two\n"
+        )
+        cases = DatasetLoader.iter_load(csv_file)
+        assert next(cases).id == "t1"
+        with pytest.raises(DatasetLoadError, match="CSV row 3"):
+            next(cases)
+
+    def test_csv_duplicate_ids_raise(self, tmp_path: Path):
+        """Duplicate IDs are still rejected while streaming."""
+        csv_file = tmp_path / "dupes.csv"
+        csv_file.write_text("id,name,query,context,response\nt1,A,Q?,ctx,R\nt1,B,Q?,ctx,R\n")
+        with pytest.raises(DatasetLoadError, match="Duplicate test case ID"):
+            list(DatasetLoader.iter_load(csv_file))
+
+    def test_csv_header_only_raises(self, tmp_path: Path):
+        """A CSV with no data rows is an error, as with load."""
+        csv_file = tmp_path / "empty.csv"
+        csv_file.write_text("id,name,query,context,response\n")
+        with pytest.raises(DatasetLoadError, match="no test cases"):
+            list(DatasetLoader.iter_load(csv_file))
+
+    def test_missing_file_raises(self, tmp_path: Path):
+        """A missing path raises DatasetLoadError on first iteration."""
+        with pytest.raises(DatasetLoadError, match="not found"):
+            list(DatasetLoader.iter_load(tmp_path / "missing.csv"))
+
+
+class TestDatasetLoaderAsync:
+    """Test loading from async code."""
+
+    async def test_load_async_matches_load(self, valid_csv_dataset: Path):
+        """load_async returns the same dataset as load."""
+        assert await DatasetLoader.load_async(valid_csv_dataset) == DatasetLoader.load(
+            valid_csv_dataset
+        )
+
+    async def test_load_async_runs_off_the_event_loop_thread(self, valid_json_dataset: Path):
+        """The load runs in a worker thread, so the event loop stays free."""
+        import threading
+
+        load = DatasetLoader.load
+        load_threads = []
+
+        def recording_load(path: Path) -> DatasetSchema:
+            load_threads.append(threading.get_ident())
+            return load(path)
+
+        with patch.object(DatasetLoader, "load", side_effect=recording_load):
+            await DatasetLoader.load_async(valid_json_dataset)
+
+        assert load_threads
+        assert threading.get_ident() not in load_threads
+
+    async def test_load_async_raises_load_errors(self, tmp_path: Path):
+        """Errors surface to the awaiting caller unchanged."""
+        with pytest.raises(DatasetLoadError, match="not found"):
+            await DatasetLoader.load_async(tmp_path / "missing.json")
+
 
 class TestDatasetLoaderErrors:
     """Test error handling in dataset loader."""
@@ -289,6 +472,7 @@ class TestDatasetLoaderErrors:
             DatasetLoader.load(invalid_json)
         # Check that error message is formatted with bullet points
         assert "•" in str(exc_info.value)
+        assert "• test_cases -> 0 -> tags: Input should be" in str(exc_info.value)
 
 
 class TestDatasetLoaderPathTypes:
@@ -9,6 +9,7 @@ Tests follow the acceptance criteria from Issue #6:
 
 from __future__ import annotations
 
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -36,6 +37,8 @@ def mock_judge() -> MagicMock:
     # Default: no claims extracted
     judge.extract_claims = AsyncMock(return_value=ClaimsResult(claims=[], tokens_used=10))
     judge.verify_claim = AsyncMock()
+    # Run the default verify_claims so tests drive the per-claim verify_claim mock.
+    judge.verify_claims = partial(LLMJudge.verify_claims, judge)
     return judge
 
 
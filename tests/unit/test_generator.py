@@ -1,12 +1,13 @@
 """Unit tests for TestCaseGenerator."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from ragaliq.datasets.generator import TestCaseGenerator, _derive_name
-from ragaliq.judges.base import GeneratedAnswerResult, GeneratedQuestionsResult
+from ragaliq.judges.base import GeneratedQAPairsResult, QAPair
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -14,13 +15,13 @@ from ragaliq.judges.base import GeneratedAnswerResult, GeneratedQuestionsResult
 
 
 def _make_judge(questions: list[str], answers: list[str]) -> MagicMock:
-    """Build a mock judge that returns fixed questions then fixed answers."""
+    """Build a mock judge that returns fixed question/answer pairs."""
     judge = MagicMock()
-    judge.generate_questions = AsyncMock(
-        return_value=GeneratedQuestionsResult(questions=questions, tokens_used=100)
-    )
-    judge.generate_answer = AsyncMock(
-        side_effect=[GeneratedAnswerResult(answer=a, tokens_used=50) for a in answers]
+    judge.generate_qa_pairs = AsyncMock(
+        return_value=GeneratedQAPairsResult(
+            pairs=[QAPair(question=q, answer=a) for q, a in zip(questions, answers, strict=True)],
+            tokens_used=100,
+        )
     )
     return judge
 
@@ -157,30 +158,43 @@ class TestTestCaseGeneratorGeneration:
         assert len(ids) == len(set(ids))
 
     @pytest.mark.asyncio
-    async def test_judge_generate_questions_called_with_correct_args(self) -> None:
+    async def test_ids_are_version_4_uuids(self) -> None:
+        import uuid
+
         judge = _make_judge(["Q1?", "Q2?"], ["A1", "A2"])
-        await TestCaseGenerator().generate_from_documents(documents=["doc"], n=2, judge=judge)
-        judge.generate_questions.assert_called_once_with(["doc"], 2)
+        result = await TestCaseGenerator().generate_from_documents(
+            documents=["doc"], n=2, judge=judge
+        )
+        parsed = [uuid.UUID(tc.id) for tc in result]
+        assert all(u.version == 4 and u.variant == uuid.RFC_4122 for u in parsed)
+        assert [str(u) for u in parsed] == [tc.id for tc in result]
 
     @pytest.mark.asyncio
-    async def test_generate_answer_called_once_per_question(self) -> None:
+    async def test_one_judge_call_for_all_pairs(self) -> None:
         judge = _make_judge(["Q1?", "Q2?", "Q3?"], ["A1", "A2", "A3"])
         await TestCaseGenerator().generate_from_documents(documents=["doc"], n=3, judge=judge)
-        assert judge.generate_answer.call_count == 3
+        judge.generate_qa_pairs.assert_awaited_once_with(["doc"], 3)
 
     @pytest.mark.asyncio
     async def test_trims_excess_questions_from_llm(self) -> None:
-        """If LLM returns more questions than n, only the first n are used."""
-        # 5 questions returned, but only 3 answers needed
+        """If LLM returns more pairs than n, only the first n are used."""
         judge = _make_judge(
             ["Q1?", "Q2?", "Q3?", "Q4?", "Q5?"],
-            ["A1", "A2", "A3"],
+            ["A1", "A2", "A3", "A4", "A5"],
         )
         result = await TestCaseGenerator().generate_from_documents(
             documents=["doc"], n=3, judge=judge
         )
-        assert len(result) == 3
-        assert judge.generate_answer.call_count == 3
+        assert [tc.query for tc in result] == ["Q1?", "Q2?", "Q3?"]
+
+    @pytest.mark.asyncio
+    async def test_blank_generated_answer_is_rejected(self) -> None:
+        """Judge output is untrusted: cases are validated, not built with model_construct."""
+        from pydantic import ValidationError
+
+        judge = _make_judge(["Q?"], ["   "])
+        with pytest.raises(ValidationError, match="response"):
+            await TestCaseGenerator().generate_from_documents(documents=["doc"], n=1, judge=judge)
 
 
 # ---------------------------------------------------------------------------
@@ -205,6 +219,26 @@ class TestTestCaseGeneratorSync:
         with pytest.raises(ValueError, match="documents must not be empty"):
             TestCaseGenerator().generate_from_documents_sync(documents=[], n=1, judge=judge)
 
+    def test_sync_calls_reuse_one_event_loop(self) -> None:
+        """Repeated sync calls run on the same loop until close()."""
+        loops = []
+
+        async def record_loop(*_args, **_kwargs) -> GeneratedQAPairsResult:
+            loops.append(asyncio.get_running_loop())
+            return GeneratedQAPairsResult(pairs=[], tokens_used=0)
+
+        judge = MagicMock()
+        judge.generate_qa_pairs = AsyncMock(side_effect=record_loop)
+        generator = TestCaseGenerator()
+
+        generator.generate_from_documents_sync(documents=["doc"], n=1, judge=judge)
+        generator.generate_from_documents_sync(documents=["doc"], n=1, judge=judge)
+        generator.close()
+        generator.close()
+
+        assert loops[0] is loops[1]
+        assert loops[0].is_closed()
+
 
 # ---------------------------------------------------------------------------
 # CLI generate command
@@ -248,11 +282,73 @@ class TestCLIGenerateCommand:
             runner = CliRunner()
             result = runner.invoke(
                 app,
-                ["generate", str(doc_file), "-n", "1", "-o", str(output_file)],
+                ["generate", str(doc_file), "-n", "1", "-o", str(output_file), "--no-cache"],
             )
 
         assert result.exit_code == 0
 
+    def test_generate_writes_loadable_dataset(self, tmp_path: Path) -> None:
+        from typer.testing import CliRunner
+
+        from ragaliq.cli.main import app
+        from ragaliq.datasets import DatasetLoader
+
+        doc_file = tmp_path / "doc.txt"
+        doc_file.write_text("Python is a programming language.")
+        output_file = tmp_path / "out.json"
+        real_tc = self._real_test_case()
+
+        with (
+            patch("ragaliq.judges.ClaudeJudge") as mock_judge_cls,
+            patch("ragaliq.datasets.generator.TestCaseGenerator") as mock_gen_cls,
+        ):
+            mock_judge_cls.return_value = MagicMock()
+            mock_gen_cls.return_value.generate_from_documents = AsyncMock(return_value=[real_tc])
+            CliRunner().invoke(
+                app,
+                ["generate", str(doc_file), "-n", "1", "-o", str(output_file), "--no-cache"],
+            )
+
+        dataset = DatasetLoader.load(output_file)
+        assert dataset.test_cases == [real_tc]
+        assert dataset.metadata["generator"] == "ragaliq"
+
+    def test_generate_wraps_judge_with_cache(self, tmp_path: Path) -> None:
+        from typer.testing import CliRunner
+
+        from ragaliq.cli.main import app
+        from ragaliq.judges.cache import CachingTransport
+
+        doc_file = tmp_path / "doc.txt"
+        doc_file.write_text("Python is a programming language.")
+        cache_file = tmp_path / "judge.db"
+
+        with (
+            patch("ragaliq.judges.ClaudeJudge") as mock_judge_cls,
+            patch("ragaliq.datasets.generator.TestCaseGenerator") as mock_gen_cls,
+        ):
+            mock_gen_cls.return_value.generate_from_documents = AsyncMock(
+                return_value=[self._real_test_case()]
+            )
+            CliRunner().invoke(
+                app,
+                [
+                    "generate",
+                    str(doc_file),
+                    "-n",
+                    "1",
+                    "-o",
+                    str(tmp_path / "out.json"),
+                    "--cache-path",
+                    str(cache_file),
+                ],
+            )
+
+        (wrapper,) = mock_judge_cls.return_value.wrap_transport.call_args.args
+        assert isinstance(wrapper, CachingTransport)
+        assert cache_file.exists()
+        wrapper.cache.close()
+
     def test_generate_exits_one_for_missing_docs(self, tmp_path: Path) -> None:
         from typer.testing import CliRunner
 
@@ -315,6 +411,28 @@ class TestLoadDocuments:
         result = _load_documents(tmp_path)
         assert sorted(result) == ["Doc A", "Doc B"]
 
+    def test_directory_preserves_sorted_order(self, tmp_path: Path) -> None:
+        from ragaliq.cli.main import _load_documents
+
+        for i in range(50):
+            (tmp_path / f"{i:03d}.txt").write_text(f"Doc {i}")
+        (tmp_path / "blank.txt").write_text("  ")
+        result = _load_documents(tmp_path)
+        assert result == [f"Doc {i}" for i in range(50)]
+
+    def test_directory_read_error_propagates(self, tmp_path: Path) -> None:
+        from ragaliq.cli.main import _load_documents
+
+        (tmp_path / "a.txt").write_text("Doc A")
+        (tmp_path / "b.txt").write_bytes(b"\xff\xfe not utf-8")
+        with pytest.raises(UnicodeDecodeError):
+            _load_documents(tmp_path)
+
+    def test_empty_directory_returns_empty_list(self, tmp_path: Path) -> None:
+        from ragaliq.cli.main import _load_documents
+
+        assert _load_documents(tmp_path) == []
+
     def test_directory_ignores_non_txt_files(self, tmp_path: Path) -> None:
         from ragaliq.cli.main import _load_documents
 
@@ -341,6 +459,14 @@ class TestLoadDocuments:
         result = _load_documents(doc)
         assert result == ["Doc One", "Doc Two"]
 
+    def test_yaml_non_ascii_documents(self, tmp_path: Path) -> None:
+        from ragaliq.cli.main import _load_documents
+
+        doc = tmp_path / "docs.yaml"
+        doc.write_text("- Café au lait\n- Ünïcode ✓\n", encoding="utf-8")
+        result = _load_documents(doc)
+        assert result == ["Café au lait", "Ünïcode ✓"]
+
     def test_nonexistent_path_returns_empty_list(self, tmp_path: Path) -> None:
         from ragaliq.cli.main import _load_documents
 
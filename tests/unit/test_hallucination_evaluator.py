@@ -9,6 +9,7 @@ Tests follow the acceptance criteria from Issue #8:
 
 from __future__ import annotations
 
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -19,6 +20,7 @@ from ragaliq.evaluators.hallucination import HallucinationEvaluator
 from ragaliq.judges.base import (
     ClaimsResult,
     ClaimVerdict,
+    ClaimVerdictsResult,
     JudgeAPIError,
     JudgeResponseError,
     LLMJudge,
@@ -36,6 +38,8 @@ def mock_judge() -> MagicMock:
     # Default: no claims extracted
     judge.extract_claims = AsyncMock(return_value=ClaimsResult(claims=[], tokens_used=10))
     judge.verify_claim = AsyncMock()
+    # Run the default verify_claims so tests drive the per-claim verify_claim mock.
+    judge.verify_claims = partial(LLMJudge.verify_claims, judge)
     return judge
 
 
@@ -591,6 +595,58 @@ class TestHallucinationEvaluatorEdgeCases:
         assert "all" in result.reasoning.lower()
         assert "hallucinated" in result.reasoning.lower()
 
+    @pytest.mark.asyncio
+    async def test_claims_verified_concurrently(
+        self,
+        mock_judge: MagicMock,
+        grounded_test_case: RAGTestCase,
+    ) -> None:
+        """Per-claim verifications overlap instead of running one after another."""
+        import asyncio
+
+        in_flight = 0
+        peak = 0
+
+        async def verify_claim(_claim: str, _context: list[str]) -> ClaimVerdict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ClaimVerdict(verdict="SUPPORTED", evidence="")
+
+        mock_judge.extract_claims.return_value = ClaimsResult(claims=["A", "B", "C", "D"])
+        mock_judge.verify_claim = AsyncMock(side_effect=verify_claim)
+
+        result = await HallucinationEvaluator().evaluate(grounded_test_case, mock_judge)
+
+        assert peak == 4
+        assert result.score == 1.0
+
+    @pytest.mark.asyncio
+    async def test_uses_judge_multi_claim_verification(
+        self,
+        mock_judge: MagicMock,
+        grounded_test_case: RAGTestCase,
+    ) -> None:
+        """A judge that verifies all claims in one verify_claims call is used as is."""
+        mock_judge.extract_claims.return_value = ClaimsResult(claims=["A", "B"])
+        mock_judge.verify_claims = AsyncMock(
+            return_value=ClaimVerdictsResult(
+                verdicts=[
+                    ClaimVerdict(verdict="SUPPORTED", evidence=""),
+                    ClaimVerdict(verdict="CONTRADICTED", evidence=""),
+                ],
+                tokens_used=30,
+            )
+        )
+
+        result = await HallucinationEvaluator().evaluate(grounded_test_case, mock_judge)
+
+        mock_judge.verify_claims.assert_awaited_once()
+        mock_judge.verify_claim.assert_not_called()
+        assert result.score == 0.5
+
 
 # =============================================================================
 # Error Propagation Tests
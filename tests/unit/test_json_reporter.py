@@ -207,6 +207,18 @@ class TestResultsSection:
         assert doc["results"][0]["scores"]["faithfulness"] == 0.92
         assert doc["results"][0]["scores"]["relevance"] == 0.85
 
+    def test_result_scores_rounded_by_default(self) -> None:
+        """Per-result scores are rounded to 4 decimals, like the summary figures."""
+        result = _make_result(scores={"faithfulness": 2 / 3})
+        doc = _export([result])
+        assert doc["results"][0]["scores"]["faithfulness"] == 0.6667
+
+    def test_result_scores_full_precision(self) -> None:
+        """score_precision=None keeps the unrounded float."""
+        result = _make_result(scores={"faithfulness": 2 / 3})
+        doc = json.loads(JSONReporter(score_precision=None).export([result]))
+        assert doc["results"][0]["scores"]["faithfulness"] == 2 / 3
+
     def test_result_execution_time_ms(self) -> None:
         """execution_time_ms field is included."""
         result = _make_result(execution_time_ms=1234)
@@ -236,6 +248,28 @@ class TestResultsSection:
         assert isinstance(doc["results"][0]["test_case"]["context"], list)
 
 
+class TestWrite:
+    """Test streaming the report to a file."""
+
+    def test_write_matches_export(self, tmp_path) -> None:
+        """write() produces the same document as export(), apart from the timestamp."""
+        results = [
+            _make_result(id="a", scores={"faithfulness": 0.9}),
+            _make_result(id="b", name="Café ☕", status=EvalStatus.FAILED),
+        ]
+        reporter = JSONReporter(threshold=0.7)
+        path = tmp_path / "report.json"
+
+        reporter.write(results, path)
+
+        written = json.loads(path.read_text(encoding="utf-8"))
+        exported = json.loads(reporter.export(results))
+        written.pop("generated_at")
+        exported.pop("generated_at")
+        assert written == exported
+        assert "Café ☕" in path.read_text(encoding="utf-8")
+
+
 class TestEdgeCases:
     """Test edge cases and empty states."""
 
@@ -258,3 +292,19 @@ class TestEdgeCases:
         doc_high = _export([result], threshold=0.7)  # 0.65 < 0.7 → fails
         assert doc_low["summary"]["evaluators"]["faithfulness"]["passed"] == 1
         assert doc_high["summary"]["evaluators"]["faithfulness"]["passed"] == 0
+
+    def test_evaluator_stats_with_partial_coverage(self) -> None:
+        """Each metric aggregates only the results that scored it."""
+        results = [
+            _make_result(id="a", scores={"faithfulness": 0.9, "relevance": 0.5}),
+            _make_result(id="b", scores={"relevance": 0.8}),
+            _make_result(id="c", scores={"faithfulness": 0.6}),
+        ]
+        evaluators = _export(results)["summary"]["evaluators"]
+        assert list(evaluators) == ["faithfulness", "relevance"]
+        assert evaluators["faithfulness"]["passed"] == 1
+        assert evaluators["faithfulness"]["failed"] == 1
+        assert evaluators["relevance"]["passed"] == 1
+        assert evaluators["relevance"]["failed"] == 1
+        assert evaluators["faithfulness"]["avg_score"] == 0.75
+        assert evaluators["relevance"]["avg_score"] == 0.65
@@ -0,0 +1,258 @@
+"""Unit tests for JudgeCache and CachingTransport."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ragaliq.core.runner import RagaliQ
+from ragaliq.judges.base_judge import BaseJudge
+from ragaliq.judges.cache import CachingTransport, JudgeCache
+from ragaliq.judges.transport import TransportResponse
+
+
+def _response(text: str = '{"score": 0.9}') -> TransportResponse:
+    return TransportResponse(text=text, input_tokens=100, output_tokens=20, model="m")
+
+
+class TestJudgeCache:
+    """Tests for the SQLite key/value store."""
+
+    def test_miss_returns_none(self, tmp_path) -> None:
+        """An unknown key is a miss."""
+        cache = JudgeCache(tmp_path / "judge.db")
+
+        assert cache.get("missing") is None
+
+    def test_put_then_get(self, tmp_path) -> None:
+        """A stored verdict round-trips through get()."""
+        cache = JudgeCache(tmp_path / "judge.db")
+        cache.put("k", {"text": "hello", "model": "m"})
+
+        assert cache.get("k") == {"text": "hello", "model": "m"}
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path) -> None:
+        """Entries survive reopening the same database file."""
+        path = tmp_path / "nested" / "judge.db"
+        first = JudgeCache(path)
+        first.put("k", {"text": "hello", "model": "m"})
+        first.close()
+
+        assert JudgeCache(path).get("k") == {"text": "hello", "model": "m"}
+
+    def test_clear_removes_entries(self) -> None:
+        """clear() empties the table."""
+        cache = JudgeCache(":memory:")
+        cache.put("k", {"text": "x", "model": "m"})
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_expired_entry_is_a_miss(self) -> None:
+        """Entries older than ttl are ignored; fresh ones are served."""
+        cache = JudgeCache(":memory:", ttl=60)
+        cache.put("k", {"text": "x", "model": "m"})
+
+        assert cache.get("k") == {"text": "x", "model": "m"}
+        with patch("ragaliq.judges.cache.time.time", return_value=time.time() + 120):
+            assert cache.get("k") is None
+
+    def test_make_key_is_order_independent(self) -> None:
+        """Keys depend on payload content, not dict insertion order."""
+        assert JudgeCache.make_key({"a": 1, "b": 2}) == JudgeCache.make_key({"b": 2, "a": 1})
+        assert JudgeCache.make_key({"a": 1}) != JudgeCache.make_key({"a": 2})
+
+
+class TestCachingTransport:
+    """Tests for the caching transport wrapper."""
+
+    async def test_miss_delegates_and_stores(self) -> None:
+        """A first request reaches the inner transport and is cached."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response())
+        transport = CachingTransport(inner, JudgeCache(":memory:"))
+
+        response = await transport.send("sys", "user", "m")
+
+        assert response.input_tokens == 100
+        inner.send.assert_awaited_once()
+        assert len(transport.cache) == 1
+
+    async def test_hit_skips_inner_and_reports_zero_tokens(self) -> None:
+        """A repeated request is served from the cache without spending tokens."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response())
+        transport = CachingTransport(inner, JudgeCache(":memory:"))
+
+        await transport.send("sys", "user", "m")
+        cached = await transport.send("sys", "user", "m")
+
+        assert inner.send.await_count == 1
+        assert cached.text == '{"score": 0.9}'
+        assert cached.input_tokens == 0
+        assert cached.output_tokens == 0
+
+    async def test_concurrent_identical_requests_share_one_call(self) -> None:
+        """Identical requests in flight together are coalesced onto one inner call."""
+        release = asyncio.Event()
+
+        async def slow_send(*_args) -> TransportResponse:
+            await release.wait()
+            return _response()
+
+        inner = AsyncMock()
+        inner.send = AsyncMock(side_effect=slow_send)
+        transport = CachingTransport(inner, JudgeCache(":memory:"))
+
+        pending = [asyncio.create_task(transport.send("sys", "user", "m")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*pending)
+
+        assert inner.send.await_count == 1
+        assert [r.input_tokens for r in responses] == [100, 0, 0]
+        assert not transport._in_flight
+
+    async def test_coalesced_failure_propagates_and_is_not_cached(self) -> None:
+        """A failed shared call raises for every waiter and leaves nothing cached."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(side_effect=RuntimeError("boom"))
+        transport = CachingTransport(inner, JudgeCache(":memory:"))
+
+        results = await asyncio.gather(
+            transport.send("sys", "user", "m"),
+            transport.send("sys", "user", "m"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(transport.cache) == 0
+
+    async def test_sampled_requests_bypass_cache(self) -> None:
+        """Requests with temperature > 0 always reach the inner transport and are not stored."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response())
+        transport = CachingTransport(inner, JudgeCache(":memory:"))
+
+        await transport.send("sys", "user", "m", temperature=0.7)
+        await transport.send("sys", "user", "m", temperature=0.7)
+
+        assert inner.send.await_count == 2
+        assert len(transport.cache) == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"user_prompt": "other"},
+            {"model": "other-model"},
+            {"system_prompt": "other"},
+            {"max_tokens": 10},
+        ],
+    )
+    async def test_request_parameters_are_part_of_key(self, kwargs) -> None:
+        """Changing any request parameter misses the cache."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response())
+        transport = CachingTransport(inner, JudgeCache(":memory:"))
+        base = {"system_prompt": "sys", "user_prompt": "user", "model": "m"}
+
+        await transport.send(**base)
+        await transport.send(**{**base, **kwargs})
+
+        assert inner.send.await_count == 2
+
+
+class TestRunnerCacheIntegration:
+    """Tests for RagaliQ(cache_path=...)."""
+
+    def test_cache_wraps_injected_judge_transport(self, tmp_path) -> None:
+        """An injected BaseJudge gets its transport wrapped."""
+        judge = BaseJudge(transport=AsyncMock())
+        RagaliQ(judge=judge, cache_path=tmp_path / "judge.db")
+
+        assert isinstance(judge.transport, CachingTransport)
+
+    def test_no_cache_by_default(self) -> None:
+        """Without cache_path the transport is left untouched."""
+        inner = AsyncMock()
+        judge = BaseJudge(transport=inner)
+        RagaliQ(judge=judge)
+
+        assert judge.transport is inner
+
+    async def test_rerun_uses_cache(self, tmp_path, sample_test_case) -> None:
+        """A second runner over the same cache file makes no transport calls."""
+        path = tmp_path / "judge.db"
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response('{"score": 0.8, "reasoning": "ok"}'))
+
+        first = RagaliQ(judge=BaseJudge(transport=inner), evaluators=["relevance"], cache_path=path)
+        await first.evaluate_async(sample_test_case)
+        second = RagaliQ(
+            judge=BaseJudge(transport=inner), evaluators=["relevance"], cache_path=path
+        )
+        result = await second.evaluate_async(sample_test_case)
+
+        assert inner.send.await_count == 1
+        assert result.scores["relevance"] == 0.8
+        assert result.judge_tokens_used == 0
+
+    async def test_grown_context_only_judges_new_documents(self, sample_test_case) -> None:
+        """Appending a context chunk re-judges only that chunk for per-document metrics."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response('{"score": 0.8, "reasoning": "ok"}'))
+        runner = RagaliQ(
+            judge=BaseJudge(transport=inner),
+            evaluators=["context_precision"],
+            cache_path=":memory:",
+        )
+        grown = sample_test_case.model_copy(
+            update={"context": [*sample_test_case.context, "Paris hosts the Louvre."]}
+        )
+
+        await runner.evaluate_async(sample_test_case)
+        await runner.evaluate_async(grown)
+
+        assert inner.send.await_count == len(grown.context)
+
+    async def test_changed_response_only_rejudges_response_dependent_calls(
+        self, sample_test_case
+    ) -> None:
+        """Per-document context calls don't include the response, so a new response reuses them."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response('{"score": 0.8, "reasoning": "ok"}'))
+        runner = RagaliQ(
+            judge=BaseJudge(transport=inner),
+            evaluators=["context_precision", "relevance"],
+            cache_path=":memory:",
+        )
+        revised = sample_test_case.model_copy(update={"response": "It is Paris, France."})
+
+        await runner.evaluate_async(sample_test_case)
+        first_run_calls = inner.send.await_count
+        await runner.evaluate_async(revised)
+
+        assert first_run_calls == len(sample_test_case.context) + 1
+        assert inner.send.await_count == first_run_calls + 1
+
+    async def test_batch_cases_sharing_query_and_docs_judge_each_pair_once(
+        self, sample_test_case
+    ) -> None:
+        """Concurrent cases with the same query and documents share the per-document calls."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response('{"score": 0.8, "reasoning": "ok"}'))
+        runner = RagaliQ(
+            judge=BaseJudge(transport=inner),
+            evaluators=["context_precision"],
+            cache_path=":memory:",
+        )
+        cases = [
+            sample_test_case.model_copy(update={"id": f"c{i}", "response": f"Answer {i}."})
+            for i in range(4)
+        ]
+
+        await runner.evaluate_batch_async(cases)
+
+        assert inner.send.await_count == len(sample_test_case.context)
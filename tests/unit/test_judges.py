@@ -370,6 +370,45 @@ class TestLLMJudge:
         assert result.score == 0.95
         assert result.tokens_used == 80
 
+    @pytest.mark.asyncio
+    async def test_default_generate_qa_pairs_composes_question_and_answer_calls(self) -> None:
+        """Judges without a fused implementation answer each generated question in turn."""
+
+        class MockJudge(LLMJudge):
+            async def evaluate_faithfulness(
+                self, _response: str, _context: list[str]
+            ) -> JudgeResult:
+                return JudgeResult(score=1.0)
+
+            async def evaluate_relevance(self, _query: str, _response: str) -> JudgeResult:
+                return JudgeResult(score=1.0)
+
+            async def extract_claims(self, _response: str) -> ClaimsResult:
+                return ClaimsResult(claims=[])
+
+            async def verify_claim(self, _claim: str, _context: list[str]) -> ClaimVerdict:
+                return ClaimVerdict(verdict="SUPPORTED")
+
+            async def generate_questions(
+                self, _documents: list[str], _n: int
+            ) -> GeneratedQuestionsResult:
+                return GeneratedQuestionsResult(questions=["Q1?", "Q2?", "Q3?"], tokens_used=30)
+
+            async def generate_answer(
+                self,
+                question: str,
+                context: list[str],  # noqa: ARG002
+            ) -> GeneratedAnswerResult:
+                return GeneratedAnswerResult(answer=f"A to {question}", tokens_used=10)
+
+        result = await MockJudge().generate_qa_pairs(["doc"], 2)
+
+        assert [(p.question, p.answer) for p in result.pairs] == [
+            ("Q1?", "A to Q1?"),
+            ("Q2?", "A to Q2?"),
+        ]
+        assert result.tokens_used == 50
+
     def test_missing_abstract_method_faithfulness(self) -> None:
         """Test that missing evaluate_faithfulness raises TypeError."""
 
@@ -88,6 +88,12 @@ class TestRAGTestResult:
         assert result.status == EvalStatus.PASSED
         assert result.scores["faithfulness"] == 0.95
 
+    def test_test_case_kept_by_reference(self, sample_test_case):
+        """A validated test case is stored as-is, not re-validated into a copy."""
+        result = RAGTestResult(test_case=sample_test_case, status=EvalStatus.PASSED)
+
+        assert result.test_case is sample_test_case
+
     def test_create_failed_result(self, sample_test_case):
         """Test creating a failed result."""
         result = RAGTestResult(
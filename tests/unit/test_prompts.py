@@ -1,11 +1,13 @@
 """Tests for prompt template loading and formatting."""
 
 import pytest
+from pydantic import ValidationError
 
 from ragaliq.judges.prompts import (
     PromptExample,
     PromptTemplate,
     get_prompt,
+    get_system_prompt,
     list_prompts,
 )
 
@@ -62,6 +64,26 @@ class TestGetPrompt:
         assert template1.name == template2.name
         assert template1.system_prompt == template2.system_prompt
 
+    def test_get_prompt_returns_shared_instance(self) -> None:
+        """get_prompt validates once and returns the same cached template."""
+        assert get_prompt("relevance") is get_prompt("relevance")
+
+    def test_cached_template_is_frozen(self) -> None:
+        """The shared template cannot be mutated by one caller for everyone else."""
+        template = get_prompt("relevance")
+        with pytest.raises(ValidationError):
+            template.system_prompt = "changed"
+
+    def test_get_system_prompt_matches_build(self) -> None:
+        """get_system_prompt returns the same text as build_system_prompt()."""
+        for name in list_prompts():
+            assert get_system_prompt(name) == get_prompt(name).build_system_prompt()
+
+    def test_get_system_prompt_nonexistent_raises(self) -> None:
+        """get_system_prompt should raise FileNotFoundError for missing templates."""
+        with pytest.raises(FileNotFoundError):
+            get_system_prompt("nonexistent_template")
+
 
 class TestFaithfulnessTemplate:
     """Tests for the faithfulness prompt template."""
@@ -0,0 +1,149 @@
+"""Unit tests for TokenBucket and RateLimitedTransport."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ragaliq.core.runner import RagaliQ
+from ragaliq.judges.adaptive import AdaptiveTransport
+from ragaliq.judges.base_judge import BaseJudge
+from ragaliq.judges.rate_limit import RateLimitedTransport, TokenBucket
+from ragaliq.judges.transport import TransportResponse
+
+
+def _response(input_tokens: int = 10) -> TransportResponse:
+    return TransportResponse(text="ok", input_tokens=input_tokens, output_tokens=5, model="m")
+
+
+@pytest.fixture
+def frozen_clock():
+    """Freeze time.monotonic and record requested sleeps instead of sleeping."""
+    with (
+        patch("ragaliq.judges.rate_limit.time.monotonic", return_value=100.0),
+        patch("ragaliq.judges.rate_limit.asyncio.sleep", new_callable=AsyncMock) as sleep,
+    ):
+        yield sleep
+
+
+class TestTokenBucket:
+    """Tests for the continuously refilling bucket."""
+
+    async def test_burst_up_to_capacity_does_not_wait(self, frozen_clock) -> None:
+        """A full bucket serves its whole capacity immediately."""
+        bucket = TokenBucket(rate_per_minute=60)
+
+        for _ in range(60):
+            await bucket.acquire()
+
+        frozen_clock.assert_not_awaited()
+
+    async def test_shortfall_waits_for_refill(self, frozen_clock) -> None:
+        """Past capacity, each caller sleeps until its reservation refills, in order."""
+        bucket = TokenBucket(rate_per_minute=60)  # one unit per second
+        await bucket.acquire(60)
+
+        await bucket.acquire()
+        await bucket.acquire()
+
+        assert [c.args[0] for c in frozen_clock.await_args_list] == [1.0, 2.0]
+
+    async def test_oversized_amount_is_clamped_to_capacity(self, frozen_clock) -> None:
+        """A request larger than the bucket waits for a full bucket, not forever."""
+        bucket = TokenBucket(rate_per_minute=60)
+        await bucket.acquire(60)
+
+        await bucket.acquire(10_000)
+
+        frozen_clock.assert_awaited_once_with(60.0)
+
+    async def test_cancelled_waiter_returns_its_reservation(self) -> None:
+        """Cancelling a waiting acquire refunds the units it reserved."""
+        bucket = TokenBucket(rate_per_minute=60)
+        await bucket.acquire(60)
+        waiter = asyncio.create_task(bucket.acquire(30))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bucket.level > -1
+
+    def test_invalid_rate_raises(self) -> None:
+        """A non-positive rate is rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            TokenBucket(rate_per_minute=0)
+
+
+class TestRateLimitedTransport:
+    """Tests for the pacing transport wrapper."""
+
+    async def test_delegates_and_charges_reported_tokens(self, frozen_clock) -> None:
+        """The token estimate is replaced by the reported input token count."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response(input_tokens=300))
+        transport = RateLimitedTransport(inner, input_tokens_per_minute=1000)
+
+        response = await transport.send("s" * 400, "u" * 400)  # estimated 200 tokens
+
+        assert response.input_tokens == 300
+        inner.send.assert_awaited_once()
+        assert transport.input_tokens.level == 700
+        frozen_clock.assert_not_awaited()
+
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_oversized_prompt_corrected_against_clamped_charge(self) -> None:
+        """A prompt over capacity is charged capacity up front, then its full reported count."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response(input_tokens=2000))
+        transport = RateLimitedTransport(inner, input_tokens_per_minute=1000)
+
+        await transport.send("s" * 4000, "u" * 4000)  # estimated 2000 tokens, charged 1000
+
+        assert transport.input_tokens.level == -1000
+
+    @pytest.mark.usefixtures("frozen_clock")
+    async def test_failed_call_refunds_reserved_tokens(self) -> None:
+        """A call that raises reports no usage, so its token reservation is returned."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(side_effect=RuntimeError("connection reset"))
+        transport = RateLimitedTransport(inner, input_tokens_per_minute=1000)
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            await transport.send("s" * 400, "u" * 400)
+
+        assert transport.input_tokens.level == 1000
+
+    async def test_requests_paced_past_quota(self, frozen_clock) -> None:
+        """Calls beyond the per-minute request budget wait for it to refill."""
+        inner = AsyncMock()
+        inner.send = AsyncMock(return_value=_response())
+        transport = RateLimitedTransport(inner, requests_per_minute=2)
+
+        for _ in range(3):
+            await transport.send("sys", "user")
+
+        frozen_clock.assert_awaited_once_with(30.0)
+        assert transport.input_tokens is None
+
+
+class TestRunnerRateLimitIntegration:
+    """Tests for RagaliQ(requests_per_minute=..., input_tokens_per_minute=...)."""
+
+    def test_wraps_injected_judge_transport(self) -> None:
+        """Either quota installs a RateLimitedTransport with the given rates."""
+        judge = BaseJudge(transport=AsyncMock())
+        RagaliQ(judge=judge, requests_per_minute=50, input_tokens_per_minute=40_000)
+
+        assert isinstance(judge.transport, RateLimitedTransport)
+        assert judge.transport.requests.capacity == 50
+        assert judge.transport.input_tokens.capacity == 40_000
+
+    def test_adaptive_limiter_wraps_outside_rate_limit(self) -> None:
+        """Adaptive concurrency sits outside the pacing layer."""
+        judge = BaseJudge(transport=AsyncMock())
+        RagaliQ(judge=judge, requests_per_minute=50, adaptive_concurrency=True)
+
+        assert isinstance(judge.transport, AdaptiveTransport)
+        assert isinstance(judge.transport._inner, RateLimitedTransport)
@@ -1,6 +1,7 @@
 """Unit tests for RagaliQ runner instantiation, configuration, and wiring."""
 
 import os
+import sqlite3
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -272,6 +273,114 @@ class TestBoundedConcurrency:
         # Should not raise, just verify it accepts the parameter
         await runner.evaluate_batch_async([sample_test_case], max_concurrency=2)
 
+    @pytest.mark.asyncio
+    async def test_batch_initializes_once(self, sample_test_case):
+        """Batch evaluation enters the init path once, not once per test case."""
+        mock_judge = MagicMock(spec=LLMJudge)
+        mock_evaluator = MagicMock()
+        mock_evaluator.name = "test"
+        mock_evaluator.evaluate = AsyncMock(
+            return_value=MagicMock(
+                score=0.9, reasoning="", passed=True, raw_response={}, tokens_used=50
+            )
+        )
+
+        runner = RagaliQ(judge=mock_judge)
+        runner._evaluators = [mock_evaluator]
+
+        with patch.object(runner, "_ensure_initialized", AsyncMock()) as ensure:
+            results = await runner.evaluate_batch_async([sample_test_case] * 8)
+
+        ensure.assert_awaited_once()
+        assert len(results) == 8
+
+    @pytest.mark.asyncio
+    async def test_batch_holds_one_task_per_worker_not_per_case(self, sample_test_case):
+        """Live tasks stay at max_concurrency for a large batch; results keep input order."""
+        import asyncio
+
+        peak_tasks = 0
+
+        async def evaluate(tc):
+            nonlocal peak_tasks
+            await asyncio.sleep(0)
+            peak_tasks = max(peak_tasks, len(asyncio.all_tasks()))
+            return MagicMock(test_case=tc)
+
+        cases = [
+            sample_test_case.model_copy(update={"id": f"c{i}", "query": f"q{i}"})
+            for i in range(200)
+        ]
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge), max_concurrency=4)
+        with patch.object(runner, "_evaluate_case", evaluate):
+            results = await runner.evaluate_batch_async(cases)
+
+        assert [r.test_case.id for r in results] == [tc.id for tc in cases]
+        # 4 workers plus the test's own task.
+        assert peak_tasks == 5
+
+    @pytest.mark.asyncio
+    async def test_evaluators_run_concurrently_within_a_case(self, sample_test_case):
+        """A case's evaluators overlap (each waits on the other) and scores keep order."""
+        import asyncio
+
+        from ragaliq.core.evaluator import EvaluationResult
+
+        barrier = asyncio.Barrier(2)
+
+        def make_evaluator(name: str, score: float) -> MagicMock:
+            async def evaluate(*_args):
+                await barrier.wait()
+                return EvaluationResult(evaluator_name=name, score=score, passed=True)
+
+            evaluator = MagicMock()
+            evaluator.name = name
+            evaluator.evaluate = evaluate
+            return evaluator
+
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+        runner._evaluators = [make_evaluator("a", 0.9), make_evaluator("b", 0.8)]
+
+        result = await asyncio.wait_for(runner.evaluate_async(sample_test_case), timeout=1)
+
+        assert list(result.scores.items()) == [("a", 0.9), ("b", 0.8)]
+
+    @pytest.mark.asyncio
+    async def test_single_evaluator_runs_inline(self, sample_test_case):
+        """With one evaluator, no extra task is spawned for the case."""
+        import asyncio
+
+        from ragaliq.core.evaluator import EvaluationResult
+
+        tasks = []
+
+        async def evaluate(*_args):
+            tasks.append(asyncio.current_task())
+            return EvaluationResult(evaluator_name="a", score=0.9, passed=True)
+
+        evaluator = MagicMock()
+        evaluator.name = "a"
+        evaluator.evaluate = evaluate
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+        runner._evaluators = [evaluator]
+
+        result = await runner.evaluate_async(sample_test_case)
+
+        assert tasks == [asyncio.current_task()]
+        assert result.scores == {"a": 0.9}
+
+    @pytest.mark.asyncio
+    async def test_batch_init_failure_becomes_error_envelopes(self, sample_test_case):
+        """Without fail_fast, an init failure is reported per test case, not raised."""
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+
+        with patch.object(
+            runner, "_ensure_initialized", AsyncMock(side_effect=ValueError("no key"))
+        ):
+            results = await runner.evaluate_batch_async([sample_test_case] * 3)
+
+        assert [r.status for r in results] == [EvalStatus.ERROR] * 3
+
     @pytest.mark.asyncio
     async def test_max_judge_concurrency_limits_parallel_calls(self):
         """Test that max_judge_concurrency actually limits concurrent judge API calls."""
@@ -316,6 +425,526 @@ class TestBoundedConcurrency:
         # Max concurrent should be 3 (the limit), not 10
         assert max_concurrent == 3, f"Expected max 3 concurrent, got {max_concurrent}"
 
+    @pytest.mark.asyncio
+    async def test_batch_fan_out_is_capped_at_raw_request_level(self, sample_test_case):
+        """Cases x evaluators x claims never put more than max_judge_concurrency calls in flight."""
+        import asyncio
+        import json
+
+        from ragaliq.judges.base_judge import BaseJudge
+        from ragaliq.judges.transport import TransportResponse
+
+        in_flight = 0
+        peak = 0
+
+        async def send(system_prompt, user_prompt, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if "claims" in system_prompt.lower() and "extract" in system_prompt.lower():
+                text = json.dumps({"claims": ["A", "B", "C", "D"]})
+            elif "<claim>" in user_prompt:
+                text = json.dumps({"verdict": "SUPPORTED", "evidence": "e"})
+            else:
+                text = json.dumps({"score": 0.9, "reasoning": "ok"})
+            return TransportResponse(text=text, input_tokens=1, output_tokens=1, model="m")
+
+        transport = MagicMock()
+        transport.send = send
+        runner = RagaliQ(
+            judge=BaseJudge(transport=transport, max_concurrency=3),
+            evaluators=["faithfulness", "relevance"],
+            max_concurrency=5,
+        )
+        cases = [
+            sample_test_case.model_copy(update={"id": f"c{i}", "query": f"q{i}"}) for i in range(6)
+        ]
+
+        results = await runner.evaluate_batch_async(cases)
+
+        assert all(r.status == EvalStatus.PASSED for r in results)
+        assert peak == 3
+
+
+class TestBatchDeduplication:
+    """Test that repeated cases in a batch are judged once with deduplicate=True."""
+
+    @staticmethod
+    def _runner(temperature: float = 0.0, deduplicate: bool = True) -> tuple[RagaliQ, AsyncMock]:
+        from ragaliq.core.evaluator import EvaluationResult
+
+        evaluator = MagicMock()
+        evaluator.name = "relevance"
+        evaluator.evaluate = AsyncMock(
+            return_value=EvaluationResult(
+                evaluator_name="relevance", score=0.9, passed=True, tokens_used=40
+            )
+        )
+        judge = MagicMock(spec=LLMJudge)
+        judge.config = JudgeConfig(temperature=temperature)
+        runner = RagaliQ(judge=judge, deduplicate=deduplicate)
+        runner._evaluators = [evaluator]
+        return runner, evaluator.evaluate
+
+    @pytest.mark.asyncio
+    async def test_duplicates_share_one_evaluation(self, sample_test_case):
+        """Repeats keep their own test case but reuse the scores at no token cost."""
+        runner, evaluate = self._runner()
+        dup = sample_test_case.model_copy()
+        distinct = sample_test_case.model_copy(update={"response": "Lyon."})
+
+        results = await runner.evaluate_batch_async([sample_test_case, dup, distinct])
+
+        assert evaluate.await_count == 2
+        assert results[1].test_case is dup
+        assert results[1].scores == results[0].scores
+        assert [r.judge_tokens_used for r in results] == [40, 0, 40]
+        assert results[1].details is not results[0].details
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self, sample_test_case):
+        """Without deduplicate=True every case is evaluated."""
+        runner, evaluate = self._runner(deduplicate=False)
+
+        await runner.evaluate_batch_async([sample_test_case, sample_test_case])
+
+        assert evaluate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cases_with_different_ids_and_same_content_share_one_evaluation(
+        self, sample_test_case
+    ):
+        """The key is the content, so distinct dataset ids still dedupe; each keeps its id."""
+        runner, evaluate = self._runner()
+        other = sample_test_case.model_copy(
+            update={"id": "other", "name": "Other name", "tags": ["other"]}
+        )
+
+        results = await runner.evaluate_batch_async([sample_test_case, other])
+
+        assert evaluate.await_count == 1
+        assert [r.test_case.id for r in results] == [sample_test_case.id, "other"]
+        assert results[1].test_case is other
+        assert [r.judge_tokens_used for r in results] == [40, 0]
+
+    @pytest.mark.asyncio
+    async def test_expected_fields_are_part_of_the_key(self, sample_test_case):
+        """Ground-truth fields are scored by evaluators, so cases differing there are judged."""
+        runner, evaluate = self._runner()
+        other_facts = sample_test_case.model_copy(update={"id": "b", "expected_facts": ["x"]})
+        other_answer = sample_test_case.model_copy(update={"id": "c", "expected_answer": "x"})
+
+        await runner.evaluate_batch_async([sample_test_case, other_facts, other_answer])
+
+        assert evaluate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_repeats_of_an_error_are_evaluated(self, sample_test_case):
+        """An ERROR result is not copied; each repeat gets its own attempt."""
+        from ragaliq.core.evaluator import EvaluationResult
+
+        runner, evaluate = self._runner()
+        evaluate.side_effect = [
+            RuntimeError("overloaded"),
+            EvaluationResult(evaluator_name="relevance", score=0.9, passed=True, tokens_used=40),
+        ]
+
+        results = await runner.evaluate_batch_async([sample_test_case, sample_test_case])
+
+        assert evaluate.await_count == 2
+        assert [r.status for r in results] == [EvalStatus.ERROR, EvalStatus.PASSED]
+        assert results[1].judge_tokens_used == 40
+
+    @pytest.mark.asyncio
+    async def test_on_result_sees_every_result_including_duplicates(self, sample_test_case):
+        """The progress callback fires once per input case."""
+        runner, _ = self._runner()
+        dup = sample_test_case.model_copy()
+        seen = []
+
+        results = await runner.evaluate_batch_async([sample_test_case, dup], on_result=seen.append)
+
+        assert len(seen) == 2
+        assert {id(r) for r in seen} == {id(r) for r in results}
+
+    @pytest.mark.asyncio
+    async def test_expectations_are_part_of_the_key(self, sample_test_case):
+        """Cases differing only in expected facts are judged separately."""
+        runner, evaluate = self._runner()
+        other = sample_test_case.model_copy(update={"expected_facts": ["Paris is in France"]})
+
+        await runner.evaluate_batch_async([sample_test_case, other])
+
+        assert evaluate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sampling_judge_evaluates_every_case(self, sample_test_case):
+        """With temperature > 0 each repeat is an independent sample."""
+        runner, evaluate = self._runner(temperature=0.7)
+
+        await runner.evaluate_batch_async([sample_test_case, sample_test_case])
+
+        assert evaluate.await_count == 2
+
+
+class TestSyncLoopReuse:
+    """Test that sync wrappers reuse one cached event loop."""
+
+    @staticmethod
+    def _loop_recording_runner() -> tuple[RagaliQ, list]:
+        import asyncio
+
+        loops: list = []
+
+        async def record(_test_case):
+            loops.append(asyncio.get_running_loop())
+            return MagicMock()
+
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+        runner.evaluate_async = record  # type: ignore[method-assign]
+        return runner, loops
+
+    def test_repeated_sync_calls_share_one_loop(self, sample_test_case):
+        """evaluate() runs every call on the same cached loop."""
+        runner, loops = self._loop_recording_runner()
+
+        runner.evaluate(sample_test_case)
+        runner.evaluate(sample_test_case)
+
+        assert loops[0] is loops[1]
+        assert not loops[0].is_closed()
+        runner.close()
+        assert loops[0].is_closed()
+
+    def test_close_is_idempotent_and_loop_recreated(self, sample_test_case):
+        """After close(), the next sync call gets a fresh loop."""
+        runner, loops = self._loop_recording_runner()
+
+        runner.evaluate(sample_test_case)
+        runner.close()
+        runner.close()
+        runner.evaluate(sample_test_case)
+
+        assert loops[0] is not loops[1]
+        runner.close()
+
+    def test_concurrent_thread_falls_back_to_own_loop(self, sample_test_case):
+        """A sync call made while another thread holds the cached loop uses its own loop."""
+        import asyncio
+        import threading
+
+        loops: list = []
+        entered = threading.Event()
+        release = threading.Event()
+
+        async def record(test_case):
+            loops.append(asyncio.get_running_loop())
+            if test_case.id == "blocking":
+                entered.set()
+                await asyncio.to_thread(release.wait, 5)
+            return MagicMock()
+
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+        runner.evaluate_async = record  # type: ignore[method-assign]
+        blocking_case = sample_test_case.model_copy(update={"id": "blocking"})
+        worker = threading.Thread(target=runner.evaluate, args=(blocking_case,))
+        worker.start()
+        assert entered.wait(timeout=5)
+
+        runner.evaluate(sample_test_case)
+        release.set()
+        worker.join(timeout=5)
+
+        assert loops[0] is not loops[1]
+        runner.close()
+
+
+class TestShardedBatch:
+    """Test num_loops sharding of evaluate_batch across threads."""
+
+    def test_shards_run_on_separate_loops_and_keep_order(self, sample_test_case):
+        """Each shard gets its own loop and judge; results come back in input order."""
+        import asyncio
+
+        loops: set = set()
+        judges: list = []
+
+        def make_judge(**_kwargs):
+            judge = MagicMock(spec=LLMJudge)
+            judge.aclose = AsyncMock()
+            judges.append(judge)
+            return judge
+
+        async def fake_evaluate(_self, tc):
+            loops.add(asyncio.get_running_loop())
+            return MagicMock(test_case=tc)
+
+        cases = [
+            sample_test_case.model_copy(update={"id": f"c{i}", "query": f"q{i}"}) for i in range(5)
+        ]
+        runner = RagaliQ(num_loops=2, max_judge_concurrency=20, requests_per_minute=100)
+        with (
+            patch("ragaliq.judges.claude.ClaudeJudge", side_effect=make_judge) as judge_cls,
+            patch.object(RagaliQ, "_evaluate_case", fake_evaluate),
+            patch.object(RagaliQ, "_init_evaluators"),
+        ):
+            results = runner.evaluate_batch(cases)
+
+        assert [r.test_case.id for r in results] == [tc.id for tc in cases]
+        assert len(loops) == 2
+        assert judge_cls.call_count == 2
+        assert judge_cls.call_args.kwargs["max_concurrency"] == 10
+        assert all(j.aclose.await_count == 1 for j in judges)
+
+    def test_shard_limits_are_split(self):
+        """Shard runners share the configured caps and quotas between them."""
+        runner = RagaliQ(max_concurrency=5, requests_per_minute=90, cache_path=":memory:")
+
+        shard = runner._shard_runner(3)
+
+        assert shard.max_concurrency == 2
+        assert shard.requests_per_minute == 30
+        assert shard.input_tokens_per_minute is None
+        assert shard.cache_path == ":memory:"
+
+    def test_shard_caps_sum_to_the_global_cap(self):
+        """Remainders go to the first shards instead of rounding every shard up."""
+        runner = RagaliQ(max_concurrency=5, max_judge_concurrency=20)
+
+        shards = [runner._shard_runner(3, i) for i in range(3)]
+
+        assert [s.max_judge_concurrency for s in shards] == [7, 7, 6]
+        assert [s.max_concurrency for s in shards] == [2, 2, 1]
+
+    def test_no_more_shards_than_the_concurrency_cap(self, sample_test_case):
+        """With max_concurrency=2, four loops would force a cap of at least 1 each."""
+        cases = [sample_test_case.model_copy(update={"id": f"c{i}"}) for i in range(8)]
+        runner = RagaliQ(num_loops=4, max_concurrency=2)
+        built: list[int] = []
+
+        def shard_runner(num_shards, *_args):
+            shard = MagicMock()
+            shard._evaluate_and_close = AsyncMock(return_value=[])
+            built.append(num_shards)
+            return shard
+
+        with patch.object(runner, "_shard_runner", side_effect=shard_runner):
+            runner.evaluate_batch(cases)
+
+        assert built == [2, 2]
+
+    def test_shards_share_one_cache_and_close_it(self, sample_test_case):
+        """Every shard uses the same JudgeCache, which is closed once the batch is done."""
+        cases = [sample_test_case.model_copy(update={"id": f"c{i}"}) for i in range(4)]
+        runner = RagaliQ(num_loops=2, cache_path=":memory:")
+        caches = []
+
+        async def evaluate_and_close(shard_self, shard_cases):
+            caches.append(shard_self._judge_cache)
+            return [MagicMock(test_case=tc) for tc in shard_cases]
+
+        with patch.object(RagaliQ, "_evaluate_and_close", evaluate_and_close):
+            runner.evaluate_batch(cases)
+
+        assert len(caches) == 2
+        assert caches[0] is caches[1] is not None
+        with pytest.raises(sqlite3.ProgrammingError):
+            len(caches[0])
+
+    def test_injected_judge_runs_on_one_loop(self, sample_test_case, caplog):
+        """A caller-supplied judge can't be shared across loops, so sharding is skipped."""
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge), num_loops=4)
+        runner.evaluate_batch_async = AsyncMock(return_value=[])  # type: ignore[method-assign]
+
+        runner.evaluate_batch([sample_test_case, sample_test_case])
+
+        runner.evaluate_batch_async.assert_awaited_once()
+        assert "num_loops ignored" in caplog.text
+        runner.close()
+
+
+class TestJudgeClientLifecycle:
+    """Test that aclose() releases only judges the runner created."""
+
+    async def test_aclose_closes_owned_judge(self):
+        """A lazily created judge is closed and dropped, then recreated on demand."""
+        runner = RagaliQ()
+        owned = MagicMock(spec=LLMJudge)
+        owned.aclose = AsyncMock()
+        runner._judge = owned
+
+        await runner.aclose()
+        await runner.aclose()
+
+        owned.aclose.assert_awaited_once()
+        assert runner._judge is None
+
+    async def test_aclose_leaves_injected_judge_open(self):
+        """A caller-supplied judge belongs to the caller and is not closed."""
+        judge = MagicMock(spec=LLMJudge)
+        judge.aclose = AsyncMock()
+        runner = RagaliQ(judge=judge)
+
+        await runner.aclose()
+
+        judge.aclose.assert_not_awaited()
+        assert runner._judge is judge
+
+    async def test_aclose_closes_cache_it_opened(self):
+        """The SQLite connection opened for a runner-created judge is closed with it."""
+        from ragaliq.judges.base_judge import BaseJudge
+
+        runner = RagaliQ(cache_path=":memory:")
+        with patch(
+            "ragaliq.judges.claude.ClaudeJudge",
+            side_effect=lambda **_kwargs: BaseJudge(transport=AsyncMock()),
+        ):
+            runner._init_judge()
+        cache = runner._judge_cache
+
+        await runner.aclose()
+
+        assert runner._judge_cache is None
+        with pytest.raises(sqlite3.ProgrammingError):
+            len(cache)
+
+    async def test_recreated_judge_is_published_after_its_middleware(self):
+        """After aclose() the evaluators stay set, so the judge must not appear unwrapped."""
+        from ragaliq.judges.base_judge import BaseJudge
+        from ragaliq.judges.cache import CachingTransport
+
+        runner = RagaliQ(cache_path=":memory:")
+        runner._evaluators = [MagicMock()]
+        seen_during_attach = []
+        attach = runner._attach_middleware
+
+        def record_then_attach(judge):
+            seen_during_attach.append(runner._judge)
+            attach(judge)
+
+        with (
+            patch.object(runner, "_attach_middleware", side_effect=record_then_attach),
+            patch(
+                "ragaliq.judges.claude.ClaudeJudge",
+                side_effect=lambda **_kwargs: BaseJudge(transport=AsyncMock()),
+            ),
+        ):
+            runner._init_judge()
+
+        assert seen_during_attach == [None]
+        assert isinstance(runner._judge.transport, CachingTransport)
+        await runner.aclose()
+
+    async def test_shard_aclose_leaves_shared_cache_open(self):
+        """A cache handed to a shard runner is closed by the parent, not the shard."""
+        from ragaliq.judges.cache import JudgeCache
+
+        cache = JudgeCache(":memory:")
+        shard = RagaliQ(cache_path=":memory:")._shard_runner(2, 0, cache)
+        shard._judge = MagicMock(spec=LLMJudge)
+
+        await shard.aclose()
+
+        assert len(cache) == 0
+        cache.close()
+
+
+class TestRawResponseRetention:
+    """Test keep_raw_responses gating of raw judge payloads in details."""
+
+    @staticmethod
+    def _runner(**kwargs) -> RagaliQ:
+        from ragaliq.core.evaluator import EvaluationResult
+
+        evaluator = MagicMock()
+        evaluator.name = "test"
+        evaluator.evaluate = AsyncMock(
+            return_value=EvaluationResult(
+                evaluator_name="test",
+                score=0.9,
+                passed=True,
+                reasoning="ok",
+                raw_response={"claims": ["a", "b"]},
+            )
+        )
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge), **kwargs)
+        runner._evaluators = [evaluator]
+        return runner
+
+    @pytest.mark.asyncio
+    async def test_raw_kept_by_default(self, sample_test_case):
+        """Library default keeps the raw payload."""
+        result = await self._runner().evaluate_async(sample_test_case)
+
+        assert result.details["test"]["raw"] == {"claims": ["a", "b"]}
+
+    @pytest.mark.asyncio
+    async def test_raw_dropped_when_disabled(self, sample_test_case):
+        """keep_raw_responses=False empties raw but keeps score and reasoning."""
+        result = await self._runner(keep_raw_responses=False).evaluate_async(sample_test_case)
+
+        assert result.details["test"] == {"reasoning": "ok", "passed": True, "raw": {}}
+        assert result.scores["test"] == 0.9
+
+
+class TestStreamEvaluation:
+    """Test evaluate_stream_async bounded, lazy evaluation."""
+
+    @staticmethod
+    def _runner_with_scores() -> RagaliQ:
+        from ragaliq.core.evaluator import EvaluationResult
+
+        evaluator = MagicMock()
+        evaluator.name = "test"
+        evaluator.evaluate = AsyncMock(
+            return_value=EvaluationResult(evaluator_name="test", score=0.9, passed=True)
+        )
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge), max_concurrency=2)
+        runner._evaluators = [evaluator]
+        return runner
+
+    @pytest.mark.asyncio
+    async def test_yields_one_result_per_case(self, sample_test_case):
+        """Every case from a sync iterable produces exactly one result."""
+        runner = self._runner_with_scores()
+        cases = [sample_test_case.model_copy(update={"id": f"tc_{i}"}) for i in range(5)]
+
+        results = [r async for r in runner.evaluate_stream_async(iter(cases))]
+
+        assert sorted(r.test_case.id for r in results) == [f"tc_{i}" for i in range(5)]
+        assert all(r.status == EvalStatus.PASSED for r in results)
+
+    @pytest.mark.asyncio
+    async def test_pulls_source_lazily(self, sample_test_case):
+        """No more than max_concurrency cases are drawn ahead of consumed results."""
+        runner = self._runner_with_scores()
+        pulled = 0
+
+        async def source():
+            nonlocal pulled
+            for i in range(10):
+                pulled += 1
+                yield sample_test_case.model_copy(update={"id": f"tc_{i}"})
+
+        stream = runner.evaluate_stream_async(source())
+        await anext(stream)
+        await stream.aclose()
+
+        assert pulled <= 3
+
+    @pytest.mark.asyncio
+    async def test_failures_become_error_envelopes(self, sample_test_case):
+        """Without fail_fast, a failing case yields an ERROR result."""
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+        runner._evaluators = []
+        with patch.object(runner, "_evaluate_case", AsyncMock(side_effect=RuntimeError("boom"))):
+            results = [r async for r in runner.evaluate_stream_async([sample_test_case])]
+
+        assert results[0].status == EvalStatus.ERROR
+        assert "boom" in results[0].details["error"]
+
 
 class TestErrorEnvelopes:
     """Test that evaluator failures are gracefully handled with error envelopes."""
@@ -671,3 +1300,21 @@ class TestAsyncInitSafety:
 
             # Judge should be created exactly once despite 3 calls across 3 event loops
             assert judge_creation_count == 1
+
+    @pytest.mark.asyncio
+    async def test_initialized_runner_skips_init_lock(self, sample_test_case):
+        """After initialization, evaluate_async no longer takes the init lock."""
+        mock_evaluator = MagicMock()
+        mock_evaluator.name = "test"
+        mock_evaluator.evaluate = AsyncMock(
+            return_value=MagicMock(
+                score=0.9, reasoning="", passed=True, raw_response={}, tokens_used=50
+            )
+        )
+        runner = RagaliQ(judge=MagicMock(spec=LLMJudge))
+        runner._evaluators = [mock_evaluator]
+        runner._init_lock = MagicMock()
+
+        await runner.evaluate_async(sample_test_case)
+
+        runner._init_lock.__enter__.assert_not_called()
@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from anthropic import APIConnectionError, APIStatusError
+from anthropic.types import Usage
 
 from ragaliq.judges.base import JudgeAPIError
 from ragaliq.judges.transport import ClaudeTransport
@@ -27,15 +28,14 @@ def _make_success_response():
     """Build a mock Anthropic Message with valid content."""
     response = MagicMock()
     response.content = [MagicMock(type="text", text="response text")]
-    response.usage.input_tokens = 40
-    response.usage.output_tokens = 20
+    response.usage = Usage(input_tokens=40, output_tokens=20)
     return response
 
 
 @pytest.fixture
 def mock_client():
     """Patch AsyncAnthropic and return the mock client instance."""
-    with patch("ragaliq.judges.transport.AsyncAnthropic") as mock_cls:
+    with patch("anthropic.AsyncAnthropic") as mock_cls:
         client = MagicMock()
         mock_cls.return_value = client
         yield client
@@ -72,6 +72,29 @@ class TestRetryOn429:
         assert result.text == "response text"
         assert mock_client.messages.create.call_count == 2
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [429, 529])
+    async def test_overload_not_retried_when_disabled(self, mock_client, status_code):
+        """With retry_overloaded=False an outer layer owns overload retries."""
+        mock_client.messages.create = AsyncMock(side_effect=_make_api_status_error(status_code))
+        transport = ClaudeTransport(api_key="test", retry_overloaded=False)
+
+        with pytest.raises(JudgeAPIError) as exc_info:
+            await transport.send("system", "user")
+
+        assert exc_info.value.status_code == status_code
+        assert mock_client.messages.create.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_other_5xx_still_retried_when_overload_retries_disabled(self, mock_client):
+        mock_client.messages.create = AsyncMock(side_effect=_make_api_status_error(500))
+        transport = ClaudeTransport(api_key="test", retry_overloaded=False)
+
+        with pytest.raises(JudgeAPIError):
+            await transport.send("system", "user")
+
+        assert mock_client.messages.create.call_count == 3
+
 
 class TestRetryOn5xx:
     """5xx Server errors must trigger retries."""
@@ -272,8 +295,7 @@ class TestTransportResponseMapping:
             MagicMock(type="thinking"),
             MagicMock(type="text", text='{"score": 1.0, "reasoning": "ok"}'),
         ]
-        response.usage.input_tokens = 40
-        response.usage.output_tokens = 20
+        response.usage = Usage(input_tokens=40, output_tokens=20)
         mock_client.messages.create = AsyncMock(return_value=response)
         transport = ClaudeTransport(api_key="test")
 